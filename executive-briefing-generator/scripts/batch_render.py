@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Batch Briefing Renderer
+Renders every assessment in a JSONL manifest across a pool of warm worker processes.
+
+Manifest lines look like:
+    {"id": "chesapeake", "content": "../content/chesapeake_regional.json"}
+    {"id": "acme", "content": {...inline content document...}, "output": "acme.pdf"}
+    {"id": "bayview", "values": {...customer values...}, "template": "briefing_template.json"}
+
+"values" (inline or a path) are bound into "template" (default
+content/briefing_template.json; see briefing/template.py). Relative paths are resolved
+against the manifest's directory. Each worker imports ReportLab, builds create_styles()
+once and compiles each template the first time a job uses it, then renders documents
+until the batch ends. With --pdf-cache, documents rendered before (by any batch, the
+render server or generate_briefing.py --pdf-cache) are copied from the content-addressed
+cache instead; cached renders are deterministic.
+
+With --peer-history, each entry also carries the customer's "assessment" (inline or a
+path: scores, org_size, state, ehr_vendor). The whole batch is compared against the
+assessment history in one vectorized pass (briefing/peer_benchmark.py) before any job
+is handed out, and each executive summary opens with that customer's peer stats.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from briefing import worker  # Per-worker styles and caches, built by worker.init_worker
+
+_templates = {}  # Template path -> CompiledTemplate, compiled once per process
+
+def job_content(job):
+    """Content document for a manifest job: loaded, inline, or bound from values into a template"""
+    from briefing.content import load_content, validate_content
+    if 'values' not in job:
+        content = job['content']
+        return validate_content(load_content(content) if isinstance(content, str) else content)
+    from briefing.template import compile_template
+    template = _templates.get(job['template'])
+    if template is None:
+        template = _templates[job['template']] = compile_template(load_content(job['template']))
+    values = job['values']
+    return template.bind(load_content(values) if isinstance(values, str) else values)
+
+def _render_job(job):
+    from briefing.document import build_pdf, render_bytes
+    from briefing.markup_cache import markup_stats
+    from briefing.pdf_cache import render_key
+    from briefing.style_registry import style_stats
+    styles_before = style_stats()['created']
+    parsed_before = markup_stats()['misses']
+    start = time.perf_counter()
+    cached = False
+    try:
+        content = job_content(job)
+        if 'peer_stats' in job:
+            from briefing.peer_benchmark import with_peer_stats
+            content = with_peer_stats(content, job['peer_stats'])
+        if worker.pdf_cache is None:
+            build_pdf(job['output'], content, worker.styles, worker.section_cache)
+        else:
+            pdf, cached = worker.pdf_cache.fetch(render_key(content, section_cache=worker.section_cache is not None),
+                lambda: render_bytes(content, worker.styles, worker.section_cache, deterministic=True))
+            with open(job['output'], 'wb') as f:
+                f.write(pdf)
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    return {'id': job['id'], 'output': job['output'], 'seconds': time.perf_counter() - start,
+            'styles_created': style_stats()['created'] - styles_before,
+            'markup_parsed': markup_stats()['misses'] - parsed_before, 'cached': cached, 'error': error}
+
+def read_manifest(path, output_dir):
+    """Yield render jobs from a JSONL manifest"""
+    from briefing.template import DEFAULT_TEMPLATE
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path, encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            job_id = str(entry.get('id', line_no))
+            output = entry.get('output') or f"Executive_Briefing_{job_id}.pdf"
+            job = {'id': job_id, 'output': os.path.join(output_dir, output)}
+            if 'values' in entry:
+                values = entry['values']
+                job['values'] = os.path.join(base, values) if isinstance(values, str) else values
+                job['template'] = os.path.join(base, entry['template']) if 'template' in entry else DEFAULT_TEMPLATE
+            else:
+                content = entry['content']
+                job['content'] = os.path.join(base, content) if isinstance(content, str) else content
+            if 'assessment' in entry:
+                assessment = entry['assessment']
+                job['assessment'] = os.path.join(base, assessment) if isinstance(assessment, str) else assessment
+            yield job
+
+def run_batch(jobs, workers=None, section_cache_dir=None, pdf_cache_dir=None):
+    """Render jobs on a preloaded process pool; returns one result dict per job"""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=worker.init_worker,
+                             initargs=(section_cache_dir, pdf_cache_dir)) as pool:
+        futures = [pool.submit(_render_job, job) for job in jobs]
+        for future in as_completed(futures):
+            results.append(future.result())
+    return results
+
+def add_peer_stats(jobs, benchmarks):
+    """Give every job the stat items placing its assessment among its peers in benchmarks"""
+    from briefing.content import load_content
+    missing = [job['id'] for job in jobs if 'assessment' not in job]
+    if missing:
+        raise ValueError(f"no assessment for {', '.join(missing[:5])}{' ...' if len(missing) > 5 else ''}")
+    assessments = [load_content(job['assessment']) if isinstance(job['assessment'], str) else job['assessment']
+                   for job in jobs]
+    comparison = benchmarks.compare(assessments)
+    for i, job in enumerate(jobs):
+        job['peer_stats'] = comparison.stat_items(i)
+    return comparison
+
+def summarize(results, wall_seconds):
+    """Aggregate latency and throughput figures for a finished batch"""
+    from briefing.job_queue import percentile
+    latencies = sorted(r['seconds'] for r in results if not r['error'])
+    summary = {
+        'documents': len(results),
+        'failed': sum(1 for r in results if r['error']),
+        'wall_seconds': round(wall_seconds, 3),
+        'docs_per_second': round(len(latencies) / wall_seconds, 2) if wall_seconds else 0.0,
+        'markup_parsed': sum(r.get('markup_parsed', 0) for r in results),
+        'cached': sum(1 for r in results if r.get('cached')),
+    }
+    if latencies:
+        summary.update({
+            'latency_p50_ms': round(percentile(latencies, 50) * 1000, 1),
+            'latency_p95_ms': round(percentile(latencies, 95) * 1000, 1),
+            'latency_max_ms': round(latencies[-1] * 1000, 1),
+        })
+    return summary
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a JSONL manifest of briefings on a process pool")
+    parser.add_argument('manifest', help="JSONL file, one assessment per line")
+    parser.add_argument('--output-dir', default='.', help="directory for PDFs without an explicit output")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--report', help="also write per-document results and the summary as JSON")
+    parser.add_argument('--section-cache', help="directory for pre-rendered static sections")
+    parser.add_argument('--pdf-cache', help="content-addressed PDF cache: copy briefings rendered before")
+    parser.add_argument('--peer-history',
+        help="assessment history (.npz, CSV or JSONL): add peer benchmark stats from each entry's assessment")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    jobs = list(read_manifest(args.manifest, args.output_dir))
+    if args.peer_history:
+        from briefing.peer_benchmark import PeerBenchmarks
+        try:
+            start = time.perf_counter()
+            benchmarks = PeerBenchmarks.load(args.peer_history)
+            loaded = time.perf_counter()
+            add_peer_stats(jobs, benchmarks)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"Peer benchmarks: {len(benchmarks):,} assessments loaded in {(loaded - start) * 1000:.0f} ms, "
+              f"{len(jobs)} briefings compared in {(time.perf_counter() - loaded) * 1000:.0f} ms")
+    start = time.perf_counter()
+    results = run_batch(jobs, args.workers, args.section_cache, args.pdf_cache)
+    summary = summarize(results, time.perf_counter() - start)
+
+    for r in sorted(results, key=lambda r: r['id']):
+        status = f"❌ {r['error']}" if r['error'] else r['output'] + (" (cached)" if r['cached'] else "")
+        print(f"{r['id']:<24} {r['seconds'] * 1000:8.1f} ms  {status}")
+    print(f"✅ {summary['documents'] - summary['failed']}/{summary['documents']} briefings in "
+          f"{summary['wall_seconds']}s ({summary['docs_per_second']} docs/s, "
+          f"p50 {summary.get('latency_p50_ms', '-')} ms, p95 {summary.get('latency_p95_ms', '-')} ms)")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({'summary': summary, 'documents': results}, f, indent=2)
+    return 1 if summary['failed'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
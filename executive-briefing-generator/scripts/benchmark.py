@@ -0,0 +1,705 @@
+#!/usr/bin/env python3
+"""
+Render Benchmarks
+Times the three generators and checks them against stored JSON baselines.
+
+For each document it measures:
+  cold_ms              fresh interpreter: startup + imports + one render (subprocess, best of 3)
+  peak_rss_kb          peak resident set size of a cold process
+  warm_ms              fastest of --repeat in-process renders after a warm-up render
+  layout_ms/write_ms   warm render split at Canvas.save() (layout vs. PDF serialization)
+  tracemalloc_peak_kb  peak Python heap allocated during one warm render
+  bytes                size of the produced PDF
+
+Timings take the fastest run rather than the median: on a shared machine noise only
+ever adds time, so the minimum is the most repeatable number to compare against.
+
+--startup instead imports each entry point in a fresh interpreter under
+`python -X importtime` and fails if one takes longer than its budget in
+benchmarks/startup_budgets.json (ms, fastest of 5) or imports ReportLab at all:
+--help, --validate and argument errors must never pay for the PDF stack.
+
+--bind instead compiles content/briefing_template.json once and binds per-customer
+values for a batch of 10k documents: compile cost, bind cost per document, and the same
+batch substituted by re-scanning the template text each time for comparison. It fails
+if binding the Chesapeake values doesn't reproduce content/chesapeake_regional.json
+exactly or a bind costs more than BIND_BUDGET_US.
+
+--determinism instead renders each document with deterministic=True in two fresh
+interpreters and fails unless the bytes are identical, then times a content-addressed
+PDF cache hit (briefing/pdf_cache.py) against the render it replaces.
+
+--html instead times the HTML preview (briefing/html_preview.py) of the showcase
+briefing: imports plus first render in a fresh interpreter, and the fastest warm
+render. It fails over HTML_BUDGET_MS or if the preview imports ReportLab.
+
+--thumbnails instead times PNG thumbnails of pages 1-2 (briefing/thumbnail.py) of the
+briefing and the product book against a full warm render of the same document, and a
+thumbnail cache hit. Rasterizing the finished PDF would cost the full render and then
+some; thumbnails must come in well under it (THUMBNAIL_BUDGET, per document) and a
+cache hit under THUMBNAIL_HIT_BUDGET_MS.
+
+--page-range instead renders each section of the showcase briefing on its own with
+render_pages and fails unless every page it writes has the same drawing operators as
+that page of the full render; then times the action plan's pages against the full
+render: laid out from scratch, and after an edit to the action plan with an
+IncrementalLayout record of the full render replaying the sections before it.
+
+--peer-benchmarks instead builds a synthetic history of 100k assessment scores
+(briefing/peer_benchmark.py) and compares a batch of 5k briefings against it: cohort
+percentiles, means and quartiles, then the stat boxes. It fails unless a sample of
+briefings matches the same figures computed one briefing at a time by masking the
+history to its cohort, or if the batch takes more than PEER_BUDGET_MS.
+
+--parallel instead renders the showcase briefing with and without a synthetic
+inventory appendix of PARALLEL_ROWS rows, serially and with render_parallel on a warm
+pool of one worker per core, and reports the speedup. It fails unless every page of
+the merged PDF has the same drawing operators as that page of the serial render, or,
+given more than one core, if the parallel render of the appendix is no faster.
+
+--table-scaling instead renders inventory tables (create_inventory_table) of 1k to 10k
+rows and fails if the per-row cost at the largest size exceeds the smallest by more
+than --tolerance, i.e. if layout stops scaling linearly.
+
+Run with --update to (re)write the baselines. Without it, any metric that exceeds its
+baseline by more than --tolerance (default 25%) is reported and the exit status is 1.
+--update and the checks above are mutually exclusive; --json writes the figures of
+whichever one ran.
+"""
+
+import argparse
+import importlib
+import io
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(SCRIPTS_DIR, '..', 'benchmarks', 'baselines.json')
+STARTUP_BUDGET_PATH = os.path.join(SCRIPTS_DIR, '..', 'benchmarks', 'startup_budgets.json')
+BIND_BUDGET_US = 250  # Per document; a warm render is ~100 ms
+HTML_BUDGET_MS = {'first': 60, 'warm': 5}  # Preview: imports + first render, and warm
+# Pages 1-2 as PNG vs the full PDF; the product book has six pages, and laying out its
+# first two alone costs a third of its render
+THUMBNAIL_BUDGET = {'briefing': 0.5, 'product_book': 0.65}
+THUMBNAIL_HIT_BUDGET_MS = 10
+PEER_BUDGET_MS = 1000  # Peer stats for a batch of 5k briefings, compared and formatted
+PARALLEL_ROWS = 5000  # Inventory rows in the parallel render benchmark
+
+# name -> (module, expression rendering the document to bytes)
+DOCUMENTS = {
+    'briefing': ('briefing.document', 'render_bytes()'),
+    'sample': ('briefing.sample', 'stamp_sample(document.render_bytes(), io.BytesIO())'),
+    'product_book': ('briefing.product_book', 'render_bytes()'),
+}
+
+# Metrics compared against the baseline; all are "lower is better"
+CHECKED_METRICS = ('cold_ms', 'warm_ms', 'peak_rss_kb', 'tracemalloc_peak_kb', 'bytes')
+
+def _render_fn(name):
+    module_name, _ = DOCUMENTS[name]
+    module = importlib.import_module(module_name)
+    if name == 'sample':
+        from briefing import document
+        def render():
+            out = io.BytesIO()
+            module.stamp_sample(document.render_bytes(), out)
+            return out.getvalue()
+        return render
+    return module.render_bytes
+
+def measure_cold(name):
+    """Wall time and peak RSS of a fresh interpreter rendering one document"""
+    module_name, expr = DOCUMENTS[name]
+    code = (f"import io, sys; sys.path.insert(0, {SCRIPTS_DIR!r}); "
+            f"from briefing import document; from {module_name} import *; {expr}")
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, '-c', code], stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode:
+        raise RuntimeError(f"cold render of {name} exited with {proc.returncode}")
+    rss_kb = usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss
+    return elapsed * 1000, rss_kb
+
+def measure_warm(name, repeat):
+    """Fastest warm render time, split into layout and Canvas.save() (write) phases"""
+    from reportlab.pdfgen.canvas import Canvas
+
+    render = _render_fn(name)
+    render()  # Warm-up: imports, font metrics, interned styles
+    save_seconds = []
+    original_save = Canvas.save
+
+    def timed_save(canvas):
+        start = time.perf_counter()
+        original_save(canvas)
+        save_seconds.append(time.perf_counter() - start)
+
+    totals, writes = [], []
+    Canvas.save = timed_save
+    try:
+        for _ in range(repeat):
+            del save_seconds[:]
+            start = time.perf_counter()
+            pdf = render()
+            totals.append(time.perf_counter() - start)
+            writes.append(sum(save_seconds))
+    finally:
+        Canvas.save = original_save
+
+    tracemalloc.start()
+    render()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    fastest = min(range(repeat), key=totals.__getitem__)
+    total, write = totals[fastest], writes[fastest]
+    return {
+        'warm_ms': round(total * 1000, 2),
+        'layout_ms': round((total - write) * 1000, 2),
+        'write_ms': round(write * 1000, 2),
+        'tracemalloc_peak_kb': peak // 1024,
+        'bytes': len(pdf),
+    }
+
+def run(names, repeat, cold_runs=3):
+    results = {}
+    # Cold runs first: a forked child's peak RSS counts the parent's memory from before
+    # exec, so the parent must not have rendered anything yet
+    for name in names:
+        cold = [measure_cold(name) for _ in range(cold_runs)]
+        results[name] = {
+            'cold_ms': round(min(ms for ms, _ in cold), 2),
+            'peak_rss_kb': max(rss for _, rss in cold),
+        }
+    for name in names:
+        results[name].update(measure_warm(name, repeat))
+    return results
+
+def compare(results, baselines, tolerance):
+    """List of human-readable regressions beyond tolerance"""
+    regressions = []
+    for name, metrics in results.items():
+        baseline = baselines.get(name)
+        if not baseline:
+            continue
+        for metric in CHECKED_METRICS:
+            old, new = baseline.get(metric), metrics.get(metric)
+            if old and new is not None and new > old * (1 + tolerance):
+                regressions.append(f"{name}.{metric}: {new} vs baseline {old} "
+                                   f"(+{(new / old - 1) * 100:.0f}%, limit +{tolerance * 100:.0f}%)")
+    return regressions
+
+def _importtime(code):
+    """{module: cumulative microseconds} for top-level imports of one `python -X importtime -c code`"""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=SCRIPTS_DIR,
+        capture_output=True, text=True, check=True)
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            modules[name[1:].rstrip()] = int(cumulative)  # Nesting is shown by extra indent
+    return modules
+
+def import_cost(module, runs=5):
+    """Fastest import time of module in ms beyond interpreter startup, and any ReportLab modules it loaded"""
+    startup = _importtime('pass')
+    best, reportlab = None, set()
+    for _ in range(runs):
+        modules = _importtime(f'import {module}')
+        # Unindented names are top-level imports; their cumulative times don't overlap
+        total = sum(us for name, us in modules.items() if name == name.lstrip() and name not in startup)
+        best = total if best is None else min(best, total)
+        reportlab.update(name.strip() for name in modules if name.strip().startswith('reportlab'))
+    return best / 1000, sorted(reportlab)
+
+def check_startup(budgets):
+    """Import time and ReportLab modules per entry point in budgets, report lines and budget violations"""
+    costs, lines, problems = {}, [f"{'module':<28}{'import ms':>10}{'budget':>8}"], []
+    for module, budget in budgets.items():
+        ms, reportlab = import_cost(module)
+        costs[module] = {'ms': round(ms, 1), 'budget': budget, 'reportlab': reportlab}
+        lines.append(f"{module:<28}{ms:>10.1f}{budget:>8}")
+        if ms > budget:
+            problems.append(f"{module}: import takes {ms:.1f} ms, budget {budget} ms")
+        if reportlab:
+            problems.append(f"{module}: imports ReportLab at startup ({', '.join(reportlab[:3])}...)")
+    return costs, lines, problems
+
+def bind_cost(documents=10000, rescans=1000):
+    """Compile/bind timings for the default template and whether it reproduces the showcase content"""
+    from html import escape
+    from briefing.content import CONTENT_DIR, DEFAULT_CONTENT, load_content
+    from briefing.template import DEFAULT_TEMPLATE, compile_template
+
+    template = load_content(DEFAULT_TEMPLATE)
+    values = load_content(os.path.join(CONTENT_DIR, 'values', 'chesapeake_regional.json'))
+    start = time.perf_counter()
+    compiled = compile_template(template)
+    compile_ms = (time.perf_counter() - start) * 1000
+    exact = compiled.bind(values) == load_content(DEFAULT_CONTENT)
+
+    batch = [dict(values, org_name=f"Customer {i} Health", patient_records=1000 * i,
+                  exposure_years=20 + i % 40) for i in range(documents)]
+    start = time.perf_counter()
+    for customer in batch:
+        compiled.bind(customer)
+    bind_us = (time.perf_counter() - start) * 1e6 / documents
+
+    # The alternative: scan the template text for placeholders on every render
+    text = json.dumps({key: value for key, value in template.items() if key != 'variables'})
+    placeholder = re.compile(r'\{(\w+)(?::([^{}]*))?\}')
+    start = time.perf_counter()
+    for customer in batch[:rescans]:
+        json.loads(placeholder.sub(lambda m: json.dumps(
+            escape(format(customer[m[1]], m[2] or ''), quote=False))[1:-1], text))
+    rescan_us = (time.perf_counter() - start) * 1e6 / rescans
+    return {'compile_ms': round(compile_ms, 2), 'bind_us': round(bind_us, 2),
+            'rescan_us': round(rescan_us, 2), 'documents': documents, 'exact': exact}
+
+def html_preview_cost(repeat=20):
+    """ms for the HTML preview: first render with imports (fresh interpreter) and fastest warm render"""
+    code = (f"import sys, time; sys.path.insert(0, {SCRIPTS_DIR!r}); start = time.perf_counter(); "
+            f"from briefing.html_preview import render_html; render_html(); "
+            f"print((time.perf_counter() - start) * 1000, 'reportlab' in sys.modules)")
+    first, reportlab = None, False
+    for _ in range(3):
+        ms, loaded = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                    check=True).stdout.split()
+        first = float(ms) if first is None else min(first, float(ms))
+        reportlab = reportlab or loaded == 'True'
+    from briefing.content import load_content
+    from briefing.html_preview import render_html
+    content = load_content()
+    render_html(content)
+    warm = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        page = render_html(content)
+        warm.append((time.perf_counter() - start) * 1000)
+    return {'first': round(first, 2), 'warm': round(min(warm), 3), 'bytes': len(page.encode('utf-8')),
+            'reportlab': reportlab}
+
+def thumbnail_cost(names=('briefing', 'product_book'), repeat=7):
+    """Fastest warm ms for thumbnails of pages 1-2 vs a full render, and for a cached thumbnail"""
+    import tempfile
+    from briefing.thumbnail import thumbnails
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name in names:
+            stages = {'full': _render_fn(name), 'thumbnails': lambda: thumbnails(name, cache_dir=None),
+                      'hit': lambda: thumbnails(name, cache_dir=directory)}
+            runs = {stage: [] for stage in stages}
+            for fn in stages.values():
+                fn()  # Warm-up; fills the cache for 'hit'
+            # Interleaved, so a noisy stretch of the machine slows both stages alike
+            for _ in range(repeat):
+                for stage, fn in stages.items():
+                    start = time.perf_counter()
+                    fn()
+                    runs[stage].append((time.perf_counter() - start) * 1000)
+            results[name] = {stage: round(min(times), 2) for stage, times in runs.items()}
+            results[name]['pages'] = len(thumbnails(name, cache_dir=directory))
+    return results
+
+def _page_streams(pdf):
+    """Each page's content stream, with font resource names replaced by the fonts they name"""
+    from pypdf import PdfReader
+
+    streams = []
+    for page in PdfReader(io.BytesIO(pdf)).pages:
+        fonts = {name: str(font['/BaseFont']) for name, font in page['/Resources'].get('/Font', {}).items()}
+        data = page.get_contents().get_data().decode('latin-1')
+        streams.append(re.sub(r'/F\d+\b', lambda m: fonts.get(m.group(0), m.group(0)), data))
+    return streams
+
+def page_range_cost(repeat=5):
+    """Partial renders of each section checked against the full render, and timings for one range"""
+    import tempfile
+    from briefing.content import load_content
+    from briefing.document import render_bytes, render_pages
+    from briefing.incremental import IncrementalLayout
+    from briefing.theme import create_styles
+
+    content, styles = load_content(), create_styles()
+    full = _page_streams(render_bytes(content, styles))
+    mismatches, ranges = [], {}
+    for name in ['cover'] + [s['id'] for s in content['sections']] + ['closing']:
+        out = io.BytesIO()
+        pages = render_pages(out, content, sections=(name, name), styles=styles)['pages']
+        ranges[name] = pages
+        mismatches += [f"{name} page {n}" for n, stream in zip(pages, _page_streams(out.getvalue()))
+                       if stream != full[n - 1]]
+    with tempfile.TemporaryDirectory() as directory:
+        state = os.path.join(directory, 'layout.json')
+        layout = IncrementalLayout(state)
+        render_bytes(content, styles, layout=layout)
+        layout.save()
+        # An analyst's edit to the action plan: the sections before it replay, it is laid out again
+        edited = json.loads(json.dumps(content))
+        plan = next(s for s in edited['sections'] if s['id'] == 'action_plan')
+        next(b for b in plan['blocks'] if 'text' in b)['text'] += " Revised after the steering committee review."
+        stages = {'full': lambda: render_bytes(content, styles),
+                  'range': lambda: render_pages(io.BytesIO(), content, sections=('action_plan', 'action_plan'),
+                                                styles=styles),
+                  'replayed': lambda: render_pages(io.BytesIO(), edited, sections=('action_plan', 'action_plan'),
+                                                   styles=styles, layout=IncrementalLayout(state))}
+        timings = {}
+        for stage, fn in stages.items():
+            fn()
+            runs = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                runs.append((time.perf_counter() - start) * 1000)
+            timings[stage] = round(min(runs), 2)
+    return {'ranges': ranges, 'mismatches': mismatches, 'pages': len(full), **timings}
+
+# name -> expression rendering the document deterministically (see output.deterministic_output)
+DETERMINISTIC = {
+    'briefing': 'document.render_bytes(deterministic=True)',
+    'sample': 'stamp_sample(document.render_bytes(deterministic=True), out)',
+    'product_book': 'product_book.render_bytes(deterministic=True)',
+}
+
+def determinism(names):
+    """sha256 of each document from two fresh interpreters, and cache hit vs render time"""
+    import tempfile
+    from briefing.content import load_content
+    from briefing.document import render_bytes
+    from briefing.pdf_cache import PdfCache, render_key
+
+    digests = {}
+    for name in names:
+        code = (f"import hashlib, io, sys; sys.path.insert(0, {SCRIPTS_DIR!r}); "
+                f"from briefing import document, product_book; from briefing.sample import stamp_sample; "
+                f"out = io.BytesIO(); pdf = {DETERMINISTIC[name]}; "
+                f"print(hashlib.sha256(pdf or out.getvalue()).hexdigest())")
+        digests[name] = [subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                        check=True).stdout.strip() for _ in range(2)]
+    content = load_content()
+    with tempfile.TemporaryDirectory() as directory:
+        cache = PdfCache(directory)
+        start = time.perf_counter()
+        key = render_key(content)
+        cache.fetch(key, lambda: render_bytes(content, deterministic=True))
+        miss_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        _, hit = cache.fetch(render_key(content), lambda: render_bytes(content, deterministic=True))
+        hit_ms = (time.perf_counter() - start) * 1000
+    return {'digests': digests, 'miss_ms': round(miss_ms, 1), 'hit_ms': round(hit_ms, 2), 'hit': hit}
+
+def peer_benchmark_cost(history=100000, briefings=5000, checked=100):
+    """ms to index a synthetic assessment history and to benchmark a batch against it,
+    and how many of a sample of briefings differ from a one-at-a-time computation"""
+    import numpy as np
+    from briefing.peer_benchmark import COHORT_FIELDS, QUANTILES, SCORES, PeerBenchmarks
+
+    rng = np.random.default_rng(2026)
+    labels = {'org_size': ['under_50k', '50k_250k', '250k_1m', '1m_5m', 'over_5m'],
+              'state': ['MD', 'VA', 'PA', 'DE', 'DC', 'NY', 'NJ', 'WV', 'NC', 'OH'],
+              'ehr_vendor': ['Epic', 'Oracle Health', 'MEDITECH', 'athenahealth', 'eClinicalWorks', 'Allscripts']}
+    # Skewed cohort sizes, so some briefings fall back to broader peer groups
+    cohorts = np.stack([rng.choice(len(labels[f]), history, p=np.arange(len(labels[f]), 0, -1) /
+                                   sum(range(1, len(labels[f]) + 1))) for f in COHORT_FIELDS], axis=1)
+    scores = np.clip(rng.normal(47, 16, (history, len(SCORES))).round(), 0, 100)
+    start = time.perf_counter()
+    benchmarks = PeerBenchmarks(scores, cohorts, labels)
+    index_ms = (time.perf_counter() - start) * 1000
+
+    assessments = [{'org_size': labels['org_size'][rng.integers(5)], 'state': labels['state'][rng.integers(10)],
+                    'ehr_vendor': labels['ehr_vendor'][rng.integers(6)],
+                    'scores': dict(zip(SCORES[:-1], rng.integers(0, 101, len(SCORES) - 1).tolist()))}
+                   for _ in range(briefings)]
+    start = time.perf_counter()
+    comparison = benchmarks.compare(assessments)
+    compare_ms = (time.perf_counter() - start) * 1000
+    for i in range(briefings):
+        comparison.stat_items(i)
+    batch_ms = (time.perf_counter() - start) * 1000
+
+    mismatches = 0
+    start = time.perf_counter()
+    for i in range(0, briefings, briefings // checked):
+        peers = np.ones(history, dtype=bool)
+        for field, label in comparison.cohort(i).items():
+            peers &= cohorts[:, COHORT_FIELDS.index(field)] == labels[field].index(label)
+        peer_scores = scores[peers]
+        below = (peer_scores < comparison.scores[i]).sum(axis=0)
+        ties = (peer_scores == comparison.scores[i]).sum(axis=0)
+        expected = np.column_stack([100 * (below + ties / 2) / len(peer_scores), peer_scores.mean(axis=0),
+                                    np.percentile(peer_scores, QUANTILES, axis=0).T])
+        actual = np.column_stack([comparison.percentile[i], comparison.mean[i], comparison.quantiles[i]])
+        if len(peer_scores) != comparison.peers[i] or not np.allclose(actual, expected, rtol=0, atol=1e-9):
+            mismatches += 1
+    masked_ms = (time.perf_counter() - start) * 1000 / checked
+
+    # An export that never recorded a state: cohorts leave state out instead of failing
+    sparse = [{'org_size': labels['org_size'][size], 'ehr_vendor': labels['ehr_vendor'][vendor],
+               **dict(zip(SCORES, row))} for (size, _, vendor), row in zip(cohorts[:400].tolist(), scores[:400].tolist())]
+    sparse_cohort = PeerBenchmarks.from_records(sparse).compare(assessments[:1])
+    cohort = sparse_cohort.cohort(0)
+    sparse_ok = 'state' not in cohort and sparse_cohort.peers[0] == sum(
+        all(record[field] == label for field, label in cohort.items()) for record in sparse)
+    return {'history': history, 'briefings': briefings, 'index_ms': round(index_ms, 1),
+            'compare_ms': round(compare_ms, 1), 'batch_ms': round(batch_ms, 1), 'masked_ms': round(masked_ms, 2),
+            'levels': np.bincount(comparison.level, minlength=5).tolist(), 'mismatches': mismatches,
+            'sparse_history': bool(sparse_ok)}
+
+def _inventory_rows(count):
+    """Synthetic inventory rows for the showcase appendix; every seventh asset name wraps"""
+    return [[f'srv-{i:05d}.chesapeake.local' + (' (legacy payment gateway cluster)' if i % 7 == 0 else ''),
+             'TLS certificate', 'RSA-2048' if i % 3 else 'ECDSA P-256', 'DC-East', 'HIGH' if i % 2 else 'LOW']
+            for i in range(count)]
+
+def parallel_cost(rows=PARALLEL_ROWS, repeat=2):
+    """Serial vs render_parallel wall time, with and without an inventory appendix, and page mismatches"""
+    from briefing.content import load_content
+    from briefing.document import render_bytes
+    from briefing.parallel import render_parallel, start_pool
+    from briefing.theme import create_styles
+
+    content, styles = load_content(), create_styles()
+    workers = os.cpu_count() or 1
+    results = {'workers': workers}
+    pool = start_pool(workers)
+    try:
+        for label, inventory in (('briefing', None), (f'briefing + {rows} rows', _inventory_rows(rows))):
+            def serial():
+                return render_bytes(content, styles, inventory=None if inventory is None else iter(inventory))
+
+            def parallel():
+                out = io.BytesIO()
+                info = render_parallel(out, content, None if inventory is None else iter(inventory), workers,
+                    pool=pool)
+                return out.getvalue(), info['parts']
+            expected, (merged, parts) = serial(), parallel()  # Warm both, and keep the output to compare
+            timings = {}
+            for stage, fn in (('serial', serial), ('parallel', parallel)):
+                runs = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    fn()
+                    runs.append((time.perf_counter() - start) * 1000)
+                timings[stage] = round(min(runs), 1)
+            full, pieces = _page_streams(expected), _page_streams(merged)
+            mismatches = [n for n, (a, b) in enumerate(zip(full, pieces), 1) if a != b]
+            if len(full) != len(pieces):
+                mismatches.append(f"{len(pieces)} pages, serial {len(full)}")
+            results[label] = {**timings, 'speedup': round(timings['serial'] / timings['parallel'], 2),
+                              'pages': len(full), 'jobs': parts, 'mismatches': mismatches}
+    finally:
+        pool.shutdown()
+    return results
+
+def table_scaling(sizes=(1000, 2000, 5000, 10000)):
+    """Per-row layout + write cost of create_inventory_table at increasing row counts"""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate
+    from briefing.components import create_inventory_table
+
+    results = []
+    for rows in sizes:
+        data = [['Asset', 'Algorithm', 'Owner']]
+        data += [[f'srv-{i:05d}.chesapeake.local', 'RSA-2048' if i % 3 else 'ECDSA P-256', 'IT Operations']
+                 for i in range(rows)]
+        table = create_inventory_table(data, [2.6*inch, 2*inch, 1.8*inch])
+        start = time.perf_counter()
+        SimpleDocTemplate(io.BytesIO()).build([table])
+        elapsed = time.perf_counter() - start
+        results.append({'rows': rows, 'ms': round(elapsed * 1000, 2), 'us_per_row': round(elapsed * 1e6 / rows, 2)})
+    return results
+
+# Checks run instead of the baseline comparison. Each takes (args, parser) and returns
+# (results for --json, report lines, problems, message when there are none)
+
+def _startup_check(args, parser):
+    with open(STARTUP_BUDGET_PATH, encoding='utf-8') as f:
+        costs, lines, problems = check_startup(json.load(f))
+    return costs, lines, problems, "Entry points within startup budgets, no ReportLab at import"
+
+def _determinism_check(args, parser):
+    result = determinism(args.documents or list(DOCUMENTS))
+    lines, problems = [], []
+    for name, (first, second) in result['digests'].items():
+        lines.append(f"{name:<14} {first[:16]}  {second[:16]}")
+        if first != second:
+            problems.append(f"{name}: two deterministic renders differ")
+    lines.append(f"PDF cache: render + store {result['miss_ms']} ms, hit {result['hit_ms']} ms")
+    if not result['hit']:
+        problems.append("the second fetch of the same content missed the PDF cache")
+    return result, lines, problems, "Deterministic renders are byte-identical; repeats are served from the cache"
+
+def _html_check(args, parser):
+    cost = html_preview_cost()
+    lines = [f"HTML preview: first render {cost['first']} ms (with imports), warm {cost['warm']} ms, "
+             f"{cost['bytes']} bytes"]
+    problems = [f"{stage} render takes {cost[stage]} ms, budget {budget}"
+                for stage, budget in HTML_BUDGET_MS.items() if cost[stage] > budget]
+    if cost['reportlab']:
+        problems.append("the HTML preview imports ReportLab")
+    return cost, lines, problems, "HTML preview within budget, no ReportLab"
+
+def _thumbnails_check(args, parser):
+    unknown = set(args.documents) - {'briefing', 'product_book'}
+    if unknown:
+        parser.error(f"no thumbnails for: {', '.join(sorted(unknown))}")
+    costs = thumbnail_cost(args.documents or ('briefing', 'product_book'))
+    lines, problems = [], []
+    for name, cost in costs.items():
+        lines.append(f"{name:<14} full render {cost['full']} ms, thumbnails {cost['thumbnails']} ms "
+                     f"({cost['thumbnails'] / cost['full'] * 100:.0f}%), cache hit {cost['hit']} ms")
+        if cost['pages'] != 2:
+            problems.append(f"{name}: {cost['pages']} thumbnails for pages 1-2")
+        if cost['thumbnails'] > THUMBNAIL_BUDGET[name] * cost['full']:
+            problems.append(f"{name}: thumbnails cost more than {THUMBNAIL_BUDGET[name] * 100:.0f}% of a full render")
+        if cost['hit'] > THUMBNAIL_HIT_BUDGET_MS:
+            problems.append(f"{name}: cache hit takes {cost['hit']} ms, budget {THUMBNAIL_HIT_BUDGET_MS}")
+    return costs, lines, problems, "Thumbnails within budget"
+
+def _page_range_check(args, parser):
+    cost = page_range_cost()
+    lines = [f"{name:<28} pages {pages[0]}-{pages[-1]}" for name, pages in cost['ranges'].items()]
+    plan = cost['ranges']['action_plan']
+    lines.append(f"full render ({cost['pages']} pages) {cost['full']} ms; action_plan (pages {plan[0]}-{plan[-1]}) "
+                 f"{cost['range']} ms; edited and replaying the sections before it {cost['replayed']} ms")
+    problems = [f"{page} differs from the full render" for page in cost['mismatches']]
+    if cost['range'] >= cost['full']:
+        problems.append("rendering the action plan's pages costs as much as the whole briefing")
+    return cost, lines, problems, "Partial renders match the full briefing page for page"
+
+def _bind_check(args, parser):
+    cost = bind_cost()
+    lines = [f"compile {cost['compile_ms']} ms once; bind {cost['bind_us']} us/document over "
+             f"{cost['documents']} documents (re-scanning the template text: {cost['rescan_us']} us/document)"]
+    problems = []
+    if not cost['exact']:
+        problems.append("binding the Chesapeake values doesn't reproduce chesapeake_regional.json")
+    if cost['bind_us'] > BIND_BUDGET_US:
+        problems.append(f"bind takes {cost['bind_us']} us/document, budget {BIND_BUDGET_US}")
+    return cost, lines, problems, "Template reproduces the showcase content, bind within budget"
+
+def _peer_benchmarks_check(args, parser):
+    cost = peer_benchmark_cost()
+    lines = [f"index {cost['history']:,} assessments {cost['index_ms']} ms once; {cost['briefings']:,} briefings: "
+             f"compare {cost['compare_ms']} ms, with stat boxes {cost['batch_ms']} ms "
+             f"(masking the history per briefing: {cost['masked_ms']} ms each)",
+             f"cohort levels used: {cost['levels']} (narrowest first)"]
+    problems = []
+    if cost['mismatches']:
+        problems.append(f"{cost['mismatches']} sampled briefings differ from the one-at-a-time figures")
+    if not cost['sparse_history']:
+        problems.append("a history without any state gives the wrong peer group")
+    if cost['batch_ms'] > PEER_BUDGET_MS:
+        problems.append(f"the batch takes {cost['batch_ms']} ms, budget {PEER_BUDGET_MS}")
+    return cost, lines, problems, "Batch peer benchmarks exact and within budget"
+
+def _parallel_check(args, parser):
+    cost = parallel_cost()
+    workers = cost['workers']
+    lines, problems = [], []
+    for label, run in cost.items():
+        if label == 'workers':
+            continue
+        lines.append(f"{label:<22} {run['pages']:>4} pages  serial {run['serial']} ms, parallel {run['parallel']} ms "
+                     f"in {run['jobs']} jobs on {workers} workers ({run['speedup']}x)")
+        problems += [f"{label}: page {page} differs from the serial render" for page in run['mismatches']]
+    if workers < 2:
+        lines.append("one core: speedup reported, not checked")
+    elif cost[f'briefing + {PARALLEL_ROWS} rows']['speedup'] <= 1:
+        problems.append(f"the inventory briefing renders no faster on {workers} workers than serially")
+    return cost, lines, problems, "Parallel renders match the serial render page for page"
+
+def _table_scaling_check(args, parser):
+    scaling = table_scaling()
+    lines = [f"{'rows':>8}{'ms':>12}{'us/row':>10}"]
+    lines += [f"{r['rows']:>8}{r['ms']:>12}{r['us_per_row']:>10}" for r in scaling]
+    growth = scaling[-1]['us_per_row'] / scaling[0]['us_per_row'] - 1
+    problems = []
+    if growth > args.tolerance:
+        problems.append(f"Per-row cost grew {growth * 100:.0f}% from {scaling[0]['rows']} to {scaling[-1]['rows']} rows")
+    return scaling, lines, problems, f"Linear within {args.tolerance * 100:.0f}%"
+
+CHECKS = {
+    'startup': (_startup_check, "check entry-point import times against benchmarks/startup_budgets.json"),
+    'determinism': (_determinism_check, "check deterministic renders are byte-identical and time a PDF cache hit"),
+    'html': (_html_check, "time the HTML preview against its budget"),
+    'thumbnails': (_thumbnails_check, "time page thumbnails against a full render"),
+    'page-range': (_page_range_check, "check partial (page range) renders against the full briefing and time them"),
+    'bind': (_bind_check, "time compiled-template binding for a batch of customers"),
+    'peer-benchmarks': (_peer_benchmarks_check,
+                        "check and time batch peer benchmarks against a synthetic assessment history"),
+    'parallel': (_parallel_check, "check parallel renders against serial ones and report the speedup"),
+    'table-scaling': (_table_scaling_check, "check that inventory tables scale linearly up to 10k rows"),
+}
+
+def _report(results, lines, problems, success, json_path=None):
+    """Print a run's report and problems, write its results to json_path; returns the exit status"""
+    for line in lines:
+        print(line)
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    for line in problems:
+        print(f"❌ {line}")
+    if not problems:
+        print(f"✅ {success}")
+    return 1 if problems else 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the PDF generators against stored baselines")
+    parser.add_argument('documents', nargs='*',
+        help=f"documents to benchmark: {', '.join(DOCUMENTS)} (default: all)")
+    parser.add_argument('--repeat', type=int, default=5, help="warm renders per document")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+        help="allowed fractional regression per metric (0.25 = 25%%)")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON file")
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument('--update', action='store_true', help="write results as the new baseline")
+    for name, (_, help_text) in CHECKS.items():
+        modes.add_argument(f'--{name}', dest='check', action='store_const', const=name,
+            help=f"{help_text} instead")
+    parser.add_argument('--json', help="also write this run's results to a JSON file")
+    args = parser.parse_args(argv)
+    unknown = set(args.documents) - set(DOCUMENTS)
+    if unknown:
+        parser.error(f"unknown documents: {', '.join(sorted(unknown))}")
+
+    sys.path.insert(0, SCRIPTS_DIR)
+    if args.check:
+        check, _ = CHECKS[args.check]
+        return _report(*check(args, parser), json_path=args.json)
+    results = run(args.documents or list(DOCUMENTS), args.repeat)
+
+    columns = ('cold_ms', 'warm_ms', 'layout_ms', 'write_ms', 'peak_rss_kb', 'tracemalloc_peak_kb', 'bytes')
+    lines = [f"{'document':<14}" + ''.join(f"{c:>21}" for c in columns)]
+    lines += [f"{name:<14}" + ''.join(f"{metrics[c]:>21}" for c in columns) for name, metrics in results.items()]
+    if args.update:
+        baselines = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding='utf-8') as f:
+                baselines = json.load(f)
+        baselines.update(results)
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+        return _report(results, lines, [], f"Baselines written: {args.baseline}", args.json)
+
+    if not os.path.exists(args.baseline):
+        return _report(results, lines, [f"No baseline at {args.baseline}; run with --update first"], '', args.json)
+    with open(args.baseline, encoding='utf-8') as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+    return _report(results, lines, regressions, f"Within {args.tolerance * 100:.0f}% of baseline", args.json)
+
+if __name__ == "__main__":
+    sys.exit(main())
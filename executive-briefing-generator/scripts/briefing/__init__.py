@@ -0,0 +1,67 @@
+"""
+Layout package behind the three PDF entry points (generate_briefing.py,
+generate_briefing_sample.py and generate_product_book.py).
+
+  content          load and validate briefing content documents, read inventory exports
+  template         compiled briefing templates: customer values bound without re-parsing
+  theme            brand colors and the shared paragraph stylesheet
+  components       boxes and tables common to every document
+  document         the executive briefing: story, build_pdf, render_bytes, render_pages, preflight
+  sample           the SAMPLE-watermarked preview, stamped onto a clean briefing
+  html_preview     the briefing as HTML in about a millisecond (stdlib only)
+  thumbnail        PNG thumbnails of the first pages, laid out without the rest
+  product_book     the product book sales PDF
+  output           compact and deterministic output modes
+  pdf_cache        content-addressed store of rendered PDFs (stdlib only)
+  parallel         one briefing rendered in parts on worker processes and merged
+  peer_benchmark   percentiles among peer cohorts for stat boxes, batched with NumPy
+plus the layout machinery they share: style_registry, markup_cache, assets,
+section_cache, inventory_table, incremental, render_trace, preflight, page_range, and
+worker (per-process state for render pools).
+
+Importing the package, briefing.content or briefing.template does not import
+ReportLab, so entry points can parse arguments and validate content in milliseconds.
+Modules that lay out PDFs import ReportLab themselves and load on first use; the
+names in __all__ resolve lazily from them (from briefing import render_bytes).
+"""
+
+import importlib
+
+_EXPORTS = {
+    'DEFAULT_CONTENT': 'content',
+    'load_content': 'content',
+    'validate_content': 'content',
+    'read_inventory': 'content',
+    'DEFAULT_TEMPLATE': 'template',
+    'compile_template': 'template',
+    'create_styles': 'theme',
+    'create_box': 'components',
+    'create_table': 'components',
+    'create_inventory_table': 'components',
+    'build_pdf': 'document',
+    'render_bytes': 'document',
+    'render_pages': 'document',
+    'preflight': 'document',
+    'stamp_sample': 'sample',
+    'render_html': 'html_preview',
+    'thumbnails': 'thumbnail',
+    'compact_output': 'output',
+    'deterministic_output': 'output',
+    'PdfCache': 'pdf_cache',
+    'render_key': 'pdf_cache',
+    'render_parallel': 'parallel',
+    'PeerBenchmarks': 'peer_benchmark',
+    'with_peer_stats': 'peer_benchmark',
+    'IncrementalLayout': 'incremental',
+    'RenderTrace': 'render_trace',
+    'SectionCache': 'section_cache',
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = getattr(importlib.import_module(f'.{module}', __name__), name)
+    return value
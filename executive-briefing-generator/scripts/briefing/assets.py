@@ -0,0 +1,74 @@
+"""
+Image assets for the generated PDFs.
+
+Artwork ships full-size in assets/. Embedding it as-is means decoding, re-encoding and
+storing a 1536x1024 PNG in every PDF just to show a 7.3" x 2.2" strip. prepared_image()
+instead scales the source to the box at a target DPI once, saves it as a JPEG (which
+ReportLab embeds as-is, without re-encoding) and keeps it in a disk cache keyed by the
+source's content hash, the box size and the DPI. Later renders, in any process, reuse it.
+
+ReportLab names image XObjects after their data, so drawing the same prepared asset
+several times in one document embeds it once. Missing assets raise FileNotFoundError.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+
+from reportlab.lib.units import inch
+from reportlab.platypus import Image
+
+from .pdf_cache import write_atomic
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'assets')
+CACHE_DIR = os.environ.get('BRIEFING_ASSET_CACHE',
+    os.path.join(tempfile.gettempdir(), 'qsl-briefing-assets'))
+DEFAULT_DPI = 150
+JPEG_QUALITY = 85
+
+_prepared = {}  # (source path, mtime, size, width, height, dpi) -> cached path, per process
+
+def resolve_asset(name):
+    """Absolute path of an asset under assets/, or FileNotFoundError"""
+    path = os.path.normpath(os.path.join(ASSETS_DIR, name))
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"asset {name!r} not found in {os.path.normpath(ASSETS_DIR)}")
+    return path
+
+def _source_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def prepared_image(name, width, height, dpi=DEFAULT_DPI, cache_dir=None):
+    """Path of a JPEG of asset name scaled to width x height points at dpi, building it if needed"""
+    source = resolve_asset(name)
+    st = os.stat(source)
+    memo_key = (source, st.st_mtime_ns, st.st_size, width, height, dpi)
+    path = _prepared.get(memo_key)
+    if path is not None and os.path.exists(path):
+        return path
+
+    pixels = (max(1, round(width / inch * dpi)), max(1, round(height / inch * dpi)))
+    key = hashlib.sha256(f"{_source_hash(source)}:{pixels[0]}x{pixels[1]}:{dpi}:{JPEG_QUALITY}".encode()).hexdigest()
+    cache_dir = cache_dir or CACHE_DIR
+    path = os.path.join(cache_dir, f"{key}.jpg")
+    if not os.path.exists(path):
+        from PIL import Image as PILImage
+
+        os.makedirs(cache_dir, exist_ok=True)
+        with PILImage.open(source) as im:
+            # Same stretch-to-box the flowable applied to the full-size image
+            scaled = im.convert('RGB').resize(pixels, PILImage.LANCZOS)
+        jpeg = io.BytesIO()
+        scaled.save(jpeg, 'JPEG', quality=JPEG_QUALITY, optimize=True, dpi=(dpi, dpi))
+        write_atomic(path, jpeg.getvalue())
+    _prepared[memo_key] = path
+    return path
+
+def asset_image(name, width, height, dpi=DEFAULT_DPI):
+    """Image flowable drawing a cached, pre-scaled copy of an asset in a width x height box"""
+    return Image(prepared_image(name, width, height, dpi), width=width, height=height)
@@ -0,0 +1,78 @@
+"""
+Boxes and tables common to the briefing and the product book.
+"""
+
+from reportlab.lib.colors import HexColor, black, white
+from reportlab.lib.enums import TA_LEFT
+from reportlab.lib.units import inch
+from reportlab.platypus import Table, TableStyle
+
+from .inventory_table import InventoryTable
+from .markup_cache import Paragraph
+from .style_registry import get_style
+from .theme import PRIMARY_BLUE, SECTION_BG
+
+def create_box(text, box_color=SECTION_BG, text_color=white):
+    style = get_style('BoxInner', fontSize=11, leading=16, textColor=text_color,
+        fontName='Helvetica', alignment=TA_LEFT)
+    content = Paragraph(text, style)
+    table = Table([[content]], colWidths=[6.4*inch])
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), box_color),
+        ('PADDING', (0, 0), (-1, -1), 12),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ]))
+    return table
+
+def create_table(data, col_widths, header=True):
+    cell_style = get_style('Cell', fontSize=10, leading=13, textColor=black, fontName='Helvetica')
+    header_style = get_style('HdrCell', fontSize=10, leading=13, textColor=white, fontName='Helvetica-Bold')
+    wrapped_data = []
+    for row_idx, row in enumerate(data):
+        wrapped_row = []
+        for cell in row:
+            if row_idx == 0 and header:
+                wrapped_row.append(Paragraph(str(cell), header_style))
+            else:
+                wrapped_row.append(Paragraph(str(cell), cell_style))
+        wrapped_data.append(wrapped_row)
+    table = Table(wrapped_data, colWidths=col_widths)
+    style_commands = [
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('PADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 0.5, HexColor('#cccccc')),
+    ]
+    if header:
+        style_commands.append(('BACKGROUND', (0, 0), (-1, 0), PRIMARY_BLUE))
+    for i in range(1, len(data)):
+        if i % 2 == 0:
+            style_commands.append(('BACKGROUND', (0, i), (-1, i), HexColor('#f0f0f0')))
+    table.setStyle(TableStyle(style_commands))
+    return table
+
+def create_inventory_table(data, col_widths, header=True, first_row=0):
+    """create_table look for inventories of any length: plain-string cells where no
+    markup or wrapping is needed, repeated header on every page, linear-time splitting.
+
+    data may be any iterable of rows, including a generator; it is read during doc.build.
+    first_row numbers data's first row within a longer table rendered in pieces.
+    """
+    cell_style = get_style('Cell', fontSize=10, leading=13, textColor=black, fontName='Helvetica')
+    header_style = get_style('HdrCell', fontSize=10, leading=13, textColor=white, fontName='Helvetica-Bold')
+    style_commands = [
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('PADDING', (0, 0), (-1, -1), 6),
+        ('GRID', (0, 0), (-1, -1), 0.5, HexColor('#cccccc')),
+        ('FONT', (0, 0), (-1, -1), 'Helvetica', 10, 13),
+        ('TEXTCOLOR', (0, 0), (-1, -1), black),
+    ]
+    if header:
+        style_commands += [
+            ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_BLUE),
+            ('FONT', (0, 0), (-1, 0), 'Helvetica-Bold', 10, 13),
+            ('TEXTCOLOR', (0, 0), (-1, 0), white),
+        ]
+    rows = iter(data)
+    header_row = next(rows) if header else None
+    return InventoryTable(rows, col_widths, header_row, cell_style, header_style,
+        style_commands, HexColor('#f0f0f0'), padding=6, first_row=first_row)
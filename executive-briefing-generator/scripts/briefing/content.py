@@ -0,0 +1,150 @@
+"""
+Briefing content documents and inventory exports.
+
+Standard library only: validating a content document must not cost a ReportLab import.
+"""
+
+import json
+import os
+from datetime import datetime
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'content')
+DEFAULT_CONTENT = os.path.normpath(os.path.join(CONTENT_DIR, 'chesapeake_regional.json'))
+
+# Block type -> the fields its renderers read, with their types; document.BLOCK_RENDERERS
+# has one renderer for each
+BLOCK_FIELDS = {
+    'paragraph': {'text': str},
+    'subhead': {'text': str},
+    'bullets': {'items': list},
+    'box': {'text': str},
+    'warning_box': {'text': str},
+    'table': {'rows': list, 'col_widths': list},
+    'stats': {'items': list},
+    'spacer': {'height': (int, float)},
+    'divider': {},
+}
+BLOCK_TYPES = tuple(BLOCK_FIELDS)
+BOX_TONES = ('default', 'warning', 'success')  # document.BOX_TONES
+
+# Fields build_cover and the closing section read, with their types
+ORGANIZATION_FIELDS = {'name': str, 'contact': str, 'contact_title': str}
+COVER_FIELDS = {'title_lines': list, 'stats': list}
+CLOSING_FIELDS = {'methodology': str, 'sources': list, 'disclaimer': str}
+
+def load_content(path=DEFAULT_CONTENT):
+    """Load a briefing content document (JSON) from disk"""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+def report_date(content):
+    """The cover's report date: content['report_date'], or today's"""
+    return content.get('report_date') or datetime.now().strftime('%B %d, %Y')
+
+def read_inventory(path, columns):
+    """Yield one row per asset from a CSV (with header) or JSONL inventory export.
+
+    columns lists the record keys to keep, in order; values are escaped so they
+    print literally. Rows are read lazily, so the export is never held in memory.
+    """
+    import csv
+    import html
+
+    keys = [column['key'] for column in columns]
+    with open(path, encoding='utf-8', newline='') as f:
+        if path.endswith(('.jsonl', '.ndjson')):
+            records = (json.loads(line) for line in f if line.strip())
+        else:
+            records = csv.DictReader(f)
+        for record in records:
+            yield [html.escape(str(record.get(key) or ''), quote=False) for key in keys]
+
+_KIND_NAMES = {str: 'a string', list: 'a list', dict: 'an object', (int, float): 'a number'}
+
+def _require(obj, fields, where):
+    """Raise ValueError unless obj has every field, each of its declared type"""
+    for key, kind in fields.items():
+        if key not in obj:
+            raise ValueError(f"{where} is missing '{key}'")
+        if not isinstance(obj[key], kind) or isinstance(obj[key], bool):
+            raise ValueError(f"{where}: '{key}' must be {_KIND_NAMES[kind]}")
+
+def _validate_strings(items, where):
+    for item in items:
+        if not isinstance(item, str):
+            raise ValueError(f"{where} must hold strings, got {type(item).__name__}")
+
+def _validate_stats(items, where):
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError(f"{where}: stats must be objects, got {type(item).__name__}")
+        _require(item, {'stat': str, 'label': str}, f"{where} stat")
+
+def _validate_blocks(blocks, where):
+    if not isinstance(blocks, list):
+        raise ValueError(f"{where}: 'blocks' must be a list")
+    for block in blocks:
+        if not isinstance(block, dict):
+            raise ValueError(f"{where}: blocks must be objects, got {type(block).__name__}")
+        kind = block.get('type')
+        if kind == 'cached':
+            _validate_blocks(block.get('blocks', []), where)
+            continue
+        if kind not in BLOCK_FIELDS:
+            raise ValueError(f"{where}: unknown block type {kind!r}")
+        _require(block, BLOCK_FIELDS[kind], f"{where}: {kind} block")
+        if kind == 'bullets':
+            _validate_strings(block['items'], f"{where}: bullets items")
+        elif kind == 'stats':
+            _validate_stats(block['items'], where)
+        elif kind == 'box' and block.get('tone', 'default') not in BOX_TONES:
+            raise ValueError(f"{where}: unknown box tone {block['tone']!r}")
+        elif kind == 'table':
+            if not all(isinstance(row, list) for row in block['rows']):
+                raise ValueError(f"{where}: table rows must be lists")
+            if not all(isinstance(w, (int, float)) for w in block['col_widths']):
+                raise ValueError(f"{where}: table col_widths must be numbers")
+
+def validate_content(content):
+    """Raise ValueError if a content document cannot be laid out.
+
+    Checks every field the PDF and HTML renderers read, so a document that passes
+    never fails layout with a KeyError or TypeError.
+    """
+    if not isinstance(content, dict):
+        raise ValueError(f"content must be an object, got {type(content).__name__}")
+    for key in ('organization', 'cover', 'sections'):
+        if key not in content:
+            raise ValueError(f"content is missing '{key}'")
+    for key in ('organization', 'cover'):
+        if not isinstance(content[key], dict):
+            raise ValueError(f"'{key}' must be an object")
+    _require(content['organization'], ORGANIZATION_FIELDS, 'organization')
+    _require(content['cover'], COVER_FIELDS, 'cover')
+    _validate_strings(content['cover']['title_lines'], 'cover title_lines')
+    _validate_stats(content['cover']['stats'], 'cover')
+    _require(content, CLOSING_FIELDS, 'content')
+    _validate_strings(content['sources'], "'sources'")
+    if not isinstance(content['sections'], list):
+        raise ValueError("'sections' must be a list")
+    for section in content['sections']:
+        if not isinstance(section, dict):
+            raise ValueError(f"sections must be objects, got {type(section).__name__}")
+        for key in ('id', 'title', 'blocks'):
+            if key not in section:
+                raise ValueError(f"section {section.get('id', '?')!r} is missing '{key}'")
+        if not isinstance(section['title'], str):
+            raise ValueError(f"section {section['id']!r}: 'title' must be a string")
+        _validate_blocks(section['blocks'], f"section {section['id']!r}")
+    appendix = content.get('inventory_appendix')
+    if appendix is not None:
+        if not isinstance(appendix, dict):
+            raise ValueError("'inventory_appendix' must be an object")
+        _require(appendix, {'after': str, 'title': str, 'columns': list}, 'inventory_appendix')
+        if 'intro' in appendix and not isinstance(appendix['intro'], str):
+            raise ValueError("inventory_appendix: 'intro' must be a string")
+        for column in appendix['columns']:
+            if not isinstance(column, dict):
+                raise ValueError(f"inventory_appendix columns must be objects, got {type(column).__name__}")
+            _require(column, {'key': str, 'header': str, 'width': (int, float)}, 'inventory_appendix column')
+    return content
@@ -0,0 +1,354 @@
+"""
+Executive Briefing v3 layout: natural content flow, no blank pages, sales-ready.
+
+All customer-specific wording lives in a content document (see briefing.content);
+this module only lays it out, so one process can render any number of briefings.
+generate_briefing.py is its command-line entry point.
+"""
+
+import hashlib
+import io
+import itertools
+from contextlib import nullcontext
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.units import inch
+from reportlab.lib.colors import Color, HexColor, white
+from reportlab.platypus import (
+    SimpleDocTemplate, Spacer, Table, TableStyle, PageBreak
+)
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus.flowables import HRFlowable
+
+from .components import create_box, create_inventory_table, create_table
+from .content import load_content, report_date
+from .inventory_table import CompressedPageCanvas
+from .markup_cache import Paragraph
+from .output import output_mode
+from .page_range import CompressedPageRangeCanvas, PageRange, PageRangeCanvas
+from .preflight import Preflight
+from .render_trace import NO_TRACE
+from .style_registry import get_style
+from .theme import (ACCENT_CYAN, PRIMARY_BLUE, PRIMARY_DARK, SECTION_BG, SUCCESS_GREEN,
+    WARNING_RED, create_styles)
+
+# Bump when helper layout changes so cached static sections are re-rendered
+LAYOUT_VERSION = 'v3'
+FRAME_WIDTH = letter[0] - 1.2*inch
+FRAME_HEIGHT = letter[1] - 1.1*inch
+FRAME_PADDING = 6  # SimpleDocTemplate's frame padding; flowables get the frame less this on each side
+
+def add_watermark(canvas, doc):
+    """Add diagonal SAMPLE watermark to each page"""
+    canvas.saveState()
+    canvas.setFont('Helvetica-Bold', 60)
+    canvas.setFillColor(Color(0.7, 0.7, 0.7, alpha=0.3))  # Light gray, 30% opacity
+    canvas.translate(letter[0]/2, letter[1]/2)  # Center of page
+    canvas.rotate(45)  # Diagonal
+    canvas.drawCentredString(0, 0, "SAMPLE")
+    canvas.restoreState()
+
+def create_warning_box(text):
+    style = get_style('WarnInner', fontSize=11, leading=15, textColor=white,
+        fontName='Helvetica-Bold', alignment=TA_CENTER)
+    content = Paragraph(text, style)
+    table = Table([[content]], colWidths=[6.4*inch])
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), WARNING_RED),
+        ('PADDING', (0, 0), (-1, -1), 10),
+    ]))
+    return table
+
+def create_stat_box(stat, label):
+    stat_style = get_style('StatNum', fontSize=24, leading=28, textColor=ACCENT_CYAN,
+        fontName='Helvetica-Bold', alignment=TA_CENTER)
+    label_style = get_style('StatLbl', fontSize=9, leading=12, textColor=white,
+        fontName='Helvetica', alignment=TA_CENTER)
+    content = [[Paragraph(stat, stat_style)], [Paragraph(label, label_style)]]
+    table = Table(content, colWidths=[2*inch])
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), PRIMARY_DARK),
+        ('PADDING', (0, 0), (-1, -1), 8),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ]))
+    return table
+
+_fingerprints = {}
+
+def style_fingerprint(styles):
+    """Hash of LAYOUT_VERSION and every stylesheet attribute, for section cache keys"""
+    fingerprint = _fingerprints.get(id(styles))
+    if fingerprint is None:
+        described = [(name, sorted((k, repr(v)) for k, v in vars(style).items()))
+                     for name, style in sorted(styles.byName.items())]
+        fingerprint = hashlib.sha256(repr((LAYOUT_VERSION, described)).encode('utf-8')).hexdigest()
+        _fingerprints[id(styles)] = fingerprint
+    return fingerprint
+
+def _render_paragraph(block, story, styles):
+    story.append(Paragraph(block['text'], styles['Body']))
+
+def _render_subhead(block, story, styles):
+    story.append(Paragraph(block['text'], styles['SubHead']))
+
+def _render_bullets(block, story, styles):
+    for item in block['items']:
+        story.append(Paragraph(f"• {item}", styles['QBullet']))
+
+def _render_box(block, story, styles):
+    box_color, text_color = BOX_TONES[block.get('tone', 'default')]
+    story.append(create_box(block['text'], box_color, text_color))
+
+def _render_warning_box(block, story, styles):
+    story.append(create_warning_box(block['text']))
+
+def _render_table(block, story, styles):
+    col_widths = [w*inch for w in block['col_widths']]
+    make_table = create_inventory_table if block.get('inventory') else create_table
+    story.append(make_table(block['rows'], col_widths, block.get('header', True)))
+
+def _render_stats(block, story, styles):
+    boxes = [create_stat_box(s['stat'], s['label']) for s in block['items']]
+    story.append(Table([boxes], colWidths=[2.2*inch] * len(boxes)))
+
+def _render_spacer(block, story, styles):
+    story.append(Spacer(1, block['height']*inch))
+
+def _render_divider(block, story, styles):
+    story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#cccccc')))
+
+# Block type -> renderer, one for each of content.BLOCK_TYPES
+BLOCK_RENDERERS = {
+    'paragraph': _render_paragraph,
+    'subhead': _render_subhead,
+    'bullets': _render_bullets,
+    'box': _render_box,
+    'warning_box': _render_warning_box,
+    'table': _render_table,
+    'stats': _render_stats,
+    'spacer': _render_spacer,
+    'divider': _render_divider,
+}
+
+BOX_TONES = {
+    'default': (SECTION_BG, white),
+    'warning': (WARNING_RED, white),
+    'success': (SUCCESS_GREEN, white),
+}
+
+def build_cover(content, story, styles):
+    org = content['organization']
+    cover = content['cover']
+    story.append(Spacer(1, 0.8*inch))
+    
+    logo_style = get_style('Logo', fontSize=14, textColor=ACCENT_CYAN,
+        fontName='Helvetica-Bold', alignment=TA_CENTER)
+    story.append(Paragraph("QUANTUM SHIELD LABS", logo_style))
+    story.append(Spacer(1, 0.3*inch))
+    
+    title_style = get_style('TitleBox', fontSize=26, leading=32, textColor=white,
+        fontName='Helvetica-Bold', alignment=TA_CENTER)
+    title_content = [[Paragraph(line, title_style)] for line in cover['title_lines']]
+    title_table = Table(title_content, colWidths=[6*inch])
+    title_table.setStyle(TableStyle([('BACKGROUND', (0, 0), (-1, -1), PRIMARY_DARK),
+        ('PADDING', (0, 0), (-1, -1), 22)]))
+    story.append(title_table)
+    
+    story.append(Spacer(1, 0.25*inch))
+    client_style = get_style('Client', fontSize=18, leading=24, textColor=PRIMARY_BLUE,
+        fontName='Helvetica-Bold', alignment=TA_CENTER)
+    story.append(Paragraph(org['name'], client_style))
+    
+    prep_style = get_style('Prep', fontSize=11, leading=16, textColor=HexColor('#444444'),
+        fontName='Helvetica', alignment=TA_CENTER)
+    story.append(Paragraph(f"Prepared for: <b>{org['contact']}</b>, {org['contact_title']}", prep_style))
+    
+    story.append(Spacer(1, 0.4*inch))
+    _render_stats({'items': cover['stats']}, story, styles)
+    
+    story.append(Spacer(1, 0.4*inch))
+    footer_style = get_style('CoverFoot', fontSize=10, textColor=HexColor('#666666'),
+        fontName='Helvetica', alignment=TA_CENTER)
+    story.append(Paragraph(f"Report Date: {report_date(content)}", footer_style))
+    story.append(Paragraph("CONFIDENTIAL — FOR INTERNAL USE ONLY", footer_style))
+    
+    story.append(PageBreak())  # Only page break after cover
+
+def append_cached(material, build, story, styles, section_cache=None):
+    """Append a static section as a cached placeholder, or lay it out inline without a cache"""
+    placeholder = None
+    if section_cache is not None:
+        placeholder = section_cache.flowable(material, build, FRAME_WIDTH - 2*FRAME_PADDING,
+            style_fingerprint(styles), FRAME_HEIGHT - 2*FRAME_PADDING)
+    if placeholder is None:
+        build(story)
+    else:
+        story.append(placeholder)
+
+def render_blocks(blocks, story, styles, section_cache=None):
+    for block in blocks:
+        if block['type'] == 'cached':
+            append_cached(block['blocks'],
+                lambda s, inner=block['blocks']: render_blocks(inner, s, styles),
+                story, styles, section_cache)
+        else:
+            BLOCK_RENDERERS[block['type']](block, story, styles)
+
+def build_section(section, story, styles, first=False, section_cache=None):
+    if not first:
+        story.append(Spacer(1, 0.2*inch))
+    story.append(Paragraph(section['title'], styles['SectHead']))
+    story.append(HRFlowable(width="100%", thickness=2, color=PRIMARY_BLUE))
+    story.append(Spacer(1, 0.1*inch))
+    render_blocks(section['blocks'], story, styles, section_cache)
+
+def build_inventory_appendix(appendix, inventory, story, styles):
+    """Appendix of inventory rows; inventory is any iterable and is consumed during doc.build"""
+    story.append(PageBreak())
+    story.append(Paragraph(appendix['title'], styles['SectHead']))
+    story.append(HRFlowable(width="100%", thickness=2, color=PRIMARY_BLUE))
+    story.append(Spacer(1, 0.1*inch))
+    if appendix.get('intro'):
+        story.append(Paragraph(appendix['intro'], styles['Body']))
+    columns = appendix['columns']
+    rows = itertools.chain([[c['header'] for c in columns]], inventory)
+    story.append(create_inventory_table(rows, [c['width']*inch for c in columns]))
+    story.append(PageBreak())
+
+def _build_closing_text(content, story, styles):
+    story.append(Paragraph("Methodology & Sources", styles['SubHead']))
+    story.append(Paragraph(content['methodology'], styles['Body']))
+    
+    story.append(Paragraph("Key Sources Referenced", styles['SubHead']))
+    _render_bullets({'items': content['sources']}, story, styles)
+    
+    story.append(Spacer(1, 0.15*inch))
+    disclaimer = get_style('Disc', fontSize=9, leading=12, textColor=HexColor('#666666'),
+        fontName='Helvetica', alignment=TA_JUSTIFY)
+    story.append(Paragraph(content['disclaimer'], disclaimer))
+    
+    story.append(Spacer(1, 0.25*inch))
+    end_style = get_style('End', fontSize=12, textColor=PRIMARY_BLUE,
+        fontName='Helvetica-Bold', alignment=TA_CENTER)
+    story.append(Paragraph("— END OF EXECUTIVE BRIEFING —", end_style))
+    story.append(Spacer(1, 0.1*inch))
+    story.append(Paragraph("© 2026 Quantum Shield Labs LLC. All Rights Reserved.", styles['Foot']))
+
+def build_closing(content, story, styles, section_cache=None):
+    story.append(Spacer(1, 0.2*inch))
+    _render_divider({}, story, styles)
+    story.append(Spacer(1, 0.1*inch))
+    material = {'closing': [content['methodology'], content['sources'], content['disclaimer']]}
+    append_cached(material, lambda s: _build_closing_text(content, s, styles),
+        story, styles, section_cache)
+
+def _add_section(name, material, build, story, styles, trace, layout, replayable=True):
+    """Build one section into story, or with a layout, a gate that builds it only if it changed"""
+    with trace.span(name, story):
+        if layout is None:
+            build(story)
+        else:
+            layout.section(name, material, build, story, style_fingerprint(styles), replayable)
+
+def build_document(story, styles, content=None, section_cache=None, trace=NO_TRACE, inventory=None,
+                   layout=None):
+    """Lay out a briefing content document; defaults to the Chesapeake Regional showcase.
+
+    inventory (rows for content['inventory_appendix'], e.g. from read_inventory) adds
+    the asset appendix after the section named by the appendix's 'after'. With an
+    IncrementalLayout, each section is keyed on the content it is built from and only
+    built if it can't be replayed from the previous render (see incremental.py).
+    """
+    if content is None:
+        content = load_content()
+    appendix = content.get('inventory_appendix') if inventory is not None else None
+    cached = section_cache is not None  # Cached placeholders lay out differently
+    # ============ COVER PAGE ============
+    material = {'organization': content['organization'], 'cover': content['cover'],
+                'report_date': report_date(content)}
+    _add_section('cover', material, lambda s: build_cover(content, s, styles),
+        story, styles, trace, layout)
+    # ============ SECTIONS ============
+    for i, section in enumerate(content['sections']):
+        material = {'section': section, 'first': i == 0, 'cached': cached}
+        _add_section(section['id'], material,
+            lambda s, section=section, first=(i == 0): build_section(section, s, styles, first, section_cache),
+            story, styles, trace, layout)
+        if appendix is not None and section['id'] == appendix['after']:
+            _add_section('inventory_appendix', None,
+                lambda s: build_inventory_appendix(appendix, inventory, s, styles),
+                story, styles, trace, layout, replayable=False)
+    # ============ METHODOLOGY & SOURCES ============
+    material = {'closing': [content['methodology'], content['sources'], content['disclaimer']],
+                'cached': cached}
+    _add_section('closing', material, lambda s: build_closing(content, s, styles, section_cache),
+        story, styles, trace, layout)
+
+def briefing_doc(output):
+    """The briefing's page template: US letter, FRAME_WIDTH x FRAME_HEIGHT frame"""
+    return SimpleDocTemplate(output, pagesize=letter,
+        rightMargin=0.6*inch, leftMargin=0.6*inch,
+        topMargin=0.55*inch, bottomMargin=0.55*inch)
+
+def build_pdf(output, content=None, styles=None, section_cache=None, trace=None, inventory=None,
+              compact=False, layout=None, deterministic=False):
+    """Lay out and write one briefing; pass styles from create_styles() to reuse them across documents.
+
+    output is a file path or any binary file-like object (BytesIO, a socket file,
+    sys.stdout.buffer). With a SectionCache, static sections are replayed from
+    pre-rendered recordings. A RenderTrace collects per-section timings. inventory
+    rows are streamed into the asset appendix while pages are laid out. compact writes
+    binary compressed streams (see output.compact_output); deterministic pins the
+    timestamp and document ID so the same input always gives the same bytes. An
+    IncrementalLayout replays sections unchanged since its previous render and records
+    this one.
+    """
+    with output_mode(compact, deterministic):
+        doc = briefing_doc(output)
+        if styles is None:
+            styles = create_styles()
+        story = []
+        # Inventory appendices can run to thousands of pages; deflate each as it's finished
+        canvasmaker = CompressedPageCanvas if inventory is not None else Canvas
+        build_document(story, styles, content, section_cache, trace or NO_TRACE, inventory, layout)
+        with layout.capturing(doc) if layout is not None else nullcontext():
+            if trace is None:
+                doc.build(story, canvasmaker=canvasmaker)
+            else:
+                trace.build(doc, story, canvasmaker=canvasmaker)
+
+def render_pages(output, content=None, pages=None, sections=None, styles=None, section_cache=None,
+                 inventory=None, compact=False, layout=None, deterministic=False):
+    """Write only part of a briefing: pages=(first, last), or sections=(first, last) by name.
+
+    Pages keep the numbers, breaks and flow they have in the full document: the pages
+    before the range are paginated without being drawn and layout stops after it (see
+    page_range.py). An IncrementalLayout replays unchanged sections before the range
+    instead of laying them out; it isn't updated. Other arguments are as for build_pdf.
+    Returns {'pages': page numbers written, 'sections': start page of each section laid out}.
+    """
+    with output_mode(compact, deterministic):
+        if styles is None:
+            styles = create_styles()
+        selection = PageRange(pages, sections)
+        story = []
+        build_document(story, styles, content, section_cache, selection, inventory, layout)
+        canvasmaker = CompressedPageRangeCanvas if inventory is not None else PageRangeCanvas
+        return selection.run(briefing_doc(output), story, canvasmaker=canvasmaker)
+
+def preflight(content=None, styles=None, section_cache=None, inventory=None, min_fill=None):
+    """Paginate a briefing without drawing it: page fill, section start pages, near-empty pages"""
+    if styles is None:
+        styles = create_styles()
+    check = Preflight() if min_fill is None else Preflight(min_fill=min_fill)
+    story = []
+    build_document(story, styles, content, section_cache, check, inventory)
+    return check.run(briefing_doc(io.BytesIO()), story)
+
+def render_bytes(content=None, styles=None, section_cache=None, trace=None, compact=False, layout=None,
+                 inventory=None, deterministic=False):
+    """Render one briefing entirely in memory and return the PDF bytes"""
+    buffer = io.BytesIO()
+    build_pdf(buffer, content, styles, section_cache, trace, inventory, compact, layout, deterministic)
+    return buffer.getvalue()
@@ -0,0 +1,232 @@
+"""
+HTML preview of a briefing, from the same content document as the PDF.
+
+Laying out and writing the PDF takes a few hundred milliseconds in a fresh process;
+this renders the same cover, sections and closing as one HTML page in about a
+millisecond, so a results page can show the briefing at once while the PDF renders in
+the background. Each block type maps to the HTML counterpart of its PDF component:
+box and warning_box (create_box, create_warning_box) are shaded panels, stats tiles
+(create_stat_box), tables (create_table) with the header row and zebra striping, and
+so on, styled with theme.py's brand colors. There is no pagination; spacers and
+dividers keep their sizes.
+
+Content strings are ReportLab paragraph markup. Only the tags content documents use
+(<b>, <i>, <u>, <br/>, <super>, <sub>, <font color=...>) are turned into HTML;
+anything else is escaped and shown as text, so the preview can't carry script into
+the page. Standard library only, like content.py: no ReportLab import.
+"""
+
+import itertools
+import re
+from functools import lru_cache
+from html import escape
+
+from .content import load_content, report_date
+
+INVENTORY_PREVIEW_ROWS = 50  # The PDF lists every asset; the preview shows the first ones
+
+# theme.py's brand colors; the PDF's px-per-point is 1:1 here
+STYLESHEET = """
+.qsl-briefing { max-width: 7.3in; margin: 0 auto; padding: 0.4in 0.6in; background: #fff;
+  color: #000; font: 11pt/16pt Helvetica, Arial, sans-serif; }
+.qsl-briefing .cover { text-align: center; padding: 0.8in 0 0.4in; }
+.qsl-briefing .logo { color: #00d4ff; font-weight: bold; font-size: 14pt; margin-bottom: 0.3in; }
+.qsl-briefing .title { background: #0a1628; color: #fff; font-weight: bold; font-size: 26pt;
+  line-height: 32pt; padding: 22pt; margin: 0 auto; max-width: 6in; }
+.qsl-briefing .title div + div { margin-top: 12pt; }
+.qsl-briefing .client { color: #1e3a5f; font-weight: bold; font-size: 18pt; line-height: 24pt;
+  margin-top: 0.25in; }
+.qsl-briefing .prepared { color: #444; margin-bottom: 0.4in; }
+.qsl-briefing .cover-foot { color: #666; font-size: 10pt; line-height: 14pt; margin-top: 0.4in; }
+.qsl-briefing h2 { color: #1e3a5f; font-size: 20pt; line-height: 26pt; margin: 16pt 0 0;
+  padding-bottom: 8pt; border-bottom: 2px solid #1e3a5f; }
+.qsl-briefing h3 { color: #1e3a5f; font-size: 13pt; line-height: 17pt; margin: 12pt 0 6pt; }
+.qsl-briefing p { text-align: justify; margin: 0 0 8pt; }
+.qsl-briefing ul { margin: 0 0 8pt; padding-left: 18pt; }
+.qsl-briefing li { line-height: 15pt; margin-bottom: 5pt; }
+.qsl-briefing .box { background: #132337; color: #fff; padding: 12pt; line-height: 16pt; }
+.qsl-briefing .box.warning { background: #cc3333; }
+.qsl-briefing .box.success { background: #00aa55; }
+.qsl-briefing .warning-box { background: #cc3333; color: #fff; font-weight: bold; text-align: center;
+  padding: 10pt; line-height: 15pt; }
+.qsl-briefing .stats { display: flex; justify-content: center; gap: 0.2in; flex-wrap: wrap; }
+.qsl-briefing .stat { background: #0a1628; color: #fff; width: 2in; padding: 8pt; text-align: center;
+  box-sizing: border-box; }
+.qsl-briefing .stat-num { color: #00d4ff; font-weight: bold; font-size: 24pt; line-height: 28pt; }
+.qsl-briefing .stat-label { font-size: 9pt; line-height: 12pt; }
+.qsl-briefing table { border-collapse: collapse; width: 100%; font-size: 10pt; line-height: 13pt;
+  margin: 0 0 8pt; }
+.qsl-briefing td, .qsl-briefing th { border: 0.5pt solid #ccc; padding: 6pt; vertical-align: top;
+  text-align: left; }
+.qsl-briefing th { background: #1e3a5f; color: #fff; }
+.qsl-briefing table:not(.headless) tbody tr:nth-child(even),
+.qsl-briefing table.headless tbody tr:nth-child(odd):not(:first-child) { background: #f0f0f0; }
+.qsl-briefing hr { border: 0; border-top: 1px solid #ccc; margin: 0; }
+.qsl-briefing .more { color: #666; font-size: 9pt; }
+.qsl-briefing .disclaimer { color: #666; font-size: 9pt; line-height: 12pt; text-align: justify; }
+.qsl-briefing .end { color: #1e3a5f; font-weight: bold; font-size: 12pt; text-align: center;
+  margin-top: 0.25in; }
+.qsl-briefing .foot { color: #666; font-size: 9pt; text-align: center; margin-top: 0.1in; }
+"""
+
+_TAG = re.compile(r'<(/?)([a-zA-Z]+)((?:\s+[a-zA-Z]+\s*=\s*(?:"[^"]*"|\'[^\']*\'))*)\s*(/?)>')
+_COLOR_ATTR = re.compile(r'color\s*=\s*["\']([^"\']*)["\']')
+_SAFE_COLOR = re.compile(r'#[0-9a-fA-F]{3,8}|[a-zA-Z]+')
+_BARE_AMP = re.compile(r'&(?!#?\w+;)')
+_SIMPLE_TAGS = {'b': 'b', 'strong': 'b', 'i': 'i', 'em': 'i', 'u': 'u', 'super': 'sup', 'sup': 'sup',
+                'sub': 'sub'}
+
+def _text(text):
+    # The markup is XML, so entities (&amp;) are kept; stray <, > and bare & are escaped
+    return _BARE_AMP.sub('&amp;', text).replace('<', '&lt;').replace('>', '&gt;')
+
+def _tag(match):
+    closing, name, attrs, _ = match.groups()
+    name = name.lower()
+    if name == 'br':
+        return '<br>'
+    if name in _SIMPLE_TAGS:
+        return f"<{closing}{_SIMPLE_TAGS[name]}>"
+    if name == 'font':
+        if closing:
+            return '</span>'
+        color = _COLOR_ATTR.search(attrs)
+        if color and _SAFE_COLOR.fullmatch(color.group(1)):
+            return f'<span style="color:{color.group(1)}">'
+        return '<span>'
+    return escape(match.group(0))
+
+@lru_cache(maxsize=4096)
+def markup(text):
+    """ReportLab paragraph markup as HTML; tags outside the allow-list are shown escaped"""
+    out, pos = [], 0
+    for match in _TAG.finditer(text):
+        out.append(_text(text[pos:match.start()]))
+        out.append(_tag(match))
+        pos = match.end()
+    out.append(_text(text[pos:]))
+    return ''.join(out)
+
+def _paragraph(block, out):
+    out.append(f"<p>{markup(block['text'])}</p>")
+
+def _subhead(block, out):
+    out.append(f"<h3>{markup(block['text'])}</h3>")
+
+def _bullets(block, out):
+    out.append('<ul>' + ''.join(f"<li>{markup(item)}</li>" for item in block['items']) + '</ul>')
+
+def _box(block, out):
+    tone = block.get('tone', 'default')
+    out.append(f'<div class="box {escape(tone)}">{markup(block["text"])}</div>')
+
+def _warning_box(block, out):
+    out.append(f'<div class="warning-box">{markup(block["text"])}</div>')
+
+def _table_html(rows, col_widths, header=True):
+    total = sum(col_widths) or 1
+    parts = ['<table class="headless">' if not header else '<table>', '<colgroup>']
+    parts += [f'<col style="width:{100 * w / total:.1f}%">' for w in col_widths]
+    parts.append('</colgroup>')
+    rows = iter(rows)
+    if header:
+        first = next(rows, None)
+        if first is not None:
+            parts.append('<thead><tr>' + ''.join(f"<th>{markup(str(c))}</th>" for c in first) + '</tr></thead>')
+    parts.append('<tbody>')
+    parts += ['<tr>' + ''.join(f"<td>{markup(str(c))}</td>" for c in row) + '</tr>' for row in rows]
+    parts.append('</tbody></table>')
+    return ''.join(parts)
+
+def _table(block, out):
+    out.append(_table_html(block['rows'], block['col_widths'], block.get('header', True)))
+
+def _stats(block, out):
+    out.append('<div class="stats">' + ''.join(
+        f'<div class="stat"><div class="stat-num">{markup(s["stat"])}</div>'
+        f'<div class="stat-label">{markup(s["label"])}</div></div>' for s in block['items']) + '</div>')
+
+def _spacer(block, out):
+    out.append(f'<div style="height:{float(block["height"]):g}in"></div>')
+
+def _divider(block, out):
+    out.append('<hr>')
+
+# Block type -> HTML renderer, one for each of content.BLOCK_TYPES (cf. document.BLOCK_RENDERERS)
+HTML_RENDERERS = {
+    'paragraph': _paragraph,
+    'subhead': _subhead,
+    'bullets': _bullets,
+    'box': _box,
+    'warning_box': _warning_box,
+    'table': _table,
+    'stats': _stats,
+    'spacer': _spacer,
+    'divider': _divider,
+}
+
+def _blocks(blocks, out):
+    for block in blocks:
+        if block['type'] == 'cached':
+            _blocks(block['blocks'], out)
+        else:
+            HTML_RENDERERS[block['type']](block, out)
+
+def _cover(content, out):
+    org = content['organization']
+    out.append('<header class="cover"><div class="logo">QUANTUM SHIELD LABS</div><div class="title">')
+    out += [f"<div>{markup(line)}</div>" for line in content['cover']['title_lines']]
+    out.append(f'</div><div class="client">{markup(org["name"])}</div>'
+               f'<div class="prepared">Prepared for: <b>{markup(org["contact"])}</b>, '
+               f'{markup(org["contact_title"])}</div>')
+    _stats({'items': content['cover']['stats']}, out)
+    out.append(f'<div class="cover-foot">Report Date: {escape(report_date(content))}<br>'
+               'CONFIDENTIAL — FOR INTERNAL USE ONLY</div></header>')
+
+def _inventory_appendix(appendix, inventory, out):
+    columns = appendix['columns']
+    rows = list(itertools.islice(inventory, INVENTORY_PREVIEW_ROWS + 1))
+    out.append(f'<section id="inventory_appendix"><h2>{markup(appendix["title"])}</h2>')
+    if appendix.get('intro'):
+        out.append(f"<p>{markup(appendix['intro'])}</p>")
+    out.append(_table_html(itertools.chain([[c['header'] for c in columns]], rows[:INVENTORY_PREVIEW_ROWS]),
+                           [c['width'] for c in columns]))
+    if len(rows) > INVENTORY_PREVIEW_ROWS:
+        out.append(f'<p class="more">First {INVENTORY_PREVIEW_ROWS} assets; the PDF lists them all.</p>')
+    out.append('</section>')
+
+def _closing(content, out):
+    out.append('<footer class="closing"><hr><h3>Methodology &amp; Sources</h3>')
+    out.append(f"<p>{markup(content['methodology'])}</p><h3>Key Sources Referenced</h3>")
+    _bullets({'items': content['sources']}, out)
+    out.append(f'<p class="disclaimer">{markup(content["disclaimer"])}</p>'
+               '<div class="end">— END OF EXECUTIVE BRIEFING —</div>'
+               '<div class="foot">© 2026 Quantum Shield Labs LLC. All Rights Reserved.</div></footer>')
+
+def render_html(content=None, inventory=None, fragment=False):
+    """The briefing as HTML: a standalone page, or with fragment an <article> with its own <style>.
+
+    inventory rows (as for build_pdf) add the asset appendix, cut to its first
+    INVENTORY_PREVIEW_ROWS rows.
+    """
+    if content is None:
+        content = load_content()
+    appendix = content.get('inventory_appendix') if inventory is not None else None
+    out = [f'<article class="qsl-briefing"><style>{STYLESHEET}</style>']
+    _cover(content, out)
+    for section in content['sections']:
+        out.append(f'<section id="{escape(section["id"])}"><h2>{markup(section["title"])}</h2>')
+        _blocks(section['blocks'], out)
+        out.append('</section>')
+        if appendix is not None and section['id'] == appendix['after']:
+            _inventory_appendix(appendix, inventory, out)
+    _closing(content, out)
+    out.append('</article>')
+    body = ''.join(out)
+    if fragment:
+        return body
+    title = escape(re.sub(r'<[^>]+>', '', content['organization']['name']))
+    return ('<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+            '<meta name="viewport" content="width=device-width, initial-scale=1">'
+            f'<title>Executive Briefing — {title}</title></head>'
+            f'<body style="margin:0;background:#e8ecf1">{body}</body></html>')
@@ -0,0 +1,185 @@
+"""
+Incremental re-rendering of revised briefings.
+
+A revision usually changes one or two assessment answers, i.e. one or two sections.
+IncrementalLayout records, for every section of a render, the inputs it was built from
+(a hash of its content and the style fingerprint), the frame position it started at
+and the PDF drawing operators it produced on each page. The next render of the same
+briefing reads that record back and, for each section in turn:
+
+  - if its inputs are unchanged and it starts at exactly the same frame position, the
+    recorded operators are replayed page by page (no flowables built, nothing wrapped
+    or split) and the frame is left where the original layout left it;
+  - otherwise the section's flowables are built and laid out as usual, and recorded
+    for next time.
+
+Layout only depends on where a section starts and what is in it, so the result is the
+same document a full render would produce. A changed section that grows or shrinks
+moves the sections after it; they are laid out again until one starts where it did
+before, after which replay resumes (every section after a page break, for instance).
+
+Sections that use embedded fonts, transparency or link annotations carry per-document
+resources the operators alone don't capture; they are always laid out again. So is the
+inventory appendix, whose rows are streamed and never recorded.
+"""
+
+import json
+import os
+from contextlib import contextmanager
+
+from reportlab.pdfbase.pdfmetrics import standardFonts
+from reportlab.platypus import ActionFlowable, PageBreak
+from reportlab.platypus.doctemplate import FrameActionFlowable
+
+from .pdf_cache import write_atomic
+from .section_cache import replay_code, section_key
+
+LAYOUT_VERSION = 1
+
+def _frame_state(doc):
+    """Everything about the current position that affects how the next flowable is placed"""
+    frame = doc.frame
+    return [doc.pageTemplate.id, round(frame._y, 6), bool(frame._atTop),
+            round(getattr(frame, '_prevASpace', 0), 6)]
+
+class _Replay(FrameActionFlowable):
+    """Replays one page's worth of a recorded section, then restores the frame position"""
+
+    def __init__(self, code, fonts, versions=(), end=None):
+        self.code = code
+        self.fonts = fonts
+        self.versions = versions
+        self.end = end
+
+    def frameAction(self, frame):
+        replay_code(self.canv, self.code, self.fonts)
+        if self.versions:
+            self.canv._doc.ensureMinPdfVersion(*self.versions)
+        if self.end is not None:
+            frame._y, frame._atTop, frame._prevASpace = self.end[1:]
+
+class SectionGate(ActionFlowable):
+    """Story placeholder deciding, when layout reaches it, how its section is produced"""
+
+    def __init__(self, layout, name, key, build, story):
+        ActionFlowable.__init__(self)
+        self.layout = layout
+        self.name = name
+        self.key = key  # None: never replayed or recorded
+        self.build = build
+        self.story = story  # The list doc.build is consuming
+
+    def apply(self, doc):
+        self.story[0:0] = self.layout._enter(self, doc)
+
+class IncrementalLayout:
+    """Per-section layout record of one briefing, reused by its next render"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.previous = {}  # section -> record from the last render
+        self.records = {}   # section -> record of this render
+        self.replayed = []
+        self.laid_out = []
+        self._active = None  # Record being captured, if any
+        self._mark = 0       # Start of the active record's operators on the current page
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    saved = json.load(f)
+            except (OSError, ValueError):
+                saved = {}
+            if saved.get('version') == LAYOUT_VERSION:
+                self.previous = saved['sections']
+
+    def section(self, name, material, build, story, fingerprint, replayable=True):
+        """Append a gate for one section; build(story) appends its flowables when needed"""
+        key = section_key(material, fingerprint) if replayable else None
+        story.append(SectionGate(self, name, key, build, story))
+
+    def _enter(self, gate, doc):
+        state = _frame_state(doc)
+        self._close(doc, state)
+        previous = self.previous.get(gate.name)
+        if (gate.key is not None and previous is not None
+                and previous['key'] == gate.key and previous['start'] == state):
+            self.records[gate.name] = previous
+            self.replayed.append(gate.name)
+            return self._replay(previous)
+        flowables = []
+        gate.build(flowables)
+        self.laid_out.append(gate.name)
+        if gate.key is not None:
+            self._active = {'name': gate.name, 'key': gate.key, 'start': state, 'pages': [],
+                            'versions': [], 'annotations': doc.canv._annotationCount}
+            self._mark = len(doc.canv._code)
+        return flowables
+
+    def _replay(self, record):
+        flowables = []
+        last = len(record['pages']) - 1
+        for i, code in enumerate(record['pages']):
+            if i:
+                flowables.append(PageBreak())
+            flowables.append(_Replay(code, record['fonts'], record['versions'],
+                record['end'] if i == last else None))
+        return flowables
+
+    def _capture_page(self, doc):
+        if self._active is not None:
+            self._active['pages'].append(doc.canv._code[self._mark:])
+
+    def _close(self, doc, end, capture=True):
+        """Finish the active record; capture its operators on the current page unless already ended"""
+        record, self._active = self._active, None
+        if record is None:
+            return
+        if capture:
+            record['pages'].append(doc.canv._code[self._mark:])
+        record['end'] = end
+        record['fonts'] = fonts = {internal.lstrip('/'): name
+            for name, internal in doc.canv._doc.fontMapping.items()}
+        if (any(name not in standardFonts for name in fonts.values())
+                or any(op.endswith(' gs') for page in record['pages'] for op in page)
+                or doc.canv._annotationCount != record.pop('annotations')):
+            return  # Per-document resources the operators don't carry
+        self.records[record['name']] = record
+
+    @contextmanager
+    def capturing(self, doc):
+        """Hook doc's page begin/end so each section's operators are captured per page"""
+        begin, end = doc.handle_pageBegin, doc.handle_pageEnd
+        pdf_doc = None
+
+        def handle_pageEnd():
+            self._capture_page(doc)
+            end()
+
+        def handle_pageBegin():
+            nonlocal pdf_doc
+            begin()
+            self._mark = len(doc.canv._code)
+            if pdf_doc is None:  # The canvas only exists once the build has started
+                pdf_doc = doc.canv._doc
+                pdf_doc.ensureMinPdfVersion = ensure_version
+
+        def ensure_version(*keys):
+            # Features like transparency raise the file's PDF version without drawing anything
+            if self._active is not None:
+                self._active['versions'] += [k for k in keys if k not in self._active['versions']]
+            type(pdf_doc).ensureMinPdfVersion(pdf_doc, *keys)
+
+        doc.handle_pageBegin, doc.handle_pageEnd = handle_pageBegin, handle_pageEnd
+        try:
+            yield
+        finally:
+            del doc.handle_pageBegin, doc.handle_pageEnd  # Back to the class methods
+        self._close(doc, None, capture=False)  # The last section's final page ended in build
+
+    def save(self, path=None):
+        path = path or self.path
+        write_atomic(path, json.dumps({'version': LAYOUT_VERSION, 'sections': self.records}).encode('utf-8'))
+        return path
+
+    def stats(self):
+        return {'replayed': len(self.replayed), 'laid_out': len(self.laid_out)}
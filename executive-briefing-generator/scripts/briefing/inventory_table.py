@@ -0,0 +1,150 @@
+"""
+Page-windowed tables for inventories with thousands of rows.
+
+A platypus Table lays out and re-splits every remaining row each time it breaks across
+a page, so a long table costs roughly rows x pages. InventoryTable pulls rows from any
+iterable (a list, or a generator reading a CSV/JSONL export) and only ever builds a
+Table for the next window: enough rows to overflow the page. Splitting hands the page
+its part and returns a new InventoryTable reading on from the same source, so total
+work is linear in the row count and only one window of rows is held at a time.
+
+Cells without markup that fit their column on one line are drawn as plain strings;
+anything else becomes a Paragraph. Striping is one ROWBACKGROUNDS command per window,
+phase-shifted so the pattern continues across pages, and the header row is repeated
+at the top of every page. first_row is the index of the first row within the whole
+table, so that a table rendered in pieces keeps its stripes in phase.
+
+ReportLab keeps each finished page's content stream in memory until Canvas.save();
+build with canvasmaker=CompressedPageCanvas so those streams are deflated as soon as
+each page ends rather than held as raw text.
+"""
+
+from reportlab.pdfbase.pdfdoc import PDFName, PDFStream, PDFZCompress
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Flowable, Paragraph, Table, TableStyle
+
+_MARKUP_CHARS = ('<', '&', '\n')
+
+class _RowSource:
+    """Shared iterator over table rows with a lookahead buffer"""
+
+    def __init__(self, rows, consumed=0):
+        self._rows = iter(rows)
+        self._buffer = []
+        self.consumed = consumed
+
+    def peek(self, count):
+        while len(self._buffer) < count:
+            try:
+                self._buffer.append(next(self._rows))
+            except StopIteration:
+                break
+        return self._buffer[:count]
+
+    def consume(self, count):
+        del self._buffer[:count]
+        self.consumed += count
+
+class InventoryTable(Flowable):
+    """Long table laid out one page-sized window of rows at a time"""
+
+    def __init__(self, rows, col_widths, header_row, cell_style, header_style,
+                 style_commands, stripe, padding, first_row=0, _source=None):
+        Flowable.__init__(self)
+        self.col_widths = col_widths
+        self.header_row = header_row
+        self.cell_style = cell_style
+        self.header_style = header_style
+        self.style_commands = style_commands
+        self.stripe = stripe
+        self.padding = padding
+        self._source = _source or _RowSource(rows, first_row)
+        self._window = self._avail = None
+        self._header = None if header_row is None else self._cells(header_row, header_style)
+
+    def _cells(self, row, style):
+        cells = []
+        for value, width in zip(row, self.col_widths):
+            text = str(value)
+            if (any(c in text for c in _MARKUP_CHARS)
+                    or stringWidth(text, style.fontName, style.fontSize) > width - 2 * self.padding):
+                cells.append(Paragraph(text, style))
+            else:
+                cells.append(text)
+        return cells
+
+    def _build_window(self, availWidth, availHeight):
+        # A row is at least one line of text, so this many rows overflow the page
+        count = int(availHeight // self.cell_style.leading) + 1
+        while True:
+            rows = self._source.peek(count)
+            table = self._table(rows)
+            width, height = table.wrap(availWidth, availHeight)
+            if height > availHeight or len(rows) < count:
+                return table, (width, height)
+            count *= 2  # Custom padding/leading can make rows shorter than guessed
+
+    def _table(self, rows):
+        data = [self._cells(row, self.cell_style) for row in rows]
+        header = 0
+        if self._header is not None:
+            data.insert(0, self._header)
+            header = 1
+        # Global data row i (1-based) is striped when even; keep that phase in every window
+        cycle = [None, self.stripe] if self._source.consumed % 2 == 0 else [self.stripe, None]
+        commands = list(self.style_commands)
+        if len(data) > header:
+            commands.append(('ROWBACKGROUNDS', (0, header), (-1, -1), cycle))
+        table = Table(data, colWidths=self.col_widths, repeatRows=header)
+        table.setStyle(TableStyle(commands))
+        return table
+
+    def row_heights(self, rows):
+        """(header row height, [height of each of rows]) as laid out on a page.
+
+        A row's height depends only on its own cells, so rows can be measured in any
+        batches; a page holds the header and then rows while their heights fit.
+        """
+        table = self._table(rows)
+        table.wrap(sum(self.col_widths), float('inf'))  # Unbounded, so every row is measured
+        heights = table._rowHeights
+        if self._header is None:
+            return 0, heights
+        return heights[0], heights[1:]
+
+    def wrap(self, availWidth, availHeight):
+        if (availWidth, availHeight) != self._avail:
+            self._window, (self.width, self.height) = self._build_window(availWidth, availHeight)
+            self._avail = (availWidth, availHeight)
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        self.wrap(availWidth, availHeight)
+        parts = self._window.split(availWidth, availHeight)
+        if not parts:
+            return []
+        consumed = len(parts[0]._cellvalues) - (self._header is not None)
+        if consumed <= 0:
+            return []
+        self._source.consume(consumed)
+        if not self._source.peek(1):
+            return [parts[0]]
+        return [parts[0], InventoryTable(None, self.col_widths, self.header_row, self.cell_style,
+            self.header_style, self.style_commands, self.stripe, self.padding, _source=self._source)]
+
+    def draw(self):
+        self._window.drawOn(self.canv, 0, 0)
+
+class CompressedPageCanvas(Canvas):
+    """Canvas that deflates each page's content stream as soon as the page is finished"""
+
+    def showPage(self):
+        Canvas.showPage(self)
+        page = self._doc.Pages.pages[-1]
+        if page.stream and not page.Contents:
+            stream = PDFStream(content=PDFZCompress.encode(page.stream))
+            stream.dictionary['Filter'] = PDFName(PDFZCompress.pdfname)
+            stream.__Comment__ = "page stream"
+            page.Contents = stream
+            page.stream = None
@@ -0,0 +1,205 @@
+"""
+Durable render job queue in a local SQLite file.
+
+Jobs survive restarts: each is one row of the jobs table, and every status change is
+committed before the next step runs. Anything that can open the file can enqueue, e.g.
+the backend with
+
+    INSERT INTO jobs (id, content, output, status, enqueued_at)
+    VALUES ('job_42', '<content document JSON>', '/srv/reports/job_42.pdf', 'queued', <unix time>)
+
+Status runs queued -> running -> done | failed. A worker claims a job by moving it to
+running under its owner name (host:pid) with a lease, and renews the lease while it
+renders. recover() puts running jobs back in the queue when their lease has lapsed or
+their owner process on this host has gone, so a crashed worker's jobs are rendered
+again; a job that has been claimed max_attempts times without finishing is failed
+instead of crashing workers forever.
+
+Stdlib only, like content.py: enqueueing and stats never load ReportLab.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import time
+import uuid
+
+LEASE_SECONDS = 60
+MAX_ATTEMPTS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          TEXT PRIMARY KEY,
+    content     TEXT NOT NULL,              -- content document JSON
+    output      TEXT NOT NULL,              -- PDF path
+    inventory   TEXT,                       -- optional inventory export path
+    status      TEXT NOT NULL DEFAULT 'queued',
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    enqueued_at REAL NOT NULL,
+    started_at  REAL,
+    finished_at REAL,
+    owner       TEXT,
+    lease_until REAL,
+    error       TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_queued ON jobs (status, enqueued_at);
+"""
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an ascending list (latency summaries here and in batch_render)"""
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+class JobQueue:
+    """Render jobs stored in one SQLite file, shared safely between processes"""
+
+    def __init__(self, path, max_attempts=MAX_ATTEMPTS):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        # Autocommit; multi-statement changes take the write lock with BEGIN IMMEDIATE
+        self._db = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def enqueue(self, content, output, job_id=None, inventory=None):
+        """Add a job for a content document (dict); returns its id"""
+        job_id = job_id or uuid.uuid4().hex
+        try:
+            self._db.execute(
+                'INSERT INTO jobs (id, content, output, inventory, enqueued_at) VALUES (?, ?, ?, ?, ?)',
+                (job_id, json.dumps(content), output, inventory, time.time()))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"job {job_id!r} is already in the queue") from None
+        return job_id
+
+    def claim(self, lease=LEASE_SECONDS):
+        """Oldest queued job, now running under this queue's owner; None when the queue is empty"""
+        now = time.time()
+        self._db.execute('BEGIN IMMEDIATE')
+        try:
+            row = self._db.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' ORDER BY enqueued_at, id LIMIT 1").fetchone()
+            if row is not None:
+                self._db.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, started_at = ?, "
+                    "owner = ?, lease_until = ?, error = NULL WHERE id = ?",
+                    (now, self.owner, now + lease, row['id']))
+            self._db.execute('COMMIT')
+        except BaseException:
+            self._db.execute('ROLLBACK')
+            raise
+        return None if row is None else self.get(row['id'])
+
+    def renew(self, job_ids, lease=LEASE_SECONDS):
+        """Extend the lease on jobs this owner is still rendering"""
+        self._db.executemany(
+            "UPDATE jobs SET lease_until = ? WHERE id = ? AND owner = ? AND status = 'running'",
+            [(time.time() + lease, job_id, self.owner) for job_id in job_ids])
+
+    def finish(self, job_id, error=None):
+        """Record a claimed job as done, or failed with error"""
+        self._db.execute(
+            "UPDATE jobs SET status = ?, finished_at = ?, error = ?, lease_until = NULL "
+            "WHERE id = ? AND owner = ? AND status = 'running'",
+            ('failed' if error else 'done', time.time(), error, job_id, self.owner))
+
+    def release(self, job_ids, crashed=False):
+        """Put jobs this owner claimed back in the queue without finishing them.
+
+        A graceful stop doesn't count as an attempt; after a crash, jobs that have used
+        up max_attempts are failed instead.
+        """
+        now = time.time()
+        if crashed:
+            self._db.executemany(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, lease_until = NULL, error = ? "
+                "WHERE id = ? AND owner = ? AND status = 'running' AND attempts >= ?",
+                [(now, f"worker crashed {self.max_attempts} times; giving up", job_id, self.owner,
+                  self.max_attempts) for job_id in job_ids])
+        self._db.executemany(
+            "UPDATE jobs SET status = 'queued', owner = NULL, lease_until = NULL, attempts = attempts - ? "
+            "WHERE id = ? AND owner = ? AND status = 'running'",
+            [(0 if crashed else 1, job_id, self.owner) for job_id in job_ids])
+
+    def recover(self):
+        """Requeue running jobs whose worker has gone; returns (requeued, failed) counts"""
+        now = time.time()
+        host = socket.gethostname()
+        requeued = failed = 0
+        self._db.execute('BEGIN IMMEDIATE')
+        try:
+            for row in self._db.execute("SELECT id, owner, lease_until, attempts FROM jobs "
+                                        "WHERE status = 'running'").fetchall():
+                owner_host, _, pid = (row['owner'] or '').rpartition(':')
+                orphaned = owner_host == host and pid.isdigit() and not _pid_alive(int(pid))
+                if not orphaned and (row['lease_until'] or 0) > now:
+                    continue
+                if row['attempts'] >= self.max_attempts:
+                    self._db.execute(
+                        "UPDATE jobs SET status = 'failed', finished_at = ?, lease_until = NULL, error = ? "
+                        "WHERE id = ?", (now, f"worker lost {row['attempts']} times; giving up", row['id']))
+                    failed += 1
+                else:
+                    self._db.execute("UPDATE jobs SET status = 'queued', owner = NULL, lease_until = NULL "
+                                     "WHERE id = ?", (row['id'],))
+                    requeued += 1
+            self._db.execute('COMMIT')
+        except BaseException:
+            self._db.execute('ROLLBACK')
+            raise
+        return requeued, failed
+
+    def get(self, job_id):
+        """One job as a dict (content decoded), or None"""
+        row = self._db.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job['content'] = json.loads(job['content'])
+        return job
+
+    def stats(self, window=None):
+        """Queue depth, status counts, throughput and queue latency; window limits to recent seconds"""
+        now = time.time()
+        counts = dict(self._db.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall())
+        oldest = self._db.execute("SELECT MIN(enqueued_at) FROM jobs WHERE status = 'queued'").fetchone()[0]
+        since = 0 if window is None else now - window
+        finished = self._db.execute(
+            "SELECT enqueued_at, started_at, finished_at FROM jobs "
+            "WHERE status = 'done' AND finished_at >= ?", (since,)).fetchall()
+        stats = {
+            'queued': counts.get('queued', 0),
+            'running': counts.get('running', 0),
+            'done': counts.get('done', 0),
+            'failed': counts.get('failed', 0),
+            'oldest_queued_s': round(now - oldest, 1) if oldest is not None else None,
+        }
+        if finished:
+            waits = sorted(started - enqueued for enqueued, started, _ in finished)
+            renders = sorted(done - started for _, started, done in finished)
+            span = max(done for _, _, done in finished) - min(started for _, started, _ in finished)
+            stats.update({
+                'window_done': len(finished),
+                'jobs_per_second': round(len(finished) / span, 2) if span > 0 else None,
+                'queue_latency_p50_ms': round(percentile(waits, 50) * 1000, 1),
+                'queue_latency_p95_ms': round(percentile(waits, 95) * 1000, 1),
+                'queue_latency_max_ms': round(waits[-1] * 1000, 1),
+                'render_p50_ms': round(percentile(renders, 50) * 1000, 1),
+                'render_p95_ms': round(percentile(renders, 95) * 1000, 1),
+            })
+        return stats
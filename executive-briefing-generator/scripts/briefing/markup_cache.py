@@ -0,0 +1,58 @@
+"""
+Process-wide cache of parsed Paragraph markup.
+
+A ReportLab Paragraph runs its inline markup (<b>, <font>, <br/>, entities) through
+the XML parser every time one is built, although most briefing paragraphs are the same
+for every customer. Paragraph here is a drop-in subclass that keeps the parser's
+fragment list keyed by (text, style, bulletText) and hands the same list to every later
+Paragraph with that key, in every document the process renders.
+
+Sharing is safe because layout only reads the fragments: wrap and split build their
+own line and word lists from them. Styles are interned by style_registry and
+create_styles is memoized, so keys hit across documents; a style object held as a key
+simply stays alive. The cache is least-recently-used with MAX_ENTRIES entries so
+per-customer text can't grow it without bound. markup_stats() reports hits and misses.
+"""
+
+from collections import OrderedDict
+
+from reportlab.platypus import Paragraph as _Paragraph
+
+MAX_ENTRIES = 4096
+
+_parsed = OrderedDict()  # (text, style, bulletText, caseSensitive) -> (text, style, frags, bulletText)
+_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+class Paragraph(_Paragraph):
+    """Paragraph whose markup is parsed once per process for each text and style"""
+
+    def _setup(self, text, style, bulletText, frags, cleaner):
+        if frags is not None or not isinstance(bulletText, (str, type(None))):
+            return _Paragraph._setup(self, text, style, bulletText, frags, cleaner)
+        key = (text, style, bulletText, self.caseSensitive)
+        parsed = _parsed.get(key)
+        if parsed is None:
+            _stats['misses'] += 1
+            _Paragraph._setup(self, text, style, bulletText, frags, cleaner)
+            _parsed[key] = (self.text, self.style, self.frags, self.bulletText)
+            if len(_parsed) > MAX_ENTRIES:
+                _parsed.popitem(last=False)
+                _stats['evictions'] += 1
+            return
+        _stats['hits'] += 1
+        _parsed.move_to_end(key)
+        self.text, self.style, self.frags, self.bulletText = parsed
+        self.debug = 0
+
+def markup_stats():
+    """Parse counters: hits served from the cache, misses parsed, entries evicted"""
+    return dict(_stats, entries=len(_parsed), max_entries=MAX_ENTRIES)
+
+def reset_stats():
+    """Zero the counters without dropping parsed markup (e.g. between profiling runs)"""
+    for name in _stats:
+        _stats[name] = 0
+
+def clear():
+    """Drop every parsed entry"""
+    _parsed.clear()
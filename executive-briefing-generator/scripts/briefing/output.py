@@ -0,0 +1,52 @@
+"""
+Output modes for the generated PDFs.
+
+compact_output() is the switch behind the generators' --compact flag: Flate-compressed
+page streams written as binary instead of ASCII85 text (which adds a quarter to every
+stream and image). See pdf_size.py for the size report and budgets.
+
+deterministic_output() is behind --deterministic: ReportLab normally stamps the current
+time as CreationDate/ModDate and derives the trailer /ID from it, so two renders of the
+same content never match byte for byte. Inside the block the timestamp is pinned
+(SOURCE_DATE_EPOCH if set, else 2000-01-01 UTC), so the ID is a digest of the document
+alone and identical input gives identical bytes, which is what pdf_cache.PdfCache and
+ETags rely on. The cover's report date is content: pin it with 'report_date' too, or
+it is today's.
+"""
+
+from contextlib import contextmanager
+
+@contextmanager
+def compact_output():
+    """Compressed, binary (non-ASCII85) streams for documents created inside the block"""
+    from reportlab import rl_config
+
+    saved = rl_config.pageCompression, rl_config.useA85
+    rl_config.pageCompression, rl_config.useA85 = 1, 0
+    try:
+        yield
+    finally:
+        rl_config.pageCompression, rl_config.useA85 = saved
+
+@contextmanager
+def deterministic_output():
+    """Pinned timestamps and document IDs for documents created inside the block"""
+    from reportlab import rl_config
+
+    saved = rl_config.invariant
+    rl_config.invariant = 1
+    try:
+        yield
+    finally:
+        rl_config.invariant = saved
+
+def output_mode(compact=False, deterministic=False):
+    """compact_output() and/or deterministic_output() as one context manager"""
+    from contextlib import ExitStack
+
+    stack = ExitStack()
+    if compact:
+        stack.enter_context(compact_output())
+    if deterministic:
+        stack.enter_context(deterministic_output())
+    return stack
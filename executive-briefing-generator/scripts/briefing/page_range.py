@@ -0,0 +1,137 @@
+"""
+Partial renders: one page or section range of a briefing, on the pages it has in the
+full document.
+
+Where a page breaks depends on everything laid out before it, so the pages ahead of
+the range still have to be paginated, but they don't have to be drawn. PageRange.run
+drives doc.build as usual, except that frames place each flowable without drawing it
+(a preflight.LayoutPass) and remember where it went. When a page ends it is either in
+the range, and its placements are drawn then, in order, onto a page that is kept; or
+it isn't, and the canvas throws it away. Once the range is complete the rest of the story
+is dropped, so pages after it are never laid out at all.
+
+The range is given as pages (first, last), numbered as in the full document, or as
+sections (first, last) named as in build_document: 'cover', a section id,
+'inventory_appendix', 'closing'. A section range covers every page those sections draw
+on, including pages they share with their neighbours; spacers don't count, so a
+section whose leading spacer is the last thing on a page doesn't pull that page in.
+
+The PDF holds only the range, with page labels numbering it as in the full document:
+a viewer shows pages 6-8, not 1-3. With an IncrementalLayout, sections before the range
+that haven't changed since its render are replayed rather than laid out (see
+incremental.py), which skips their pagination too; a partial render only reads it.
+"""
+
+from reportlab.pdfbase.pdfdoc import PDFPageLabel
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Spacer
+
+from .inventory_table import CompressedPageCanvas
+from .preflight import LayoutPass
+
+class PageRangeCanvas(Canvas):
+    """Canvas that writes the pages flagged keep and forgets the others"""
+
+    def __init__(self, *args, **kwargs):
+        Canvas.__init__(self, *args, **kwargs)
+        self.keep = False  # Set for the current page before it ends
+        self.kept = []     # Page numbers (in the full document) written
+
+    def showPage(self):
+        if not self.keep:
+            self._startPage()
+            return
+        if not self.kept:
+            self.addPageLabel(0, PDFPageLabel.ARABIC, self._pageNumber)
+        self.kept.append(self._pageNumber)
+        self.keep = False
+        super().showPage()
+
+    def save(self):
+        if not self.kept:
+            raise ValueError(f"the requested range is past the end of the document "
+                             f"({self._pageNumber - 1} pages)")
+        super().save()
+
+class CompressedPageRangeCanvas(PageRangeCanvas, CompressedPageCanvas):
+    """PageRangeCanvas deflating kept pages as they end, for briefings with an inventory appendix"""
+
+class PageRange(LayoutPass):
+    """Lays out a whole story but draws and writes only one range of its pages"""
+
+    def __init__(self, pages=None, sections=None):
+        if (pages is None) == (sections is None):
+            raise ValueError("give either a page range or a section range")
+        if pages is not None and not 1 <= pages[0] <= pages[1]:
+            raise ValueError(f"invalid page range {pages[0]}-{pages[1]}")
+        super().__init__()
+        self.pages = pages
+        self.sections = sections
+        self._wanted = set() # Sections whose pages are kept (section ranges)
+        self._after = set()  # Sections after the range (section ranges)
+        self._placed = []    # (flowable, canvas, x, y, _sW) on the current page, not drawn yet
+        self._draws = False  # A wanted section drew on the current page
+        self._done = False
+
+    def _resolve_sections(self):
+        unknown = [name for name in self.sections if name not in self._order]
+        if unknown:
+            raise ValueError(f"no section {unknown[0]!r} in this briefing; "
+                             f"sections are {', '.join(self._order)}")
+        first, last = (self._order.index(name) for name in self.sections)
+        if first > last:
+            raise ValueError(f"section {self.sections[0]!r} comes after {self.sections[1]!r}")
+        self._wanted = set(self._order[first:last + 1])
+        self._after = set(self._order[last + 1:])
+
+    def _keep(self, page):
+        if self.pages is not None:
+            return self.pages[0] <= page <= self.pages[1]
+        return self._draws
+
+    def _drawn(self, doc, flowable, draws):
+        self._placed += [(flowable,) + draw for draw in draws]
+        if self._section in self._wanted and not isinstance(flowable, Spacer):
+            self._draws = True
+
+    def _handle_flowable(self, doc, flowables, handle):
+        if flowables is not doc._hanging:
+            if self._done:
+                del flowables[:]  # Ends doc.build; the page in progress is discarded
+                return
+            self._section = self.owner(flowables[0], self._section)
+            if self._section in self._after and doc.canv.kept and not self._draws:
+                self._done = True  # The range ended with the previous page
+                del flowables[:]
+                return
+        code = doc.canv._code
+        length = len(code)
+        handle(flowables)
+        # Replayed sections draw straight onto the page rather than being placed
+        if self._section in self._wanted and doc.canv._code is code and len(code) > length:
+            self._draws = True
+
+    def _end_page(self, doc, end):
+        keep = self._keep(doc.page)
+        if keep:
+            for flowable, canvas, x, y, sW in self._placed:
+                flowable.drawOn(canvas, x, y, _sW=sW)
+        elif doc.canv.kept and self.sections is not None:
+            self._done = True  # Past the last page a wanted section drew on
+        self._placed = []
+        self._draws = False
+        doc.canv.keep = keep
+        end()
+        if self.pages is not None and doc.page >= self.pages[1]:
+            self._done = True
+
+    def run(self, doc, story, canvasmaker=PageRangeCanvas):
+        """Build story on doc, writing only the range; returns {'pages', 'sections'}.
+
+        pages lists the page numbers written, sections the page each section laid out
+        starts on (sections replayed by an IncrementalLayout aren't placed, so aren't listed).
+        """
+        if self.sections is not None:
+            self._resolve_sections()
+        self.build(doc, story, canvasmaker=canvasmaker)
+        return {'pages': doc.canv.kept, 'sections': self.starts}
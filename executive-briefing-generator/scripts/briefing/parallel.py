@@ -0,0 +1,301 @@
+"""
+Parallel briefing renders: parts of one briefing laid out in worker processes and
+merged into a single PDF.
+
+The story is first cut at its hard page breaks: everything between two PageBreaks (the
+cover; the sections up to the inventory appendix; the appendix; the sections after it
+and the closing) starts at the top of a fresh page whatever came before it. Each part
+is then cut again:
+
+Runs of sections are cut at section boundaries, one group of sections per worker. A
+section flows on from the one before it, so each worker paginates its part from the
+start without drawing and draws only its group's pages (a page range, see
+page_range.py); a page two groups share is drawn by both and kept once when merging.
+
+The inventory appendix is cut into slices of slice_pages pages. Its page breaks depend
+only on row heights: a page holds the repeated header and then rows while they fit, and
+a row's height depends only on its own cells. So workers measure the rows in batches of
+MEASURE_ROWS (InventoryTable.row_heights), and the parent finds each page break by
+adding heights, which is nothing next to laying the rows out, and hands every slice to a
+worker as soon as its pages are known. A slice starts on a fresh page with the same rows
+as in a serial render, so it breaks after the same rows again. Slices carry one row more
+than they keep, so their last page is split off the table exactly as in a serial render;
+the page that extra row spills onto is dropped when merging. The inventory is read
+lazily; only rows not yet handed to a slice are held, and reading waits while
+MAX_PENDING jobs per worker are still queued, so a large export is never in memory at
+once.
+
+Parts are merged with pypdf in page order, with an outline entry (bookmark) per section
+at the page it starts on and page labels numbering the merged pages 1..n.
+"""
+
+import html
+import io
+import itertools
+import os
+import re
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Flowable, PageBreak
+
+from . import worker
+from .components import create_inventory_table
+from .content import load_content
+from .document import briefing_doc, build_document
+from .inventory_table import CompressedPageCanvas, InventoryTable
+from .output import output_mode
+from .page_range import PageRange, PageRangeCanvas
+from .preflight import Preflight
+from .render_trace import RenderTrace, SectionSpans
+from .theme import create_styles
+
+SLICE_PAGES = 40     # Appendix pages per worker job
+MEASURE_ROWS = 1000  # Inventory rows per row-height measuring job
+MAX_PENDING = 2      # Jobs per worker queued or running before the inventory is read further
+
+def split_parts(story):
+    """Story flowables between hard page breaks; each part starts on a fresh page"""
+    parts = [[]]
+    for flowable in story:
+        if isinstance(flowable, PageBreak):
+            parts.append([])
+        else:
+            parts[-1].append(flowable)
+    return [part for part in parts if part]
+
+def _inventory_table(part):
+    return next((f for f in part if isinstance(f, InventoryTable)), None)
+
+def _render_part(content, index, appendix, rows=None, first_row=0, compact=False, lookahead=False,
+                 deterministic=False, sections=None):
+    """(PDF bytes, page each section starts on, page numbers of the PDF's pages) for one story part
+
+    Pages are numbered within the part (within the slice, for appendix slices). For the
+    appendix part, rows replaces the inventory; slices after the first hold only table
+    rows, numbered from first_row. With lookahead the last row only pushes the table onto
+    a page that isn't kept. sections=(first, last) draws only the pages of those sections.
+    """
+    if worker.styles is None:
+        worker.init_worker()
+    trace = RenderTrace() if sections is None else PageRange(sections=sections)
+    story = []
+    build_document(story, worker.styles, content, worker.section_cache, trace, [] if appendix else None)
+    part = split_parts(story)[index]
+    out = io.BytesIO()
+    doc = briefing_doc(out)
+    if sections is not None:
+        with output_mode(compact, deterministic):
+            result = trace.run(doc, part, canvasmaker=PageRangeCanvas)
+        return out.getvalue(), result['sections'], result['pages']
+    if rows is not None:
+        table = _inventory_table(part)
+        piece = create_inventory_table(itertools.chain([table.header_row], rows), table.col_widths,
+            first_row=first_row)
+        part = part[:part.index(table)] + [piece] if first_row == 0 else [piece]
+    with output_mode(compact, deterministic):
+        trace.build(doc, part, canvasmaker=CompressedPageCanvas if appendix else Canvas)
+    sections = {name: min(s['pages']) for name, s in trace.sections.items() if s['pages']}
+    return out.getvalue(), sections, list(range(1, doc.page if lookahead else doc.page + 1))
+
+def _row_heights(col_widths, header_row, rows):
+    """Header and row heights of inventory rows, measured on a worker"""
+    table = create_inventory_table([header_row], col_widths)
+    return table.row_heights(rows)
+
+def _section_groups(names, count):
+    """names cut into at most count runs of consecutive sections, earlier runs no shorter"""
+    count = max(1, min(count, len(names)))
+    size, extra = divmod(len(names), count)
+    groups, start = [], 0
+    for i in range(count):
+        stop = start + size + (i < extra)
+        groups.append(names[start:stop])
+        start = stop
+    return groups
+
+class _Probe(Flowable):
+    """Zero-size flowable that records the height its frame offers it"""
+
+    avail = None
+
+    def wrap(self, availWidth, availHeight):
+        self.avail = availHeight
+        return 0, 0
+
+    def draw(self):
+        pass
+
+def _table_space(part, table):
+    """Height the table gets on the appendix's first page, and on each page after it"""
+    first, rest = _Probe(), _Probe()
+    story = part[:part.index(table)] + [first, PageBreak(), rest]
+    Preflight().run(briefing_doc(io.BytesIO()), story)
+    return first.avail, rest.avail
+
+class _TablePages:
+    """Page breaks of an inventory table from its row heights, as Table.split makes them"""
+
+    def __init__(self, header, first, rest):
+        self.header = header
+        self.rest = rest
+        self.page = 1          # Page of the part the table is on
+        self.avail = first
+        self.used = header
+        self.rows = 0          # Rows on the current page
+
+    def _next_page(self):
+        self.page += 1
+        self.avail, self.used, self.rows = self.rest, self.header, 0
+
+    def add(self, height):
+        """Place the next row; returns the page it ended, if it starts a new one"""
+        if self.used + height <= self.avail:
+            self.used += height
+            self.rows += 1
+            return None
+        if not self.rows:
+            if self.page > 1:
+                raise ValueError(f"an inventory row is {height:.0f}pt tall, more than a page holds")
+            self._next_page()  # Not one row fits under the intro; the table starts on the next page
+            return self.add(height)
+        ended = self.page
+        self._next_page()
+        self.add(height)
+        return ended
+
+def _measure(pool, table, inventory, max_pending):
+    """Yield (row, header height, row height) in order, measuring batches of rows on the pool ahead of use"""
+    inventory = iter(inventory)
+    measuring = deque()
+    while True:
+        while len(measuring) < max_pending:
+            rows = list(itertools.islice(inventory, MEASURE_ROWS))
+            if not rows:
+                break
+            measuring.append((rows, pool.submit(_row_heights, table.col_widths, table.header_row, rows)))
+        if not measuring:
+            return
+        rows, job = measuring.popleft()
+        header, heights = job.result()
+        for row, height in zip(rows, heights):
+            yield row, header, height
+
+def _submit_appendix(pool, content, index, part, inventory, slice_pages, compact, deterministic,
+                     max_pending):
+    """Submit the appendix as page-aligned row slices; [(job, page offset)] in page order"""
+    table = _inventory_table(part)
+    first, rest = _table_space(part, table)
+    jobs, pages = [], None
+    held, start, offset = [], 0, 0  # Rows of the slice being gathered, its first row and page offset
+
+    def submit(rows, lookahead):
+        pending = [job for job, _ in jobs if not job.done()]
+        if len(pending) >= max_pending:
+            wait(pending, return_when=FIRST_COMPLETED)
+        jobs.append((pool.submit(_render_part, content, index, True, rows, start, compact, lookahead,
+            deterministic), offset))
+
+    for number, (row, header, height) in enumerate(_measure(pool, table, inventory, max_pending)):
+        if pages is None:
+            pages = _TablePages(header, first, rest)
+        ended = pages.add(height)
+        if ended is not None and ended % slice_pages == 0:
+            submit(held + [row], True)
+            held, start, offset = [], number, ended
+        held.append(row)
+    if held or not jobs:
+        submit(held, False)
+    return jobs
+
+def _plain(text):
+    return html.unescape(re.sub(r'<[^>]+>', '', text))
+
+def outline_titles(content):
+    """Bookmark title for each section name in the briefing's story"""
+    titles = {'cover': _plain(content['organization']['name'])}
+    titles.update((s['id'], _plain(s['title'])) for s in content['sections'])
+    if 'inventory_appendix' in content:
+        titles['inventory_appendix'] = _plain(content['inventory_appendix']['title'])
+    titles['closing'] = "Methodology & Sources"
+    return titles
+
+def merge(output, results, titles):
+    """Write (part, pdf, sections, pages) results in order as one document with an outline and page labels
+
+    pages numbers each PDF page within its part; a page already written for the part
+    (shared by two section groups) is skipped.
+    """
+    from pypdf import PdfReader, PdfWriter
+
+    writer = PdfWriter()
+    starts = {}
+    part, base, written = None, 0, 0
+    for i, (index, pdf, sections, pages) in enumerate(results):
+        reader = PdfReader(io.BytesIO(pdf))
+        if i == 0 and reader.metadata:
+            writer.add_metadata(reader.metadata)
+        if index != part:
+            part, base, written = index, len(writer.pages), 0
+        writer.append(reader, pages=[n for n, page in enumerate(pages) if page > written])
+        written = max([written] + pages)
+        for name, page in sections.items():
+            starts.setdefault(name, base + page - 1)
+    for name, page in starts.items():
+        writer.add_outline_item(titles.get(name, name), page)
+    writer.set_page_label(0, len(writer.pages) - 1, style='/D')
+    writer.page_mode = '/UseOutlines'
+    writer.write(output)
+    return {'parts': len(results), 'pages': len(writer.pages), 'sections': starts}
+
+def render_parallel(output, content=None, inventory=None, workers=None, section_cache_dir=None,
+                    compact=False, slice_pages=SLICE_PAGES, pool=None, deterministic=False):
+    """Render one briefing across worker processes and merge it into output (path or file object).
+
+    Takes the same content and inventory as build_pdf; the inventory is read lazily
+    and handed out in slices. pool is an executor from start_pool() to reuse warm
+    workers across renders; without one a pool of workers processes is started and shut
+    down again. deterministic pins every part's timestamp and ID (see
+    output.deterministic_output); the merge adds none of its own. Returns {'parts',
+    'pages', 'sections'}: the jobs merged, and each section's 0-based start page.
+    """
+    if content is None:
+        content = load_content()
+    appendix = inventory is not None and 'inventory_appendix' in content
+    count = workers or os.cpu_count() or 1
+    spans = SectionSpans()
+    story = []
+    build_document(story, create_styles(), content, trace=spans, inventory=[] if appendix else None)
+    own_pool = pool is None
+    if own_pool:
+        pool = start_pool(workers, section_cache_dir)
+    try:
+        jobs = []  # (part, job, page offset)
+        for index, part in enumerate(split_parts(story)):
+            if appendix and _inventory_table(part) is not None:
+                jobs += [(index, job, offset) for job, offset in _submit_appendix(pool, content, index, part,
+                    inventory, slice_pages, compact, deterministic, MAX_PENDING * count)]
+                continue
+            names = list(dict.fromkeys(filter(None, map(spans.owner, part))))
+            groups = _section_groups(names, count)
+            if len(groups) < 2:
+                jobs.append((index, pool.submit(_render_part, content, index, appendix, compact=compact,
+                    deterministic=deterministic), 0))
+                continue
+            jobs += [(index, pool.submit(_render_part, content, index, appendix, compact=compact,
+                deterministic=deterministic, sections=(group[0], group[-1])), 0) for group in groups]
+        results = []
+        for index, job, offset in jobs:
+            pdf, sections, pages = job.result()
+            results.append((index, pdf, {name: offset + page for name, page in sections.items()},
+                [offset + page for page in pages]))
+    finally:
+        if own_pool:
+            pool.shutdown()
+    return merge(output, results, outline_titles(content))
+
+def start_pool(workers=None, section_cache_dir=None):
+    """Process pool whose workers have ReportLab loaded and the stylesheet built"""
+    return ProcessPoolExecutor(max_workers=workers, initializer=worker.init_worker,
+        initargs=(section_cache_dir,))
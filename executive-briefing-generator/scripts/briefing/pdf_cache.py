@@ -0,0 +1,168 @@
+"""
+Content-addressed store of rendered PDFs.
+
+With deterministic output (see output.deterministic_output) a briefing's bytes are a
+function of its inputs, so a render can be stored under a hash of them and served
+again without laying anything out: repeat downloads, re-sends of the same briefing and
+re-runs of a batch. render_key() hashes
+
+  - the content document (after binding a template's values), with the report date
+    resolved, so an undated briefing rendered tomorrow gets a new key;
+  - the inventory export's bytes, when there is one;
+  - the render options: whether a section cache and the parallel renderer were used
+    (both change the bytes, if not the pages), compact, sample...;
+  - SOURCE_DATE_EPOCH, when it is set: deterministic output stamps that time instead
+    of its fixed default, so the same inputs give different bytes;
+  - layout_fingerprint(): the layout code in this package, every file under assets/
+    and the installed ReportLab and pypdf versions, so changing any of them misses
+    the cache instead of serving a stale PDF.
+
+The key doubles as the PDF's ETag. Entries are <key>.pdf files evicted
+least-recently-used first once the directory grows past max_bytes (evict_lru(), shared
+with section_cache.SectionCache); several processes and threads can share one directory.
+
+Standard library only, like content.py: a server can answer a cache hit without ever
+importing ReportLab.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+from .content import report_date
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(PACKAGE_DIR, '..', '..', 'assets')
+MAX_BYTES = 512 * 1024 * 1024
+
+_fingerprint = None
+
+def _hash_file(digest, path):
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+
+def _installed_version(package):
+    """package's dist-info directory name (e.g. reportlab-5.0.1.dist-info), found without importing it.
+
+    importlib.metadata would do, but importing it costs more than the cache hit it serves.
+    """
+    from importlib.util import find_spec
+
+    spec = find_spec(package)
+    if spec is None or not spec.submodule_search_locations:
+        return f"{package} missing"
+    site = os.path.dirname(spec.submodule_search_locations[0])
+    dists = sorted(name for name in os.listdir(site)
+                   if name.lower().startswith(f"{package}-") and name.endswith('.dist-info'))
+    return dists[-1] if dists else f"{package} (no dist-info)"
+
+def layout_fingerprint():
+    """Hash of the layout code, the assets and the PDF library versions; computed once per process"""
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256()
+        sources = sorted(name for name in os.listdir(PACKAGE_DIR) if name.endswith('.py'))
+        assets = sorted(os.path.relpath(os.path.join(root, name), ASSETS_DIR)
+                        for root, _, names in os.walk(ASSETS_DIR) for name in names)
+        for directory, names in ((PACKAGE_DIR, sources), (ASSETS_DIR, assets)):
+            for name in names:
+                digest.update(name.encode('utf-8') + b'\0')
+                _hash_file(digest, os.path.join(directory, name))
+        for package in ('reportlab', 'pypdf'):
+            digest.update(_installed_version(package).encode('utf-8') + b'\0')
+        _fingerprint = digest.hexdigest()
+    return _fingerprint
+
+def write_atomic(path, data):
+    """Write bytes to path through a unique temporary file, so concurrent writers never interleave"""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def evict_lru(directory, suffix, max_bytes):
+    """Delete the least recently used *suffix files in directory until it holds max_bytes at most"""
+    entries = []
+    for name in os.listdir(directory):
+        if name.endswith(suffix):
+            try:
+                st = os.stat(os.path.join(directory, name))
+            except OSError:
+                continue  # Evicted by another worker meanwhile
+            entries.append((st.st_mtime, st.st_size, name))
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            pass
+        total -= size
+
+def render_key(content, inventory=None, section_cache=False, parallel=False, compact=False, **options):
+    """Cache key (hex sha256) for rendering content.
+
+    inventory is an export path; section_cache and parallel say whether the render used
+    a section cache and render_parallel. Every caller hashes these the same way, so a PDF
+    cached by one entry point is found by the others; options are the rest (sample=True...).
+    """
+    digest = hashlib.sha256()
+    options.update(section_cache=bool(section_cache), parallel=bool(parallel), compact=bool(compact))
+    payload = {'content': content, 'report_date': report_date(content), 'options': options,
+               'layout': layout_fingerprint()}
+    if os.environ.get('SOURCE_DATE_EPOCH'):
+        payload['source_date_epoch'] = os.environ['SOURCE_DATE_EPOCH']
+    digest.update(json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+    if inventory is not None:
+        digest.update(b'\0inventory\0')
+        _hash_file(digest, inventory)
+    return digest.hexdigest()
+
+class PdfCache:
+    """Disk-backed LRU store of rendered PDFs keyed by render_key()"""
+
+    def __init__(self, directory, max_bytes=MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def get(self, key):
+        """Cached PDF bytes for key, or None"""
+        try:
+            with open(self.path(key), 'rb') as f:
+                pdf = f.read()
+            os.utime(self.path(key))  # Mark as recently used
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return pdf
+
+    def put(self, key, pdf):
+        """Store PDF bytes under key, then evict down to max_bytes"""
+        write_atomic(self.path(key), pdf)
+        evict_lru(self.directory, '.pdf', self.max_bytes)
+
+    def fetch(self, key, render):
+        """(PDF bytes, hit): the cached PDF, or render() stored under key"""
+        pdf = self.get(key)
+        if pdf is not None:
+            return pdf, True
+        pdf = render()
+        self.put(key, pdf)
+        return pdf, False
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,168 @@
+"""
+Layout-only dry run: pagination without drawing or writing a PDF.
+
+Preflight.run(doc, story) drives doc.build as usual, so every flowable is wrapped and
+split exactly as in a real render, but frames place flowables without drawing them and
+the canvas throws each finished page away instead of serializing it. The report has:
+  pages      page count, and for each page the points of frame height used and left free
+  sections   the page each section starts on (sections are spans, as in render_trace)
+  warnings   pages less than min_fill full, with what ended them: an explicit page
+             break, or the flowable that didn't fit and was pushed to the next page
+
+preflight.py checks content documents in bulk with it.
+"""
+
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import PageBreak, Paragraph
+from reportlab.platypus.frames import Frame
+
+from .render_trace import SectionSpans
+
+MIN_FILL = 0.25  # Pages less full than this are reported
+
+class _DiscardCanvas(Canvas):
+    """Canvas that forgets every page instead of building PDF objects for it"""
+
+    def showPage(self):
+        self._startPage()
+
+    def save(self):
+        pass
+
+def describe(flowable):
+    """Short human-readable description of a flowable for reports"""
+    if isinstance(flowable, PageBreak):
+        return "page break"
+    name = type(flowable).__name__
+    if isinstance(flowable, Paragraph):
+        text = flowable.getPlainText()
+        return f'{name} "{text[:50]}{"..." if len(text) > 50 else ""}"'
+    height = getattr(flowable, 'height', None)
+    return f"{name} ({height:.0f}pt tall)" if isinstance(height, (int, float)) else name
+
+class LayoutPass(SectionSpans):
+    """doc.build with frames that place flowables without drawing them.
+
+    Tracks the section being laid out and the page each section starts on (starts).
+    Subclasses hook in through _drawn, called with each placed flowable's pending
+    drawOn calls, and through _handle_flowable and _end_page, which wrap the
+    document's own handlers. build() restores the document and its frames afterwards.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.starts = {}     # section -> first page, for sections laid out
+        self._section = None
+
+    def _drawn(self, doc, flowable, draws):
+        """flowable was placed on the current page; draws are its (canvas, x, y, _sW) calls"""
+
+    def _handle_flowable(self, doc, flowables, handle):
+        if flowables is not doc._hanging:
+            self._section = self.owner(flowables[0], self._section)
+        handle(flowables)
+
+    def _end_page(self, doc, end):
+        end()
+
+    def _add(self, doc, flowable, canv, trySplit=0):
+        # Frame._add places and then draws; an instance attribute defers just the drawing
+        draws = []
+        flowable.drawOn = lambda canvas, x, y, _sW=0: draws.append((canvas, x, y, _sW))
+        try:
+            result = Frame._add(doc.frame, flowable, canv, trySplit)
+        finally:
+            del flowable.drawOn
+        if draws:
+            if self._section is not None:
+                self.starts.setdefault(self._section, doc.page)
+            self._drawn(doc, flowable, draws)
+        return result
+
+    def build(self, doc, story, **kwargs):
+        handle_flowable = doc.handle_flowable
+        begin, end = doc.handle_pageBegin, doc.handle_pageEnd
+
+        def page_begin():
+            begin()
+            doc.frame.add = lambda flowable, canv, trySplit=0: self._add(doc, flowable, canv, trySplit)
+
+        doc.handle_flowable = lambda flowables: self._handle_flowable(doc, flowables, handle_flowable)
+        doc.handle_pageBegin = page_begin
+        doc.handle_pageEnd = lambda: self._end_page(doc, end)
+        try:
+            doc.build(story, **kwargs)
+        finally:
+            del doc.handle_flowable, doc.handle_pageBegin, doc.handle_pageEnd
+            for template in doc.pageTemplates:
+                for frame in template.frames:
+                    frame.__dict__.pop('add', None)
+
+class Preflight(LayoutPass):
+    """Page and section layout of one document, collected without drawing it"""
+
+    def __init__(self, label='briefing', min_fill=MIN_FILL):
+        super().__init__()
+        self.label = label
+        self.min_fill = min_fill
+        self.pages = []      # {'page', 'used_pt', 'free_pt', 'fill', 'ended_by'}
+        self._current = None
+        self._on_page = None
+
+    def _handle_flowable(self, doc, flowables, handle):
+        if flowables is not doc._hanging:
+            self._current = flowables[0]
+        super()._handle_flowable(doc, flowables, handle)
+
+    def _end_page(self, doc, end):
+        frame = doc.frame
+        height = frame._y2 - frame._topPadding - frame._y1p
+        free = max(0.0, frame._y - frame._y1p)
+        self.pages.append({
+            'page': doc.page,
+            'used_pt': round(height - free, 1),
+            'free_pt': round(free, 1),
+            'fill': round((height - free) / height, 3),
+            'ended_by': describe(self._current) if self._current is not None else None,
+        })
+        if self._on_page is not None:
+            self._on_page(self.pages[-1])
+        end()
+
+    def run(self, doc, story, on_page=None, **kwargs):
+        """Paginate story on doc without drawing; returns the report.
+
+        on_page, if given, is called with each page's entry as soon as the page ends.
+        """
+        self._on_page = on_page
+        self.build(doc, story, canvasmaker=_DiscardCanvas, **kwargs)
+        return self.report()
+
+    def warnings(self):
+        warnings = []
+        last = len(self.pages)
+        for page in self.pages:
+            if page['fill'] >= self.min_fill:
+                continue
+            if page['page'] == last:
+                warnings.append(f"page {page['page']} (last) is only {page['fill']:.0%} full")
+            else:
+                warnings.append(f"page {page['page']} is only {page['fill']:.0%} full; "
+                                f"ended by {page['ended_by']}")
+        return warnings
+
+    def report(self):
+        return {'label': self.label, 'page_count': len(self.pages), 'pages': self.pages,
+                'sections': self.starts, 'warnings': self.warnings()}
+
+def format_report(report):
+    lines = [f"{report['label']}: {report['page_count']} pages"]
+    starts = {}
+    for name, page in report['sections'].items():
+        starts.setdefault(page, []).append(name)
+    for page in report['pages']:
+        begins = ', '.join(starts.get(page['page'], []))
+        lines.append(f"  page {page['page']:>3}  {page['fill']:>5.0%} full  {page['free_pt']:>6.1f}pt free"
+                     + (f"  starts: {begins}" if begins else ''))
+    lines += [f"  ⚠️  {w}" for w in report['warnings']]
+    return '\n'.join(lines)
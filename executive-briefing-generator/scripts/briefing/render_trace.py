@@ -0,0 +1,164 @@
+"""
+Per-section timing trace for briefing renders.
+
+Two phases are recorded for every section (cover, each content section, closing):
+  story    building the section's flowables in build_document
+  layout   placing those flowables during doc.build, and the pages they landed on
+plus one 'write' span covering the final page end and Canvas.save().
+
+Layout is attributed without touching the story: the trace wraps the document's
+handle_flowable and looks up which section each top-level flowable came from. Split
+fragments (a paragraph continued on the next page) stay with the section being laid out.
+
+Export with write_chrome() (open in chrome://tracing or https://ui.perfetto.dev) or
+summary() for a plain-text table. Without a trace, build_document uses NO_TRACE,
+whose spans are a shared no-op context manager.
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+
+_NULL_SPAN = nullcontext()
+
+class _NoTrace:
+    """Stand-in used when tracing is off"""
+
+    def span(self, name, story):
+        return _NULL_SPAN
+
+NO_TRACE = _NoTrace()
+
+class SectionSpans:
+    """Remembers which section added each top-level flowable of a story.
+
+    build_document calls span(name, story) around each section; RenderTrace, Preflight
+    and PageRange share this bookkeeping and look flowables up with owner().
+    """
+
+    def __init__(self):
+        self._order = []     # Section names in story order
+        self._owner = {}     # id(flowable) -> section
+        self._flowables = [] # Keeps owned flowables alive so their ids aren't reused mid-build
+
+    @contextmanager
+    def span(self, name, story):
+        first = len(story)
+        yield
+        self._claim(name, story[first:])
+
+    def _claim(self, name, added):
+        for flowable in added:
+            self._owner[id(flowable)] = name
+        self._flowables.extend(added)
+        self._order.append(name)
+
+    def owner(self, flowable, default=None):
+        """The section that added flowable, or default for flowables no span added"""
+        return self._owner.get(id(flowable), default)
+
+class RenderTrace(SectionSpans):
+    """Story and layout timings per section for one document"""
+
+    def __init__(self, label='briefing'):
+        super().__init__()
+        self.label = label
+        self.events = []     # (phase, section, start, end, args)
+        self.sections = {}   # section -> {'flowables', 'story_ms', 'layout_ms', 'pages'}
+
+    def _section(self, name):
+        return self.sections.setdefault(name,
+            {'flowables': 0, 'story_ms': 0.0, 'layout_ms': 0.0, 'pages': set()})
+
+    @contextmanager
+    def span(self, name, story):
+        """Time building one section's flowables and remember which ones it added"""
+        first = len(story)
+        start = time.perf_counter()
+        yield
+        end = time.perf_counter()
+        added = story[first:]
+        self._claim(name, added)
+        section = self._section(name)
+        section['flowables'] += len(added)
+        section['story_ms'] += (end - start) * 1000
+        self.events.append(('story', name, start, end, {'flowables': len(added)}))
+
+    def build(self, doc, story, **kwargs):
+        """Run doc.build(story, **kwargs), attributing layout time and pages to sections"""
+        original = doc.handle_flowable
+        state = {'section': None, 'start': None, 'done': time.perf_counter()}
+
+        def close_layout():
+            name = state['section']
+            if name is not None:
+                self.sections[name]['layout_ms'] += (state['done'] - state['start']) * 1000
+                self.events.append(('layout', name, state['start'], state['done'], {}))
+
+        def handle_flowable(flowables):
+            name = self.owner(flowables[0]) if flowables else None
+            if name is not None and name != state['section']:
+                close_layout()
+                state['section'], state['start'] = name, state['done']
+            original(flowables)
+            if state['section'] is not None and flowables is not doc._hanging:
+                self.sections[state['section']]['pages'].add(doc.page)
+            state['done'] = time.perf_counter()
+
+        doc.handle_flowable = handle_flowable
+        try:
+            doc.build(story, **kwargs)
+        finally:
+            del doc.handle_flowable  # Back to the class method
+        end = time.perf_counter()
+        close_layout()
+        self.events.append(('write', 'write', state['done'], end, {}))
+
+    def rows(self):
+        """Summary rows in document order: (section, flowables, pages, story_ms, layout_ms)"""
+        return [(name, s['flowables'], len(s['pages']), s['story_ms'], s['layout_ms'])
+                for name, s in self.sections.items()]
+
+    def summary(self):
+        """Plain-text table of per-section timings"""
+        lines = [f"{'section':<28}{'flowables':>10}{'pages':>7}{'story ms':>10}{'layout ms':>11}"]
+        totals = [0, 0.0, 0.0]
+        for name, flowables, pages, story_ms, layout_ms in self.rows():
+            lines.append(f"{name:<28}{flowables:>10}{pages:>7}{story_ms:>10.2f}{layout_ms:>11.2f}")
+            totals[0] += flowables
+            totals[1] += story_ms
+            totals[2] += layout_ms
+        write = [e for e in self.events if e[0] == 'write']
+        if write:
+            lines.append(f"{'(page end + save)':<28}{'':>10}{'':>7}{'':>10}"
+                         f"{(write[-1][3] - write[-1][2]) * 1000:>11.2f}")
+        lines.append(f"{'total':<28}{totals[0]:>10}{'':>7}{totals[1]:>10.2f}{totals[2]:>11.2f}")
+        return '\n'.join(lines)
+
+    def chrome_events(self):
+        """Trace-event 'complete' events; story and layout on separate rows"""
+        if not self.events:
+            return []
+        origin = min(start for _, _, start, _, _ in self.events)
+        pid = os.getpid()
+        tids = {'story': 1, 'layout': 2, 'write': 2}
+        events = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': 1, 'args': {'name': f'{self.label} story'}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': 2, 'args': {'name': f'{self.label} doc.build'}},
+        ]
+        for phase, name, start, end, args in self.events:
+            if phase == 'layout':
+                args = dict(args, pages=sorted(self.sections[name]['pages']))
+            events.append({
+                'name': name, 'cat': phase, 'ph': 'X', 'pid': pid, 'tid': tids[phase],
+                'ts': round((start - origin) * 1e6, 1),
+                'dur': round((end - start) * 1e6, 1),
+                'args': args,
+            })
+        return events
+
+    def write_chrome(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.chrome_events(), 'displayTimeUnit': 'ms'}, f, indent=1)
+        return path
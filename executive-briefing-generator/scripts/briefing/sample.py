@@ -0,0 +1,92 @@
+"""
+SAMPLE preview of the Executive Briefing v3: the diagonal SAMPLE watermark stamped
+onto the clean briefing render. generate_briefing_sample.py is its entry point.
+
+There is no second layout pass: the preview is the paid briefing's pages with the
+mark drawn underneath, so it can never drift from the customer version's content.
+In compact mode the mark is one Form XObject shared by every page instead of a copy
+of its drawing operators per page. Needs pypdf (pip install pypdf).
+"""
+
+import io
+from contextlib import nullcontext
+
+from reportlab.lib.pagesizes import letter
+from reportlab.pdfgen.canvas import Canvas
+
+from .document import add_watermark
+from .output import compact_output
+
+_watermarks = {}
+
+def watermark_pdf(pagesize=letter, compact=False):
+    """One-page PDF holding only the SAMPLE mark, built once per page size"""
+    pdf = _watermarks.get((pagesize, compact))
+    if pdf is None:
+        with compact_output() if compact else nullcontext():
+            buffer = io.BytesIO()
+            canvas = Canvas(buffer, pagesize=pagesize)
+            add_watermark(canvas, None)
+            canvas.showPage()
+            canvas.save()
+        pdf = _watermarks[(pagesize, compact)] = buffer.getvalue()
+    return pdf
+
+def _underlay_form(writer, stamp):
+    """Draw stamp under every page of writer through one shared Form XObject"""
+    from pypdf.generic import (ArrayObject, DecodedStreamObject, DictionaryObject,
+        IndirectObject, NameObject, RectangleObject)
+
+    form = DecodedStreamObject()
+    form.set_data(stamp.get_contents().get_data())
+    form.update({
+        NameObject('/Type'): NameObject('/XObject'),
+        NameObject('/Subtype'): NameObject('/Form'),
+        NameObject('/BBox'): RectangleObject(stamp.mediabox),
+        NameObject('/Resources'): stamp['/Resources'].clone(writer),
+    })
+    form_ref = writer._add_object(form.flate_encode())
+    draw = DecodedStreamObject()
+    draw.set_data(b'q /QSLSample Do Q\n')
+    draw_ref = writer._add_object(draw.flate_encode())
+
+    for page in writer.pages:
+        resources = page.setdefault(NameObject('/Resources'), DictionaryObject()).get_object()
+        xobjects = resources.setdefault(NameObject('/XObject'), DictionaryObject()).get_object()
+        xobjects[NameObject('/QSLSample')] = form_ref
+        contents = page.raw_get('/Contents')  # Keep the reference; streams must stay indirect
+        if isinstance(contents.get_object(), ArrayObject):
+            existing = list(contents.get_object())
+        else:
+            existing = [contents if isinstance(contents, IndirectObject) else writer._add_object(contents)]
+        # Content streams run in order, so drawing the mark first puts it underneath
+        page[NameObject('/Contents')] = ArrayObject([draw_ref] + existing)
+
+def stamp_sample(clean_pdf, output, compact=False):
+    """Underlay the SAMPLE mark on every page of an already-rendered clean briefing.
+
+    clean_pdf is a path, bytes or a binary file object; output is a path or file object.
+    """
+    from pypdf import PdfReader, PdfWriter
+
+    if isinstance(clean_pdf, (bytes, bytearray)):
+        clean_pdf = io.BytesIO(clean_pdf)
+    reader = PdfReader(clean_pdf)
+    writer = PdfWriter(clone_from=reader)
+    # clone_from writes %PDF-1.3; the mark's /ca constant alpha needs 1.4, like the original
+    writer.pdf_header = max(reader.pdf_header.encode('ascii'), b'%PDF-1.4')
+    stamp = PdfReader(io.BytesIO(watermark_pdf(compact=compact))).pages[0]
+    if compact:
+        _underlay_form(writer, stamp)
+        writer.compress_identical_objects()  # e.g. the mark's Helvetica-Bold vs the briefing's
+    else:
+        for page in writer.pages:
+            page.merge_page(stamp, over=False)  # Under the content, like the old onPage hook
+            page.compress_content_streams()
+    if isinstance(output, str):
+        with open(output, 'wb') as f:
+            writer.write(f)
+    else:
+        buffer = io.BytesIO()  # pypdf needs to seek; pipes and sockets can't
+        writer.write(buffer)
+        output.write(buffer.getvalue())
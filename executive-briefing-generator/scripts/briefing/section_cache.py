@@ -0,0 +1,166 @@
+"""
+Content-hash keyed cache of pre-rendered static briefing sections.
+
+A static section (the NIST standards table, "Why Quantum Shield Labs", methodology,
+sources, disclaimer...) is laid out once on a scratch canvas exactly as wide as the
+frame; what gets cached is the resulting PDF drawing operators, the section's height
+and the fonts it uses. Documents containing the same section get a fixed-size
+placeholder flowable instead: doc.build only has to place a box, and when the box is
+drawn the recorded operators are replayed into the current page. A placeholder is
+only replayed where the whole section fits the space left in the frame; anywhere else
+it hands its flowables back to doc.build, which lays them out inline, splitting them
+across the page break as it would without a cache. Pagination, page numbers and flow
+are therefore the same with the cache as without it.
+
+Entries live on disk as <sha256>.json and are evicted least-recently-used first once
+the directory grows past max_bytes. Sections that can't be replayed (embedded fonts)
+are stored as negative entries, so they aren't recorded again on every build.
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+
+from reportlab.pdfbase.pdfmetrics import standardFonts
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Flowable
+from reportlab.platypus.doctemplate import NullActionFlowable
+from reportlab.platypus.frames import Frame
+
+from .pdf_cache import evict_lru, write_atomic
+
+_MEASURE_HEIGHT = 10000  # Tall enough for any section that could fit on one page
+_FONT_REF = re.compile(r'/(F\d+)(?= [\d.]+ Tf)')
+
+def section_key(material, fingerprint):
+    """Hash section content together with the style/layout fingerprint"""
+    payload = json.dumps({'material': material, 'style': fingerprint}, sort_keys=True,
+        ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def replay_code(canvas, code, fonts):
+    """Append recorded operators to canvas, mapping recorded font names to this document's"""
+    doc = canvas._doc
+    internal = {}
+
+    def remap(m):
+        ref = m.group(1)
+        if ref not in internal:  # Register fonts in the order the operators use them
+            internal[ref] = doc.getInternalFontName(fonts[ref]).lstrip('/')
+        return '/' + internal[ref]
+
+    canvas._code.extend(_FONT_REF.sub(remap, op) for op in code)
+
+def _frame_layout(flowables, canvas, width, height):
+    """Add flowables to a padding-free frame and return it"""
+    frame = Frame(0, 0, width, height, leftPadding=0, rightPadding=0,
+        topPadding=0, bottomPadding=0, showBoundary=0)
+    for flowable in flowables:
+        if not frame.add(flowable, canvas):
+            raise ValueError("cached section does not fit in a single frame")
+    return frame
+
+def record_section(flowables, width):
+    """Lay flowables out once and capture their drawing operators, or None if not replayable"""
+    canvas = Canvas(io.BytesIO())
+    frame = _frame_layout(flowables, canvas, width, _MEASURE_HEIGHT)
+    fonts = {internal.lstrip('/'): name for name, internal in canvas._doc.fontMapping.items()}
+    if any(name not in standardFonts for name in fonts.values()):
+        return None  # Embedded/subset fonts carry per-document state we can't replay
+    space_after = flowables[-1].getSpaceAfter()
+    height = _MEASURE_HEIGHT - frame._y - space_after
+    return {
+        'width': width,
+        'height': height,
+        'space_before': flowables[0].getSpaceBefore(),
+        'space_after': space_after,
+        'fonts': fonts,
+        # Shift the recording down so the section's bottom edge sits at y=0
+        'code': ['q', f'1 0 0 1 0 {height - _MEASURE_HEIGHT:.6f} cm'] + canvas._code + ['Q'],
+    }
+
+class CachedSection(Flowable):
+    """Fixed-size placeholder that replays a recorded section when drawn"""
+
+    def __init__(self, key, entry, build):
+        Flowable.__init__(self)
+        self.key = key
+        self.entry = entry
+        self.build = build  # build(story) appends the section's flowables, for inline layout
+        self.width = entry['width']
+        self.height = entry['height']
+        self.spaceBefore = entry['space_before']
+        self.spaceAfter = entry['space_after']
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        # Only asked when the section doesn't fit what is left of the frame. doc.build
+        # adds a split's first part directly, but queues an action flowable's followers
+        # like any other story flowables: keepWithNext, splitting and frame breaks then
+        # apply to the section's flowables exactly as in an inline render.
+        story = [NullActionFlowable()]
+        self.build(story)
+        return story
+
+    def draw(self):
+        replay_code(self.canv, self.entry['code'], self.entry['fonts'])
+
+class SectionCache:
+    """Disk-backed LRU store of recorded static sections"""
+
+    def __init__(self, directory, max_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}  # key -> entry, for this process
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _load(self, key):
+        entry = self._entries.get(key)
+        try:
+            if entry is None:
+                with open(self._path(key), encoding='utf-8') as f:
+                    entry = self._entries[key] = json.load(f)
+            os.utime(self._path(key))  # Mark as recently used
+        except (OSError, ValueError):
+            pass  # Evicted on disk; an in-process copy is still valid
+        return entry
+
+    def _store(self, key, entry):
+        write_atomic(self._path(key), json.dumps(entry).encode('utf-8'))
+        evict_lru(self.directory, '.json', self.max_bytes)
+
+    def flowable(self, material, build, width, fingerprint, max_height=None):
+        """Placeholder for a static section, recording and caching it on a miss.
+
+        material is the JSON-able content that determines the section's text, build(story)
+        appends its flowables. Returns None when the section can't be replayed as one
+        piece (too tall for a page, or uses embedded fonts); lay it out inline then.
+        """
+        key = section_key({'material': material, 'width': width}, fingerprint)
+        entry = self._load(key)
+        if entry is None:
+            self.misses += 1
+            story = []
+            build(story)
+            entry = (record_section(story, width) if story else None) or {'replayable': False}
+            self._entries[key] = entry
+            self._store(key, entry)
+        else:
+            self.hits += 1
+        if not entry.get('replayable', True):
+            return None
+        if max_height is not None and entry['height'] > max_height:
+            return None
+        return CachedSection(key, entry, build)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,40 @@
+"""
+Interned ParagraphStyle registry shared by the briefing generators.
+
+Each distinct (name, attributes) combination is built once per process and the same
+instance is handed to every caller afterwards. ReportLab never mutates a style during
+layout, so sharing them across all documents in a batch is safe.
+"""
+
+from collections import Counter
+
+from reportlab.lib.styles import ParagraphStyle
+
+_styles = {}
+_created = Counter()
+_reused = Counter()
+
+def get_style(name, **attrs):
+    """Return the interned ParagraphStyle for name + attrs, creating it on first use"""
+    key = (name, tuple(sorted(attrs.items())))
+    style = _styles.get(key)
+    if style is None:
+        style = _styles[key] = ParagraphStyle(name=name, **attrs)
+        _created[name] += 1
+    else:
+        _reused[name] += 1
+    return style
+
+def style_stats():
+    """Allocation counters: how many styles were built vs. served from the registry"""
+    return {
+        'created': sum(_created.values()),
+        'reused': sum(_reused.values()),
+        'by_name': {name: {'created': _created[name], 'reused': _reused[name]}
+                    for name in sorted(set(_created) | set(_reused))},
+    }
+
+def reset_stats():
+    """Zero the counters without dropping interned styles (e.g. between profiling runs)"""
+    _created.clear()
+    _reused.clear()
@@ -0,0 +1,108 @@
+"""
+Compiled briefing templates.
+
+A template is a content document whose strings may hold {name} or {name:spec}
+placeholders (str.format syntax; {{ and }} are literal braces), plus a "variables"
+object describing every name. compile_template() parses each string once, checks that
+every placeholder is declared and every declared variable used, and validates the
+document's structure. Binding a customer's values then does no string scanning at all:
+subtrees without placeholders are shared with the template as they are, and each
+templated string is a precomputed list of literal parts and value slots that is joined
+with the formatted values.
+
+Values land in Paragraph markup, so they are XML-escaped after formatting
+("AT&T" -> "AT&amp;T"). Numbers take the placeholder's format spec ({records:,}).
+Bound documents share unchanged lists and dicts with the template; layout only reads
+content, but callers that edit a bound document should deep-copy it first.
+
+Standard library only, like content.py.
+"""
+
+import os
+from html import escape
+from string import Formatter
+
+from .content import CONTENT_DIR, validate_content
+
+DEFAULT_TEMPLATE = os.path.normpath(os.path.join(CONTENT_DIR, 'briefing_template.json'))
+
+class CompiledTemplate:
+    """A parsed, validated template; bind(values) returns a content document"""
+
+    def __init__(self, template):
+        variables = template.get('variables')
+        if not isinstance(variables, dict) or not variables:
+            raise ValueError("template has no 'variables' object declaring its placeholders")
+        self.variables = dict(variables)
+        self._slots = {}  # (name, spec) -> slot index into the formatted values
+        body = {key: value for key, value in template.items() if key != 'variables'}
+        self._bind, self._static = self._compile(body)
+        unused = set(self.variables) - {name for name, _ in self._slots}
+        if unused:
+            raise ValueError(f"template declares unused variables: {', '.join(sorted(unused))}")
+        self._slot_keys = list(self._slots)
+        validate_content(body)
+
+    def _compile(self, node):
+        """(builder, None) for a node with placeholders, else (None, node) to share as-is"""
+        if isinstance(node, str):
+            return self._compile_string(node)
+        if isinstance(node, dict):
+            entries = [(key,) + self._compile(value) for key, value in node.items()]
+            if all(build is None for _, build, _ in entries):
+                return None, node
+
+            def build_dict(formatted):
+                return {key: value if build is None else build(formatted) for key, build, value in entries}
+            return build_dict, None
+        if isinstance(node, list):
+            items = [self._compile(value) for value in node]
+            dynamic = [(i, build) for i, (build, _) in enumerate(items) if build is not None]
+            if not dynamic:
+                return None, node
+            static = [value for _, value in items]
+
+            def build_list(formatted):
+                bound = list(static)
+                for i, build in dynamic:
+                    bound[i] = build(formatted)
+                return bound
+            return build_list, None
+        return None, node
+
+    def _compile_string(self, text):
+        if '{' not in text and '}' not in text:
+            return None, text
+        parts = []
+        for literal, name, spec, conversion in Formatter().parse(text):
+            if literal:
+                parts.append(literal)
+            if name is None:
+                continue
+            if conversion or not name.isidentifier():
+                raise ValueError(f"unsupported placeholder {{{name}}} in {text[:40]!r}")
+            if name not in self.variables:
+                raise ValueError(f"undeclared placeholder {{{name}}} in {text[:40]!r}")
+            parts.append(self._slots.setdefault((name, spec), len(self._slots)))
+        if all(isinstance(part, str) for part in parts):
+            return None, ''.join(parts)  # Only {{ }} escapes
+        if len(parts) == 1:
+            slot = parts[0]
+            return (lambda formatted: formatted[slot]), None
+
+        def build_string(formatted):
+            return ''.join([part if part.__class__ is str else formatted[part] for part in parts])
+        return build_string, None
+
+    def bind(self, values):
+        """Content document for one customer's values (a dict with every declared variable)"""
+        try:
+            formatted = [escape(format(values[name], spec), quote=False) for name, spec in self._slot_keys]
+        except KeyError:
+            missing = sorted(set(self.variables) - set(values))
+            raise ValueError(f"missing template values: {', '.join(missing)}") from None
+        return self._bind(formatted)
+
+def compile_template(template):
+    """Parse and validate a template document (dict) once; see CompiledTemplate.bind"""
+    return CompiledTemplate(template)
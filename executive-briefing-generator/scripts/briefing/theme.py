@@ -0,0 +1,34 @@
+"""
+Brand colors and the paragraph stylesheet shared by every Quantum Shield Labs PDF.
+"""
+
+from reportlab.lib.colors import HexColor, black
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+PRIMARY_DARK = HexColor('#0a1628')
+PRIMARY_BLUE = HexColor('#1e3a5f')
+ACCENT_CYAN = HexColor('#00d4ff')
+SECTION_BG = HexColor('#132337')
+WARNING_RED = HexColor('#cc3333')
+SUCCESS_GREEN = HexColor('#00aa55')
+ACCENT_GOLD = HexColor('#ffd700')
+
+_stylesheet = None
+
+def create_styles():
+    global _stylesheet
+    if _stylesheet is not None:
+        return _stylesheet  # Built once per process, shared by every document
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name='SectHead', fontSize=20, leading=26, textColor=PRIMARY_BLUE,
+        fontName='Helvetica-Bold', spaceBefore=16, spaceAfter=8))
+    styles.add(ParagraphStyle(name='SubHead', fontSize=13, leading=17, textColor=PRIMARY_BLUE,
+        fontName='Helvetica-Bold', spaceBefore=12, spaceAfter=6))
+    styles.add(ParagraphStyle(name='Body', fontSize=11, leading=16, textColor=black,
+        fontName='Helvetica', alignment=TA_JUSTIFY, spaceAfter=8))
+    styles.add(ParagraphStyle(name='QBullet', fontSize=11, leading=15, textColor=black,
+        fontName='Helvetica', leftIndent=18, spaceAfter=5))
+    styles.add(ParagraphStyle(name='Foot', fontSize=9, textColor=HexColor('#666666'), alignment=TA_CENTER))
+    _stylesheet = styles
+    return styles
@@ -0,0 +1,535 @@
+"""
+PNG thumbnails of the first pages of a briefing or the product book, without a PDF.
+
+Storefront and dashboard previews need the cover and the first content page, not the
+whole document. thumbnails() lays the document out as usual but on a RasterCanvas:
+each requested page's drawing operators (the content stream ReportLab would write)
+are painted with Pillow when the page ends, other pages are thrown away like in a
+preflight, and layout stops as soon as the last requested page is done, so neither
+the remaining pages nor the PDF file are ever produced.
+
+Every page up to the last requested one is still laid out, so painting and encoding
+have to stay small next to that layout: glyphs are rendered once per font and size and
+pasted (FreeType rasterizes the Type 1 faces too slowly to draw each line with it),
+images are scaled once, and the palette is chosen from a half-size copy of the page.
+benchmark.py --thumbnails measures uncached thumbnails of pages 1-2 at about 40% of a
+full render of the showcase briefing, and about half of the six-page product book,
+whose first two pages alone take a third of its layout. A cache hit costs a hash and a
+file read.
+
+The painter covers the operators ReportLab's canvas emits: paths and rectangles
+(filled and stroked, straight and Bezier), colors, the graphics state stack and
+transforms, text objects in the standard fonts (drawn with the Type 1 faces ReportLab
+ships, positioned with ReportLab's own metrics) and images. Text is drawn upright,
+and clipping, dashes and transparency are ignored: fine for thumbnails, not a general
+PDF renderer. Text is anti-aliased; shapes are not, unless supersample paints the page
+at that multiple of the DPI and scales it down, at about twice the painting cost.
+
+Thumbnails are 256-color palette PNGs: a third the size of RGB ones and, even counting
+the quantizing, faster to encode. They are cached on disk by content hash
+(pdf_cache.render_key for the briefing, the layout fingerprint for the product book),
+page and DPI, like assets.prepared_image. Needs Pillow.
+"""
+
+import hashlib
+import io
+import logging
+import math
+import os
+import re
+import tempfile
+from functools import lru_cache
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfgen.canvas import Canvas
+
+from .content import load_content
+from .pdf_cache import layout_fingerprint, render_key, write_atomic
+
+CACHE_DIR = os.environ.get('BRIEFING_THUMBNAIL_CACHE',
+    os.path.join(tempfile.gettempdir(), 'qsl-briefing-thumbnails'))
+DEFAULT_PAGES = (1, 2)  # The cover and the first content page
+DEFAULT_DPI = 72
+DEFAULT_SUPERSAMPLE = 1  # 2 smooths shape edges, at about twice the painting cost
+PNG_COLORS = 256  # Palette PNGs: a third the size of RGB, and faster to encode even with quantizing
+PNG_COMPRESS_LEVEL = 1  # Half the encoding time of zlib's default, files a few % larger
+DOCUMENTS = ('briefing', 'product_book')
+
+_TOKEN = re.compile(rb'\s*(?:(%[^\r\n]*)|(\()|<([0-9A-Fa-f\s]*)>|(\[)|(\])|(/[^\s/\[\]()<>]+)|([-+.\d]+)'
+                    rb'|([A-Za-z*\'"]+))')
+_ESCAPES = {ord('n'): b'\n', ord('r'): b'\r', ord('t'): b'\t', ord('b'): b'\b', ord('f'): b'\f'}
+_BEZIER_STEPS = 12
+# Operands each painted operator takes: n number, s string, / name, [ array
+_OPERANDS = {'cm': 'nnnnnn', 'w': 'n', 'g': 'n', 'G': 'n', 'rg': 'nnn', 'RG': 'nnn', 'k': 'nnnn', 'K': 'nnnn',
+             'm': 'nn', 'l': 'nn', 'c': 'nnnnnn', 're': 'nnnn', 'Tf': '/n', 'TL': 'n', 'Tc': 'n', 'Tw': 'n',
+             'Ts': 'n', 'Tm': 'nnnnnn', 'Td': 'nn', 'TD': 'nn', 'Tj': 's', 'TJ': '[', "'": 's', 'Do': '/'}
+_OPERAND_TYPES = {'n': float, 's': bytes, '/': str, '[': list}  # As _operations() parses them
+_SIGNATURES = {operator: tuple(_OPERAND_TYPES[kind] for kind in kinds) for operator, kinds in _OPERANDS.items()}
+
+_log = logging.getLogger(__name__)
+
+class _PagesDone(Exception):
+    """Raised out of doc.build once every requested page has been painted"""
+
+class RasterCanvas(Canvas):
+    """Canvas that paints the requested pages into Pillow images and discards the rest"""
+
+    def __init__(self, *args, pages=DEFAULT_PAGES, dpi=DEFAULT_DPI, supersample=DEFAULT_SUPERSAMPLE, **kwargs):
+        Canvas.__init__(self, *args, **kwargs)
+        self.wanted = set(pages)
+        self.dpi = dpi
+        self.supersample = supersample
+        self.images = {}  # page number -> PIL image
+        self._sources = {}  # XObject name -> image source passed to drawImage
+        self._image_names = {}  # file name or id(image) -> (XObject name, pixel size)
+
+    def drawImage(self, image, x, y, width=None, height=None, mask=None, preserveAspectRatio=False,
+                  anchor='c', anchorAtXY=False, showBoundary=False, extraReturn=None):
+        # Canvas.drawImage places the image the same way, but first encodes it into the
+        # PDF (ASCII85 of the whole JPEG), which would cost more than painting the page
+        from reportlab.lib.boxstuff import aspectRatioFix
+        from reportlab.lib.utils import ImageReader
+
+        key = image if isinstance(image, str) else id(image)
+        if key not in self._image_names:
+            name = f"Im{len(self._image_names)}"
+            reader = image if isinstance(image, ImageReader) else ImageReader(image)
+            self._image_names[key] = name, reader.getSize()
+            self._sources[name] = image
+        name, (image_width, image_height) = self._image_names[key]
+        x, y, width, height, _ = aspectRatioFix(preserveAspectRatio, anchor, x, y, width, height,
+                                                image_width, image_height, anchorAtXY)
+        self.saveState()
+        self.translate(x, y)
+        self.scale(width, height)
+        self._code.append(f"/{name} Do")
+        self.restoreState()
+        return image_width, image_height
+
+    def showPage(self):
+        page = self.getPageNumber()
+        if page in self.wanted:
+            fonts = {internal.lstrip('/'): name for name, internal in self._doc.fontMapping.items()}
+            self.images[page] = paint_page(' '.join(self._code), self._pagesize, self.dpi, fonts,
+                                           self._sources, self.supersample)
+            if self.wanted <= set(self.images):
+                raise _PagesDone
+        self._startPage()
+
+    def save(self):
+        pass
+
+def _read_string(data, pos):
+    """(bytes, position after the closing parenthesis) of a PDF literal string starting after '('"""
+    out, depth = bytearray(), 1
+    while True:
+        ch = data[pos]
+        pos += 1
+        if ch == 0x5c:  # backslash
+            ch = data[pos]
+            pos += 1
+            if 0x30 <= ch <= 0x37:
+                digits = bytes([ch])
+                while len(digits) < 3 and 0x30 <= data[pos] <= 0x37:
+                    digits += bytes([data[pos]])
+                    pos += 1
+                out.append(int(digits, 8) & 0xff)
+            elif ch in _ESCAPES:
+                out += _ESCAPES[ch]
+            elif ch not in (0x0a, 0x0d):
+                out.append(ch)
+        elif ch == 0x28:
+            depth += 1
+            out.append(ch)
+        elif ch == 0x29:
+            depth -= 1
+            if depth == 0:
+                return bytes(out), pos
+            out.append(ch)
+        else:
+            out.append(ch)
+
+def _operations(code):
+    """Yield (operator, operands) from a content stream"""
+    data = code.encode('latin-1')
+    operands, arrays = [], []
+    pos = 0
+    while True:
+        match = _TOKEN.match(data, pos)
+        if match is None:
+            return
+        pos = match.end()
+        comment, string, hex_string, open_array, close_array, name, number, operator = match.groups()
+        if comment is not None:
+            continue
+        if string is not None:
+            value, pos = _read_string(data, pos)
+        elif hex_string is not None:
+            digits = re.sub(rb'\s', b'', hex_string)
+            value = bytes.fromhex((digits + b'0' * (len(digits) % 2)).decode('ascii'))
+        elif open_array is not None:
+            arrays.append(operands)
+            operands = []
+            continue
+        elif close_array is not None:
+            value, operands = operands, arrays.pop()
+        elif name is not None:
+            value = name[1:].decode('latin-1')
+        elif number is not None:
+            value = float(number)
+        else:
+            yield operator.decode('latin-1'), operands
+            operands = []
+            continue
+        operands.append(value)
+
+def _multiply(m, n):
+    a, b, c, d, e, f = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (a * a2 + b * c2, a * b2 + b * d2, c * a2 + d * c2, c * b2 + d * d2,
+            e * a2 + f * c2 + e2, e * b2 + f * d2 + f2)
+
+def _apply(m, x, y):
+    return m[0] * x + m[2] * y + m[4], m[1] * x + m[3] * y + m[5]
+
+def _color(values):
+    if len(values) == 1:
+        values = values * 3
+    elif len(values) == 4:  # CMYK
+        c, m, y, k = values
+        values = [(1 - c) * (1 - k), (1 - m) * (1 - k), (1 - y) * (1 - k)]
+    return tuple(max(0, min(255, round(v * 255))) for v in values)
+
+@lru_cache(maxsize=256)
+def _pil_font(name, pixels):
+    from PIL import ImageFont
+
+    try:
+        path = pdfmetrics.getFont(name).face.findT1File()
+    except KeyError:
+        path = None  # Not registered with ReportLab
+    if path is None:
+        _log.warning("no Type 1 file for font %s, drawn in Pillow's default font", name)
+        return ImageFont.load_default(pixels)
+    return ImageFont.truetype(path, pixels)
+
+@lru_cache(maxsize=8192)
+def _glyph(name, pixels, char):
+    """(mask, dx, dy) of one glyph with its baseline origin at (0, 0), or None for blanks.
+
+    FreeType renders Type 1 faces slowly (a few ms for a line of text), so each glyph is
+    rendered once per size and pasted wherever it is used. mask is the core image that
+    ImageDraw's draw_bitmap takes.
+    """
+    from PIL import Image, ImageDraw
+
+    font = _pil_font(name, pixels)
+    left, top, right, bottom = font.getbbox(char, anchor='ls')
+    if right <= left or bottom <= top:
+        return None
+    mask = Image.new('L', (right - left, bottom - top))
+    ImageDraw.Draw(mask).text((-left, -top), char, font=font, fill=255, anchor='ls')
+    return mask.im, left, top
+
+@lru_cache(maxsize=8192)
+def _char_width(name, char):
+    return pdfmetrics.stringWidth(char, name, 1)
+
+@lru_cache(maxsize=16)
+def _source_image(source):
+    from PIL import Image
+    from reportlab.lib.utils import ImageReader
+
+    if isinstance(source, ImageReader):
+        return Image.frombytes('RGB', source.getSize(), source.getRGBData())
+    return (source if isinstance(source, Image.Image) else Image.open(source)).convert('RGB')
+
+@lru_cache(maxsize=16)
+def _scaled_image(source, size):
+    from PIL import Image
+
+    return _source_image(source).resize(size, Image.BILINEAR)
+
+@lru_cache(maxsize=None)
+def _method_name(operator):
+    return 'op_' + operator.replace('*', '_star').replace("'", 'quote')
+
+class _Painter:
+    def __init__(self, pagesize, dpi, fonts, sources, supersample=DEFAULT_SUPERSAMPLE):
+        from PIL import Image, ImageDraw
+
+        self.scale = dpi * supersample / 72
+        self.size = (max(1, round(pagesize[0] * self.scale)), max(1, round(pagesize[1] * self.scale)))
+        self.image = Image.new('RGB', self.size, 'white')
+        self.draw = ImageDraw.Draw(self.image)
+        self.fonts = fonts
+        self.sources = sources
+        # User space (origin bottom left, points) to pixels (origin top left)
+        self.ctm = (self.scale, 0, 0, -self.scale, 0, self.size[1])
+        self.fill = self.stroke = (0, 0, 0)
+        self.line_width = 1
+        self.stack = []
+        self.path = []
+
+    # Graphics state
+    def op_q(self, _):
+        self.stack.append((self.ctm, self.fill, self.stroke, self.line_width))
+
+    def op_Q(self, _):
+        if self.stack:
+            self.ctm, self.fill, self.stroke, self.line_width = self.stack.pop()
+
+    def op_cm(self, args):
+        self.ctm = _multiply(tuple(args), self.ctm)
+
+    def op_w(self, args):
+        self.line_width = args[0]
+
+    def op_rg(self, args):
+        self.fill = _color(args)
+    op_g = op_k = op_rg
+
+    def op_RG(self, args):
+        self.stroke = _color(args)
+    op_G = op_K = op_RG
+
+    # Paths
+    def op_m(self, args):
+        self.path.append([_apply(self.ctm, *args)])
+
+    def op_l(self, args):
+        if self.path:
+            self.path[-1].append(_apply(self.ctm, *args))
+
+    def op_c(self, args):
+        if not self.path:
+            return
+        x0, y0 = self.path[-1][-1]
+        (x1, y1), (x2, y2), (x3, y3) = (_apply(self.ctm, *args[i:i + 2]) for i in (0, 2, 4))
+        for step in range(1, _BEZIER_STEPS + 1):
+            t = step / _BEZIER_STEPS
+            u = 1 - t
+            self.path[-1].append((u ** 3 * x0 + 3 * u * u * t * x1 + 3 * u * t * t * x2 + t ** 3 * x3,
+                                  u ** 3 * y0 + 3 * u * u * t * y1 + 3 * u * t * t * y2 + t ** 3 * y3))
+
+    def op_re(self, args):
+        x, y, w, h = args
+        self.path.append([_apply(self.ctm, x, y), _apply(self.ctm, x + w, y),
+                          _apply(self.ctm, x + w, y + h), _apply(self.ctm, x, y + h), None])
+
+    def op_h(self, _):
+        if self.path:
+            self.path[-1].append(None)
+
+    def _fill_path(self):
+        for points in self.path:
+            points = [p for p in points if p is not None]
+            if len(points) > 2:
+                self.draw.polygon(points, fill=self.fill)
+
+    def _stroke_path(self):
+        width = max(1, round(self.line_width * math.sqrt(abs(self.ctm[0] * self.ctm[3] - self.ctm[1] * self.ctm[2]))))
+        for points in self.path:
+            closed = points and points[-1] is None
+            points = [p for p in points if p is not None]
+            if closed and points:
+                points.append(points[0])
+            if len(points) > 1:
+                self.draw.line(points, fill=self.stroke, width=width)
+
+    def op_f(self, _):
+        self._fill_path()
+        self.path = []
+    op_F = op_f_star = op_f
+
+    def op_S(self, _):
+        self._stroke_path()
+        self.path = []
+
+    def op_s(self, args):
+        self.op_h(args)
+        self.op_S(args)
+
+    def op_B(self, _):
+        self._fill_path()
+        self._stroke_path()
+        self.path = []
+    op_B_star = op_B
+
+    def op_b(self, args):
+        self.op_h(args)
+        self.op_B(args)
+    op_b_star = op_b
+
+    def op_n(self, _):
+        self.path = []
+
+    # Text
+    def op_BT(self, _):
+        self.tm = self.tlm = (1, 0, 0, 1, 0, 0)
+        self.font, self.font_size = 'Helvetica', 12
+        self.leading = self.char_space = self.word_space = self.rise = 0
+
+    def op_Tf(self, args):
+        self.font = self.fonts.get(args[0], 'Helvetica')
+        self.font_size = args[1]
+
+    def op_TL(self, args):
+        self.leading = args[0]
+
+    def op_Tc(self, args):
+        self.char_space = args[0]
+
+    def op_Tw(self, args):
+        self.word_space = args[0]
+
+    def op_Ts(self, args):
+        self.rise = args[0]
+
+    def op_Tm(self, args):
+        self.tm = self.tlm = tuple(args)
+
+    def op_Td(self, args):
+        self.tm = self.tlm = _multiply((1, 0, 0, 1, args[0], args[1]), self.tlm)
+
+    def op_TD(self, args):
+        self.leading = -args[1]
+        self.op_Td(args)
+
+    def op_T_star(self, _):
+        self.op_Td([0, -self.leading])
+
+    def op_Tj(self, args):
+        text = args[0].decode('cp1252', 'replace')
+        matrix = _multiply(self.tm, self.ctm)
+        pixels = round(self.font_size * math.hypot(matrix[2], matrix[3]) * 4) / 4
+        # ImageDraw.bitmap looks the color up on every call; a line pastes dozens of glyphs
+        ink = self.draw.draw.draw_ink(self.fill)
+        draw_bitmap = self.draw.draw.draw_bitmap
+        x0, y0 = _apply(matrix, 0, self.rise)
+        font, size, char_space, word_space = self.font, self.font_size, self.char_space, self.word_space
+        advance = 0
+        # Glyph by glyph at ReportLab's advances, so justified lines (word spacing) land
+        # where the PDF puts them
+        for char in text:
+            glyph = _glyph(font, pixels, char) if pixels >= 1 else None
+            if glyph is not None:
+                mask, dx, dy = glyph
+                draw_bitmap((round(x0 + advance * matrix[0]) + dx, round(y0 + advance * matrix[1]) + dy), mask, ink)
+            advance += _char_width(font, char) * size + char_space
+            if char == ' ':
+                advance += word_space
+        self.tm = _multiply((1, 0, 0, 1, advance, 0), self.tm)
+
+    def op_TJ(self, args):
+        for item in args[0]:
+            if isinstance(item, bytes):
+                self.op_Tj([item])
+            else:
+                self.tm = _multiply((1, 0, 0, 1, -item / 1000 * self.font_size, 0), self.tm)
+
+    def op_quote(self, args):
+        self.op_T_star(args)
+        self.op_Tj(args)
+
+    # Images
+    def op_Do(self, args):
+        source = self.sources.get(args[0])
+        if source is None:
+            return
+        corners = [_apply(self.ctm, x, y) for x, y in ((0, 0), (1, 0), (1, 1), (0, 1))]
+        xs, ys = [p[0] for p in corners], [p[1] for p in corners]
+        box = (round(min(xs)), round(min(ys)), round(max(xs)), round(max(ys)))
+        if box[2] > box[0] and box[3] > box[1]:
+            try:
+                image = _scaled_image(source, (box[2] - box[0], box[3] - box[1]))
+            except OSError:
+                _log.warning("skipped image %s, can't open %r", args[0], source)
+                return
+            self.image.paste(image, box[:2])
+
+    def run(self, code):
+        for operator, args in _operations(code):
+            method = getattr(self, _method_name(operator), None)
+            if method is None:
+                continue  # Not painted (clipping, dashes, transparency...)
+            if tuple(map(type, args)) != _SIGNATURES.get(operator, ()):
+                # A malformed operation only loses its own drawing
+                _log.warning("skipped %s with operands %r", operator, args)
+                continue
+            method(args)
+        return self.image
+
+def paint_page(code, pagesize, dpi, fonts, sources=None, supersample=DEFAULT_SUPERSAMPLE):
+    """PIL image of one page's content stream at dpi; fonts maps PDF font names (F1) to font names"""
+    image = _Painter(pagesize, dpi, fonts, sources or {}, supersample).run(code)
+    if supersample > 1:
+        image = image.reduce(supersample)
+    return image
+
+def _palette(image):
+    from PIL import Image
+
+    # Choosing the palette from a half-size copy costs a quarter as much and, pages being
+    # mostly flat color, loses nothing; mapping every pixel to it is the cheap part
+    palette = image.reduce(2).quantize(PNG_COLORS, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+    return image.quantize(palette=palette, dither=Image.Dither.NONE)
+
+def thumbnail_key(document, content, page, dpi, supersample=DEFAULT_SUPERSAMPLE):
+    """Cache key for one page thumbnail"""
+    if document == 'briefing':
+        return render_key(content, thumbnail=page, dpi=dpi, supersample=supersample, colors=PNG_COLORS)
+    return hashlib.sha256(f"{document}:{layout_fingerprint()}:{page}:{dpi}:{supersample}:{PNG_COLORS}".encode()).hexdigest()
+
+def _layout(document, content, pages, dpi, supersample):
+    from .document import briefing_doc, build_document
+    from .theme import create_styles
+
+    story = []
+    if document == 'briefing':
+        build_document(story, create_styles(), content)
+    else:
+        from . import product_book
+        product_book.build_document(story, create_styles())
+    canvases = []
+
+    def canvasmaker(*args, **kwargs):
+        canvases.append(RasterCanvas(*args, pages=pages, dpi=dpi, supersample=supersample, **kwargs))
+        return canvases[-1]
+
+    try:
+        # The product book uses the briefing's page size and margins
+        briefing_doc(io.BytesIO()).build(story, canvasmaker=canvasmaker)
+    except _PagesDone:
+        pass
+    return canvases[0].images
+
+def thumbnails(document='briefing', content=None, pages=DEFAULT_PAGES, dpi=DEFAULT_DPI, cache_dir=CACHE_DIR,
+               supersample=DEFAULT_SUPERSAMPLE):
+    """{page number: PNG bytes} for the requested pages of document ('briefing' or 'product_book').
+
+    content is the briefing's content document (default: the showcase). Pages past the
+    end of the document are left out. Thumbnails are read from and written to cache_dir;
+    pass None to always render. supersample paints at that multiple of dpi and scales down.
+    """
+    if document not in DOCUMENTS:
+        raise ValueError(f"unknown document {document!r}; expected one of {', '.join(DOCUMENTS)}")
+    if document == 'briefing' and content is None:
+        content = load_content()
+    found, paths = {}, {}
+    for page in pages:
+        if cache_dir:
+            paths[page] = os.path.join(cache_dir, f"{thumbnail_key(document, content, page, dpi, supersample)}.png")
+            if os.path.exists(paths[page]):
+                with open(paths[page], 'rb') as f:
+                    found[page] = f.read()
+    missing = [page for page in pages if page not in found]
+    if missing:
+        for page, image in _layout(document, content, missing, dpi, supersample).items():
+            buffer = io.BytesIO()
+            _palette(image).save(buffer, 'PNG', dpi=(dpi, dpi), compress_level=PNG_COMPRESS_LEVEL)
+            found[page] = buffer.getvalue()
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+                write_atomic(paths[page], found[page])
+    return {page: found[page] for page in pages if page in found}
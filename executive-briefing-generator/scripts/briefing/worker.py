@@ -0,0 +1,35 @@
+"""
+Per-process state for render worker pools.
+
+batch_render.py, render_queue.py, render_server.py and parallel.py all start their
+ProcessPoolExecutors with init_worker as the initializer, which imports the layout
+stack and builds the stylesheet and caches in the child once, before its first job.
+Jobs read them from here (worker.styles, worker.section_cache, worker.pdf_cache).
+
+Importing this module does not import ReportLab; init_worker does.
+"""
+
+import io
+
+styles = None         # Per-worker stylesheet from theme.create_styles()
+section_cache = None  # SectionCache, when the pool was given a directory
+pdf_cache = None      # PdfCache, when the pool was given a directory
+
+def init_worker(section_cache_dir=None, pdf_cache_dir=None, warm_up=False):
+    """Load ReportLab and build this process's styles and caches.
+
+    warm_up also lays out one throwaway briefing so fonts and caches are hot before
+    the first real request (for latency-sensitive pools such as the render server).
+    """
+    global styles, section_cache, pdf_cache
+    from .document import build_pdf
+    from .pdf_cache import PdfCache
+    from .section_cache import SectionCache
+    from .theme import create_styles
+    styles = create_styles()
+    if section_cache_dir:
+        section_cache = SectionCache(section_cache_dir)
+    if pdf_cache_dir:
+        pdf_cache = PdfCache(pdf_cache_dir)
+    if warm_up:
+        build_pdf(io.BytesIO(), None, styles, section_cache)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+PDF Size Report & Budgets
+Where the bytes of a generated PDF go, and whether each document type fits its budget.
+
+    python scripts/pdf_size.py                      # render every document, check budgets
+    python scripts/pdf_size.py briefing --compact   # compact mode only for the briefing
+    python scripts/pdf_size.py --pdf samples/Executive_Briefing_SAMPLE.pdf
+
+The report lists bytes per page (page dictionary plus its content streams) and per
+object type (content streams, fonts, images, forms, ...), measured from the file's
+cross-reference offsets. Budgets live in benchmarks/size_budgets.json as
+{"compact"|"default": {document: {"bytes": total limit, "page_bytes": per-page limit}}},
+one set per output mode; any rendered document over budget is reported and the exit
+status is 1.
+
+--compact renders with briefing.output.compact_output(), the switch behind the
+generators' --compact flag.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+from collections import Counter
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BUDGET_PATH = os.path.join(SCRIPTS_DIR, '..', 'benchmarks', 'size_budgets.json')
+DOCUMENTS = ('briefing', 'sample', 'product_book')
+
+def _object_type(obj, content_ids, num):
+    if num in content_ids:
+        return 'content stream'
+    get = getattr(obj, 'get', None)
+    if get is None:
+        return 'other'
+    kind, subtype = get('/Type'), get('/Subtype')
+    if kind == '/XObject' or subtype in ('/Image', '/Form'):
+        return {'/Image': 'image', '/Form': 'form xobject'}.get(subtype, 'xobject')
+    if kind in ('/Font', '/FontDescriptor') or '/FontFile' in str(obj.keys()):
+        return 'font'
+    return {'/Page': 'page', '/Pages': 'page tree', '/Catalog': 'catalog',
+            '/Outlines': 'outline', '/Annot': 'annotation', '/ExtGState': 'graphics state',
+            }.get(kind, 'stream' if hasattr(obj, 'get_data') else 'other')
+
+def size_report(pdf):
+    """Bytes per page and per object type for a PDF given as bytes"""
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(pdf))
+    offsets = sorted((offset, num) for num, offset in reader.xref.get(0, {}).items())
+    startxref = pdf.rfind(b'startxref')
+    xref_start = int(pdf[startxref:].split()[1]) if startxref >= 0 else len(pdf)
+    sizes = {}
+    for i, (offset, num) in enumerate(offsets):
+        end = offsets[i + 1][0] if i + 1 < len(offsets) else xref_start
+        sizes[num] = end - offset
+
+    pages, content_ids = [], set()
+    for page in reader.pages:
+        refs = [page.indirect_reference.idnum]
+        contents = page.raw_get('/Contents') if '/Contents' in page else None
+        if contents is not None:
+            items = contents.get_object() if isinstance(contents.get_object(), list) else [contents]
+            streams = [item.idnum for item in items if hasattr(item, 'idnum')]
+            content_ids.update(streams)
+            refs += streams
+        pages.append(sum(sizes.get(num, 0) for num in refs))
+
+    by_type = Counter()
+    for num, size in sizes.items():
+        by_type[_object_type(reader.get_object(num), content_ids, num)] += size
+    overhead = len(pdf) - sum(sizes.values())
+    if overhead:
+        by_type['header/xref/trailer'] += overhead
+    return {'bytes': len(pdf), 'pages': pages, 'objects': dict(by_type.most_common())}
+
+def format_report(name, report):
+    pages = report['pages']
+    lines = [f"{name}: {report['bytes']:,} bytes, {len(pages)} pages"]
+    lines.append("  per page:  " + '  '.join(f"{i}:{b:,}" for i, b in enumerate(pages, 1)))
+    for kind, size in report['objects'].items():
+        lines.append(f"  {kind:<22}{size:>10,}  {size * 100 / report['bytes']:5.1f}%")
+    return '\n'.join(lines)
+
+def check_budget(name, report, budget):
+    """Human-readable budget violations for one document"""
+    problems = []
+    if 'bytes' in budget and report['bytes'] > budget['bytes']:
+        problems.append(f"{name}: {report['bytes']:,} bytes exceeds budget {budget['bytes']:,}")
+    for i, size in enumerate(report['pages'], 1):
+        if 'page_bytes' in budget and size > budget['page_bytes']:
+            problems.append(f"{name}: page {i} is {size:,} bytes, budget {budget['page_bytes']:,}")
+    return problems
+
+def render(name, compact):
+    sys.path.insert(0, SCRIPTS_DIR)
+    if name == 'briefing':
+        from briefing import document
+        return document.render_bytes(compact=compact)
+    if name == 'sample':
+        from briefing import document, sample
+        out = io.BytesIO()
+        sample.stamp_sample(document.render_bytes(compact=compact), out, compact)
+        return out.getvalue()
+    if name == 'product_book':
+        from briefing import product_book
+        return product_book.render_bytes(compact=compact)
+    raise ValueError(f"unknown document {name!r}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report PDF size by page and object type, and check budgets")
+    parser.add_argument('documents', nargs='*', help=f"documents to render: {', '.join(DOCUMENTS)} (default: all)")
+    parser.add_argument('--pdf', action='append', default=[], help="report on an existing PDF instead (repeatable)")
+    parser.add_argument('--compact', action='store_true', help="render in compact output mode")
+    parser.add_argument('--budgets', default=BUDGET_PATH, help="size budget JSON file")
+    args = parser.parse_args(argv)
+    unknown = set(args.documents) - set(DOCUMENTS)
+    if unknown:
+        parser.error(f"unknown documents: {', '.join(sorted(unknown))}")
+
+    reports = {}
+    for path in args.pdf:
+        with open(path, 'rb') as f:
+            reports[os.path.basename(path)] = size_report(f.read())
+    if not args.pdf or args.documents:
+        for name in args.documents or DOCUMENTS:
+            reports[name] = size_report(render(name, args.compact))
+
+    budgets = {}
+    if os.path.exists(args.budgets):
+        with open(args.budgets, encoding='utf-8') as f:
+            budgets = json.load(f).get('compact' if args.compact else 'default', {})
+    problems = []
+    for name, report in reports.items():
+        print(format_report(name, report))
+        if name in budgets:
+            problems += check_budget(name, report, budgets[name])
+    for line in problems:
+        print(f"❌ {line}")
+    if not problems:
+        print("✅ Within size budgets")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Layout Preflight
+Paginates briefings without drawing or writing a PDF, to check page counts and catch
+near-empty pages in bulk.
+
+    python scripts/preflight.py                          # the showcase briefing
+    python scripts/preflight.py content/*.json --json preflight.json
+
+See briefing/preflight.py for how the dry run works and what the report holds. Pages
+less than --min-fill full are reported; exit status is 1 when any briefing has warnings.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from briefing.content import DEFAULT_CONTENT, load_content, validate_content
+
+MIN_FILL = 0.25  # Same default as briefing.preflight.MIN_FILL
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Paginate briefings without rendering them and report near-empty pages")
+    parser.add_argument('content', nargs='*', help="briefing content JSON files (default: the showcase briefing)")
+    parser.add_argument('--min-fill', type=float, default=MIN_FILL,
+        help="report pages less full than this fraction of the frame (default %(default)s)")
+    parser.add_argument('--json', help="also write all reports to this JSON file")
+    args = parser.parse_args(argv)
+
+    from briefing.document import create_styles, preflight
+    from briefing.preflight import format_report
+
+    styles = create_styles()
+    reports = []
+    for path in args.content or [DEFAULT_CONTENT]:
+        content = validate_content(load_content(path))
+        report = preflight(content, styles, min_fill=args.min_fill)
+        report['label'] = os.path.basename(path)
+        reports.append(report)
+        print(format_report(report))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2)
+    flagged = sum(bool(r['warnings']) for r in reports)
+    if flagged:
+        print(f"❌ {flagged} of {len(reports)} briefings have near-empty pages")
+    else:
+        print(f"✅ No near-empty pages in {len(reports)} briefings")
+    return 1 if flagged else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
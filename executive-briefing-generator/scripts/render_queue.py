@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Render Queue Worker
+Renders briefings from a durable SQLite job queue (briefing/job_queue.py) on a pool of
+warm worker processes.
+
+    python scripts/render_queue.py enqueue queue.db content/*.json --output-dir out/
+    python scripts/render_queue.py enqueue queue.db --manifest batch.jsonl --output-dir out/
+    python scripts/render_queue.py work queue.db --workers 4            # runs until stopped
+    python scripts/render_queue.py work queue.db --drain                # exits when the queue is empty
+    python scripts/render_queue.py status queue.db job_42
+    python scripts/render_queue.py stats queue.db --window 3600
+
+A worker first requeues jobs left running by workers that crashed (see recover()),
+then keeps --workers jobs in flight, renewing their leases while they render. Job
+status, output path, timings and errors are written to the queue file as each job
+finishes, so stopping a worker at any point loses nothing: unfinished jobs are
+rendered again by the next worker. Manifests use batch_render.py's format. With
+--pdf-cache, a job whose content, inventory and layout match an earlier render is
+copied from the content-addressed cache (see briefing/pdf_cache.py) instead of rendered.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import batch_render  # Manifest format, shared with batch renders
+from briefing import worker
+from briefing.content import validate_content
+from briefing.job_queue import LEASE_SECONDS, JobQueue
+
+def _render_job(job):
+    """Render one claimed job; returns an error string, or None on success"""
+    from briefing.content import read_inventory
+    from briefing.document import build_pdf, render_bytes
+    from briefing.pdf_cache import render_key
+    styles, section_cache, pdf_cache = worker.styles, worker.section_cache, worker.pdf_cache
+    try:
+        content = validate_content(job['content'])
+        inventory = None
+        if job['inventory']:
+            inventory = read_inventory(job['inventory'], content['inventory_appendix']['columns'])
+        os.makedirs(os.path.dirname(os.path.abspath(job['output'])), exist_ok=True)
+        if pdf_cache is None:
+            build_pdf(job['output'], content, styles, section_cache, inventory=inventory)
+        else:
+            key = render_key(content, job['inventory'], section_cache=section_cache is not None)
+            pdf, _ = pdf_cache.fetch(key,
+                lambda: render_bytes(content, styles, section_cache, inventory=inventory, deterministic=True))
+            with open(job['output'], 'wb') as f:
+                f.write(pdf)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return None
+
+def _start_pool(workers, section_cache_dir, pdf_cache_dir):
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=workers, initializer=worker.init_worker,
+        initargs=(section_cache_dir, pdf_cache_dir))
+
+def work(queue, workers=1, section_cache_dir=None, drain=False, poll=1.0, lease=LEASE_SECONDS, log=print,
+         pdf_cache_dir=None):
+    """Claim and render jobs with up to workers in flight; with drain, return once the queue is empty"""
+    from concurrent.futures import FIRST_COMPLETED, wait
+    from concurrent.futures.process import BrokenProcessPool
+
+    requeued, failed = queue.recover()
+    if requeued or failed:
+        log(f"Recovered {requeued} unfinished jobs ({failed} given up after {queue.max_attempts} attempts)")
+    pool = _start_pool(workers, section_cache_dir, pdf_cache_dir)
+    running = {}  # future -> job
+    try:
+        while True:
+            while len(running) < workers:
+                job = queue.claim(lease)
+                if job is None:
+                    break
+                running[pool.submit(_render_job, job)] = job
+            if not running:
+                if drain:
+                    return
+                time.sleep(poll)
+                queue.recover()
+                continue
+            done, _ = wait(running, timeout=lease / 3, return_when=FIRST_COMPLETED)
+            queue.renew([job['id'] for job in running.values()], lease)
+            broken = False
+            for future in done:
+                try:
+                    error = future.result()
+                except BrokenProcessPool:
+                    broken = True
+                    continue
+                job = running.pop(future)
+                queue.finish(job['id'], error)
+                log(f"{job['id']:<24} {'❌ ' + error if error else job['output']}")
+            if broken:
+                # A worker died mid-render. Keep what finished before the pool broke;
+                # every job still in flight goes back to the queue
+                for future in [f for f in running if f.done() and f.exception() is None]:
+                    job = running.pop(future)
+                    error = future.result()
+                    queue.finish(job['id'], error)
+                    log(f"{job['id']:<24} {'❌ ' + error if error else job['output']}")
+                queue.release([job['id'] for job in running.values()], crashed=True)
+                log(f"❌ worker process died; requeued {len(running)} jobs")
+                running.clear()
+                pool.shutdown(wait=False)
+                pool = _start_pool(workers, section_cache_dir, pdf_cache_dir)
+    finally:
+        queue.release([job['id'] for job in running.values()])
+        pool.shutdown(wait=False, cancel_futures=True)
+
+def _enqueue(queue, args, parser):
+    jobs = []
+    for path in args.content:
+        job_id = os.path.splitext(os.path.basename(path))[0]
+        jobs.append({'id': job_id, 'content': path,
+                     'output': os.path.join(args.output_dir, f"Executive_Briefing_{job_id}.pdf")})
+    if args.manifest:
+        jobs += batch_render.read_manifest(args.manifest, args.output_dir)
+    if not jobs:
+        parser.error("nothing to enqueue: give content files or --manifest")
+    inventory = os.path.abspath(args.inventory) if args.inventory else None
+    for job in jobs:
+        content = batch_render.job_content(job)
+        if inventory and 'inventory_appendix' not in content:
+            parser.error(f"job {job['id']}: content has no inventory_appendix")
+        try:
+            queue.enqueue(content, os.path.abspath(job['output']), job['id'], inventory)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"Queued {job['id']}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render briefings from a durable SQLite job queue")
+    commands = parser.add_subparsers(dest='command', required=True)
+    enqueue = commands.add_parser('enqueue', help="add content documents to the queue")
+    enqueue.add_argument('queue', help="queue database file (created if missing)")
+    enqueue.add_argument('content', nargs='*', help="content JSON files; the file name is the job id")
+    enqueue.add_argument('--manifest', help="JSONL manifest in batch_render.py's format")
+    enqueue.add_argument('--output-dir', default='.', help="directory for the PDFs")
+    enqueue.add_argument('--inventory', help="inventory CSV/JSONL appended to every queued briefing")
+    work_parser = commands.add_parser('work', help="render queued jobs")
+    work_parser.add_argument('queue')
+    work_parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="jobs rendered at once")
+    work_parser.add_argument('--section-cache', help="directory for pre-rendered static sections")
+    work_parser.add_argument('--pdf-cache', help="content-addressed PDF cache: copy briefings rendered before")
+    work_parser.add_argument('--drain', action='store_true', help="exit once the queue is empty")
+    work_parser.add_argument('--poll', type=float, default=1.0, help="seconds between checks of an empty queue")
+    work_parser.add_argument('--lease', type=float, default=LEASE_SECONDS,
+        help="seconds before another worker may take over a job this worker stopped renewing")
+    status = commands.add_parser('status', help="print one job")
+    status.add_argument('queue')
+    status.add_argument('job_id')
+    stats = commands.add_parser('stats', help="queue depth, throughput and queue latency")
+    stats.add_argument('queue')
+    stats.add_argument('--window', type=float, help="only count jobs finished in the last N seconds")
+    args = parser.parse_args(argv)
+
+    queue = JobQueue(args.queue)
+    try:
+        if args.command == 'enqueue':
+            _enqueue(queue, args, parser)
+        elif args.command == 'work':
+            try:
+                work(queue, args.workers, args.section_cache, args.drain, args.poll, args.lease,
+                    pdf_cache_dir=args.pdf_cache)
+            except KeyboardInterrupt:
+                print("Stopped; unfinished jobs returned to the queue")
+        elif args.command == 'status':
+            job = queue.get(args.job_id)
+            if job is None:
+                print(f"❌ no job {args.job_id!r}")
+                return 1
+            del job['content']
+            print(json.dumps(job, indent=2))
+        else:
+            print(json.dumps(queue.stats(args.window), indent=2))
+    finally:
+        queue.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
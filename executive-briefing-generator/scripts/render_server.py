@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Briefing Render Server
+Long-lived local service that keeps ReportLab, fonts and styles warm in a worker pool.
+
+    POST /render          body: briefing content document (JSON)  ->  application/pdf
+    POST /preview         same body  ->  text/html preview (?fragment=1: an embeddable <article>)
+    GET  /briefings/KEY   a PDF rendered earlier, from the --pdf-cache directory
+    GET  /health          pool size, queue depth, counters and recent latency percentiles
+
+Listens on localhost TCP by default or on a Unix socket with --socket. When every
+worker is busy and the wait queue is full, requests get 503 with Retry-After instead
+of piling up, so callers see backpressure rather than unbounded latency.
+
+Previews (briefing/html_preview.py) take about a millisecond and are built on the
+request thread without a worker, so they are never queued behind PDF renders: a page
+can show one at once and fetch the PDF alongside.
+
+Renders are deterministic, so every PDF carries its content-addressed key
+(briefing.pdf_cache.render_key) as its ETag. With --pdf-cache DIR, a re-sent document
+is served from the cache without reaching a worker, and the response's
+Content-Location (/briefings/KEY) can be downloaded again later; GET honours
+If-None-Match with 304 Not Modified.
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from briefing import worker
+from briefing.content import validate_content
+from briefing.html_preview import render_html
+from briefing.pdf_cache import PdfCache, render_key
+
+MAX_BODY_BYTES = 2 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+def _render(content):
+    from briefing.document import render_bytes
+    return render_bytes(content, worker.styles, worker.section_cache, deterministic=True)
+
+class RenderService:
+    """Bounded worker pool with queue-depth admission control"""
+
+    def __init__(self, workers, queue_depth, section_cache_dir=None, pdf_cache_dir=None):
+        self.workers = workers
+        self.queue_depth = queue_depth
+        # Warm: each worker lays out one throwaway briefing before taking requests
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=worker.init_worker,
+            initargs=(section_cache_dir, None, True))
+        self.pdf_cache = PdfCache(pdf_cache_dir) if pdf_cache_dir else None
+        self.section_cache = bool(section_cache_dir)
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=1000)
+        self.pending = 0
+        self.rendered = 0
+        self.rejected = 0
+        self.failed = 0
+        self.cached = 0
+
+    def warm_up(self):
+        """Block until every worker has run its initializer"""
+        for future in [self.pool.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def key(self, content):
+        """render_key for content as this service renders it (requests carry no inventory export)"""
+        return render_key(content, section_cache=self.section_cache)
+
+    def render(self, content, key):
+        """PDF bytes for content (render_key key) from the cache or a worker; None if the queue is full"""
+        if self.pdf_cache is not None:
+            pdf = self.pdf_cache.get(key)
+            if pdf is not None:
+                with self._lock:
+                    self.cached += 1
+                return pdf
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            return None
+        start = time.perf_counter()
+        with self._lock:
+            self.pending += 1
+        try:
+            pdf = self.pool.submit(_render, content).result()
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.pending -= 1
+            self._slots.release()
+        with self._lock:
+            self.rendered += 1
+            self._latencies.append(time.perf_counter() - start)
+        if self.pdf_cache is not None:
+            self.pdf_cache.put(key, pdf)
+        return pdf
+
+    def stats(self):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = {
+                'workers': self.workers,
+                'queue_depth': self.queue_depth,
+                'pending': self.pending,
+                'rendered': self.rendered,
+                'rejected': self.rejected,
+                'failed': self.failed,
+                'cached': self.cached,
+            }
+        if latencies:
+            stats['latency_p50_ms'] = round(latencies[len(latencies) // 2] * 1000, 1)
+            stats['latency_p95_ms'] = round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 1)
+        return stats
+
+    def shutdown(self):
+        self.pool.shutdown(wait=True)
+
+class RenderHandler(BaseHTTPRequestHandler):
+    server_version = "QSLRender/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) tuple
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_pdf(self, pdf, key):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/pdf')
+        self.send_header('Content-Length', str(len(pdf)))
+        self.send_header('ETag', f'"{key}"')
+        if self.service.pdf_cache is not None:
+            self.send_header('Content-Location', f'/briefings/{key}')
+        self.end_headers()
+        view = memoryview(pdf)
+        for offset in range(0, len(pdf), CHUNK_SIZE):
+            self.wfile.write(view[offset:offset + CHUNK_SIZE])
+
+    def do_GET(self):
+        if self.path == '/health':
+            return self._send_json(200, self.service.stats())
+        key = self.path[len('/briefings/'):] if self.path.startswith('/briefings/') else ''
+        cache = self.service.pdf_cache
+        if cache is None or len(key) != 64 or not all(c in '0123456789abcdef' for c in key):
+            return self._send_json(404, {'error': 'not found'})
+        if f'"{key}"' in self.headers.get('If-None-Match', ''):
+            if os.path.exists(cache.path(key)):
+                self.send_response(304)
+                self.send_header('ETag', f'"{key}"')
+                self.end_headers()
+                return
+        pdf = cache.get(key)
+        if pdf is None:
+            return self._send_json(404, {'error': 'not in the PDF cache; POST the content to /render'})
+        self._send_pdf(pdf, key)
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path not in ('/render', '/preview'):
+            return self._send_json(404, {'error': 'not found'})
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            if length < 0:
+                raise ValueError(f"invalid Content-Length {length}")
+            if length > MAX_BODY_BYTES:
+                return self._send_json(413, {'error': f'content exceeds {MAX_BODY_BYTES} bytes'})
+            content = validate_content(json.loads(self.rfile.read(length)))
+        except (ValueError, TypeError, AttributeError, KeyError) as e:
+            return self._send_json(400, {'error': str(e)})
+
+        if url.path == '/preview':
+            fragment = parse_qs(url.query).get('fragment', ['0'])[0] not in ('', '0')
+            try:
+                body = render_html(content, fragment=fragment).encode('utf-8')
+            except (ValueError, TypeError, AttributeError, KeyError) as e:
+                return self._send_json(400, {'error': f'{type(e).__name__}: {e}'})
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        key = self.service.key(content)
+        try:
+            pdf = self.service.render(content, key)
+        except Exception as e:
+            return self._send_json(500, {'error': f'{type(e).__name__}: {e}'})
+        if pdf is None:
+            return self._send_json(503, {'error': 'render queue full'}, {'Retry-After': '1'})
+        self._send_pdf(pdf, key)
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+
+def make_server(service, host='127.0.0.1', port=8765, socket_path=None):
+    if socket_path:
+        server = UnixHTTPServer(socket_path, RenderHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), RenderHandler)
+    server.service = service
+    return server
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve briefing renders from a warm worker pool")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--socket', help="listen on this Unix socket path instead of TCP")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--queue-depth', type=int, default=16,
+        help="requests allowed to wait for a worker before returning 503")
+    parser.add_argument('--section-cache', help="directory for pre-rendered static sections")
+    parser.add_argument('--pdf-cache', help="directory of rendered PDFs served again without re-rendering")
+    args = parser.parse_args(argv)
+
+    service = RenderService(args.workers, args.queue_depth, args.section_cache, args.pdf_cache)
+    service.warm_up()
+    server = make_server(service, args.host, args.port, args.socket)
+    where = args.socket or f"http://{args.host}:{args.port}"
+    print(f"✅ Render server ready on {where} ({args.workers} workers, queue depth {args.queue_depth})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
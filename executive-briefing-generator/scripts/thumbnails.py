@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Page Thumbnails
+Writes PNG previews of the cover and first content page of briefings or the product
+book, laying out only those pages and never writing a PDF.
+
+    python scripts/thumbnails.py                                  # the showcase briefing, pages 1-2
+    python scripts/thumbnails.py content/*.json --output-dir thumbs/ --dpi 96
+    python scripts/thumbnails.py --product-book --pages 1,2,3
+
+See briefing/thumbnail.py for how pages are painted and cached, and what an uncached
+thumbnail costs (most of a full render). Thumbnails are
+written as <name>_page<N>.png; repeat requests for unchanged content are served from
+--cache-dir without any layout.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from briefing.content import DEFAULT_CONTENT, load_content, validate_content
+
+def _pages(text):
+    try:
+        pages = tuple(int(page) for page in text.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated page numbers, got {text!r}") from None
+    if not pages or min(pages) < 1:
+        raise argparse.ArgumentTypeError("page numbers start at 1")
+    return pages
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write PNG thumbnails of the first pages of briefings")
+    parser.add_argument('content', nargs='*', help="briefing content JSON files (default: the showcase briefing)")
+    parser.add_argument('--product-book', action='store_true', help="thumbnail the product book instead")
+    parser.add_argument('--pages', type=_pages, help="comma-separated pages (default: the cover and first content page)")
+    parser.add_argument('--dpi', type=int, help="resolution (default: briefing.thumbnail.DEFAULT_DPI)")
+    parser.add_argument('--supersample', type=int, default=1,
+        help="paint at this multiple of the DPI and scale down: smoother shapes, slower (default 1)")
+    parser.add_argument('--output-dir', default='.', help="directory for the PNG files")
+    parser.add_argument('--cache-dir', help="thumbnail cache directory (default: $BRIEFING_THUMBNAIL_CACHE or a temp dir)")
+    parser.add_argument('--no-cache', action='store_true', help="always lay the pages out")
+    args = parser.parse_args(argv)
+    if args.product_book and args.content:
+        parser.error("--product-book takes no content files")
+    if args.supersample < 1:
+        parser.error("--supersample must be at least 1")
+
+    from briefing.thumbnail import CACHE_DIR, DEFAULT_DPI, DEFAULT_PAGES, thumbnails
+
+    pages, dpi = args.pages or DEFAULT_PAGES, args.dpi or DEFAULT_DPI
+    cache_dir = None if args.no_cache else args.cache_dir or CACHE_DIR
+    if args.product_book:
+        jobs = [('Product_Book', 'product_book', None)]
+    else:
+        jobs = [(os.path.splitext(os.path.basename(path))[0], 'briefing', validate_content(load_content(path)))
+                for path in args.content or [DEFAULT_CONTENT]]
+    os.makedirs(args.output_dir, exist_ok=True)
+    for name, document, content in jobs:
+        start = time.perf_counter()
+        pngs = thumbnails(document, content, pages, dpi, cache_dir, args.supersample)
+        elapsed = (time.perf_counter() - start) * 1000
+        for page, png in pngs.items():
+            path = os.path.join(args.output_dir, f"{name}_page{page}.png")
+            with open(path, 'wb') as f:
+                f.write(png)
+            print(f"✅ {path} ({len(png) / 1024:.1f} KB)")
+        skipped = [page for page in pages if page not in pngs]
+        if skipped:
+            print(f"⚠️  {name}: no page {', '.join(map(str, skipped))}")
+        print(f"   {name}: {elapsed:.0f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())